@@ -0,0 +1,5 @@
+# Version of the Tools, Part of Every Build Cache Key
+__version__ = "1.1.0"
+
+# File Name Standing for Standard Input/Output in Every Tool
+STDIO_FILE_NAME = "-"
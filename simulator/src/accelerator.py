@@ -1,37 +1,14 @@
 from dataclasses import dataclass
 from bitstring import Bits
-from .processing_element import ProcessingElement, ProcessingElementConfiguration
-from .main_buffer import MainBuffer, MainBufferConfiguration
-from .instruction import Instruction, MemoryInstruction, ProcessingElementInstruction
-
-
-@dataclass
-class AcceleratorConfiguration:
-
-    # Top Level Specific Values
-    COUNTER_BITWIDTH : int
-    PE_COUNT         : int
-
-    # Internal Buffer/PE Configurations
-    PE_CONFIG        : ProcessingElementConfiguration
-    BUFFER_CONFIG    : MainBufferConfiguration
-
-    # Function to Validate Configuration
-    def validate(self) -> None:
-
-        # Ensuring the Width of the Main Buffer Matches the
-        # Number of PEs in the Array accounting for Input Width
-        if (self.PE_COUNT != (self.BUFFER_CONFIG.MEM0_BITWIDTH/self.PE_CONFIG.INPUT_BITWIDTH)):
-            raise ValueError(f"Incorrect number of PEs ({self.PE_COUNT}) with input bitwidth {self.PE_CONFIG.INPUT_BITWIDTH} for memory output bitwidth {self.BUFFER_CONFIG.MEM0_BITWIDTH}.")
-
-        # Ensuring the Width of the Main Buffer Matches the PE input bitwidth
-        if (self.PE_CONFIG.INPUT_BITWIDTH != self.BUFFER_CONFIG.MEM1_BITWIDTH):
-            raise ValueError(f"Incorrect PE input bitwidth {self.PE_CONFIG.INPUT_BITWIDTH} for memory bitwidth {self.BUFFER_CONFIG.MEM1_BITWIDTH}.")
-
-        # Ensuring the Width of the Main Buffer Matches the PE output bitwidth
-        if (self.PE_COUNT != (self.BUFFER_CONFIG.MEM2_BITWIDTH/self.PE_CONFIG.OUTPUT_BITWIDTH)):
-            raise ValueError(f"Incorrect number of PEs ({self.PE_COUNT}) with output bitwidth {self.PE_CONFIG.OUTPUT_BITWIDTH} for memory input bitwidth {self.BUFFER_CONFIG.MEM2_BITWIDTH}.")
-AccelConfig=AcceleratorConfiguration
+from .processing_element import ProcessingElement, IntegerProcessingElement
+from .main_buffer import MainBuffer
+from .configuration import ProcessingElementConfiguration, MainBufferConfiguration, AcceleratorConfiguration, AccelConfig
+from .controller import Controller
+from .instruction import Instruction, DecodedInstruction, DecodedMemoryInstruction, DecodedProcessingElementInstruction, MemoryInstruction, ProcessingElementInstruction, MI, PEI
+from .memory_image import LANE_DTYPES, bits_to_words, words_to_lanes, lanes_to_words
+from .performance_counters import PerformanceCounters
+import dataclasses
+import numpy as np
 
 
 class Accelerator:
@@ -39,23 +16,43 @@ class Accelerator:
     def __init__(
         self,
         controller_config : AcceleratorConfiguration,
-        default_counter_value = 0
+        default_counter_value = 0,
+        main_buffer_type : type[MainBuffer] = MainBuffer,
+        processing_element_type : type[ProcessingElement | IntegerProcessingElement] = ProcessingElement,
+        fast_forward : bool = False,
+        collect_counters : bool = False
     ):
 
         # Saving the Configuration and Validating
         self._controller_config = controller_config
         self._controller_config.validate()
 
-        # Creating a Bit-Accurate Representation of the Counter
-        self._counter = Bits(uint=default_counter_value, length=self._controller_config.COUNTER_BITWIDTH)
+        # Creating the Controller, which Owns the Counter and Address Generation State
+        self._controller = Controller(self._controller_config.COUNTER_BITWIDTH, default_counter_value)
 
-        # Creating an Array of PEs
+        # Creating an Array of PEs (IntegerProcessingElement Keeps Registers as Integers)
         self._pe_array = [
-            ProcessingElement(self._controller_config.PE_CONFIG) for _ in range(self._controller_config.PE_COUNT)
+            processing_element_type(self._controller_config.PE_CONFIG) for _ in range(self._controller_config.PE_COUNT)
         ]
 
-        # Creating a Main Buffer
-        self._main_buffer = MainBuffer(self._controller_config.BUFFER_CONFIG)
+        # Creating a Main Buffer (ArrayMainBuffer Stores Words in Contiguous Byte Arrays)
+        self._main_buffer = main_buffer_type(self._controller_config.BUFFER_CONFIG)
+
+        # Integer PEs Exchange Plain Integers with the Main Buffer Ports, Never Building Bitstrings
+        self._integer_datapath = issubclass(processing_element_type, IntegerProcessingElement)
+
+        # Closed Form Execution Works on Byte Arrays, so it Needs Byte Aligned Memories and Accumulators
+        pe_config     = self._controller_config.PE_CONFIG
+        buffer_config = self._controller_config.BUFFER_CONFIG
+        self._fast_forward = fast_forward and all([
+            (buffer_config.MEM0_BITWIDTH % 8) == 0,
+            (buffer_config.MEM1_BITWIDTH % 8) == 0,
+            (pe_config.ACCUMULATION_BITWIDTH % 8) == 0,
+            (pe_config.ACCUMULATION_BITWIDTH % pe_config.INPUT_BITWIDTH) == 0
+        ])
+
+        # Creating the Hardware Style Performance Counters When Requested
+        self._counters = PerformanceCounters(self._controller_config.PE_COUNT, pe_config.INPUT_BITWIDTH) if collect_counters else None
 
     def set_memory(self, mem0 : list[Bits], mem1 : list[Bits]) -> None:
         self.set_mem0(mem0)
@@ -67,50 +64,233 @@ class Accelerator:
     def set_mem1(self, mem : list[Bits]) -> None:
         self._main_buffer.set_mem1_bits(mem)
 
+    def set_memory_words(self, mem0 : np.ndarray, mem1 : np.ndarray) -> None:
+        self._main_buffer.set_mem0_words(mem0)
+        self._main_buffer.set_mem1_words(mem1)
+
+    def load_memory_images(self, mem0_file : str, mem1_file : str) -> None:
+        self._main_buffer.load_mem0_image(mem0_file)
+        self._main_buffer.load_mem1_image(mem1_file)
+
     def get_mem2(self) -> list[Bits]:
         return self._main_buffer.read_mem2_bits()
 
-    def execute_instructions(self, instructions : list[Instruction]):
-        for inst in instructions:
+    def get_accumulations(self) -> list[Bits]:
+        return [elem.get_accumulation() for elem in self._pe_array]
+
+    def dump_mem2_image(self, file_name : str) -> None:
+        self._main_buffer.dump_mem2_image(file_name)
+
+    def get_cycle_count(self) -> int:
+        return self._controller.get_cycle_count()
+
+    def get_performance_counters(self) -> dict:
+        if self._counters is None:
+            raise ValueError("Performance counters were not enabled for this accelerator.")
+        return self._counters.to_dict(self.get_cycle_count())
+
+    def execute_instructions(self, instructions : list[Instruction | DecodedInstruction]):
+
+        # Decoding the Whole Program Once Before Executing It
+        for inst in [elem.decode() for elem in instructions]:
             self.execute_instruction(inst)
 
-    def execute_instruction(self, instruction : Instruction):
+    def execute_instruction(self, instruction : Instruction | DecodedInstruction):
+
+        # Registering the Instruction in the Controller (the Instruction Itself is Never Modified)
+        instruction = instruction.decode()
+        self._controller.load_instruction(instruction)
+        pe_inst = self._controller.get_pe_instruction()
+
+        # Updating the Performance Counters from the Whole Instruction at Once
+        if self._counters is not None:
+            self._record_counters(instruction)
+
+        # Computing Counted Instructions in Closed Form When the Result Provably Matches Iterating
+        if self._fast_forward and (instruction.COUNT > 0) and self._fast_forward_instruction(instruction):
+            self._controller.finish()
+            return
+
         # Iterating for "Counter" number of times
-        iteration_count = 0
         while True:
 
-            # Sending the Instruction to the Main Buffer
-            self._main_buffer.execute_instruction(instruction.get_mem_instruction())
+            # Running One Cycle of the Buffer and PEs
+            self._execute_iteration(self._controller.get_buf_instruction(), pe_inst)
 
-            # Sending the Main Buffer Output to the PEs
-            mem0_out = self._main_buffer.read_mem0_output()
-            mem1_out = self._main_buffer.read_mem1_output()
+            # Incrementing the Offsets for MemA and MemB, Exiting if Condition Met
+            if not self._controller.advance():
+                break
 
-            # Splitting Mem0 Output and Sending to Each PE while Running Command
-            for i, elem in enumerate(mem0_out.cut(self._controller_config.PE_CONFIG.INPUT_BITWIDTH)):
+    def _get_iteration_addresses(self, instruction : DecodedInstruction) -> tuple[np.ndarray, np.ndarray]:
 
-                # Sending Elements
-                self._pe_array[i].input_a(elem)
-                self._pe_array[i].input_b(mem1_out)
+        # Generating Every Offset the Controller Steps Through (Wrapping at the Counter Bitwidth)
+        mem_inst    = instruction.MEM_INSTRUCTION
+        steps       = np.arange(instruction.COUNT + 1, dtype=np.int64)
+        offset_mask = (1 << self._controller_config.COUNTER_BITWIDTH) - 1
+        mema_addresses = (mem_inst.MEMA_OFFSET + (steps * instruction.MEMA_INC)) & offset_mask
+        memb_addresses = (mem_inst.MEMB_OFFSET + (steps * instruction.MEMB_INC)) & offset_mask
+        return mema_addresses, memb_addresses
 
-                # Running Instruction
-                self._pe_array[i].execute_instruction(instruction.get_pe_instruction())
+    def _record_counters(self, instruction : DecodedInstruction) -> None:
+        self._counters.record_instruction(instruction)
 
-            # Collating Outputs And Writing to Mem2 Input
-            output_bits = Bits().join([
-                self._pe_array[i].get_output() for i in range(self._controller_config.PE_COUNT)
-            ])
-            self._main_buffer.write_mem2_output(output_bits)
+        # Looking at the Matrix Operand of Every MAC to Find PEs Working on Zeros (Padded Rows or Zero Values Alike)
+        pe_inst = instruction.PE_INSTRUCTION
+        if (pe_inst.OPCODE != PEI.NO_VALUE) or (pe_inst.VALUE != PEI.MAC):
+            return
+        if (pe_inst.MODE_BITWIDTH not in LANE_DTYPES) or ((self._controller_config.BUFFER_CONFIG.MEM0_BITWIDTH % 8) != 0):
+            self._counters.record_unclassified_macs(pe_inst.MODE_BITWIDTH, instruction.COUNT + 1)
+            return
+        if instruction.MEM_INSTRUCTION.OPCODE == MI.READ:
+            mema_addresses, _ = self._get_iteration_addresses(instruction)
+            matrix_words = self._main_buffer.read_mem0_words(mema_addresses)
+            repeat = 1
+        else:
+            matrix_words = bits_to_words([self._main_buffer.read_mem0_output()], self._controller_config.BUFFER_CONFIG.MEM0_BITWIDTH)
+            repeat = instruction.COUNT + 1
+        matrix_lanes = words_to_lanes(matrix_words, pe_inst.MODE_BITWIDTH).reshape(len(matrix_words), self._controller_config.PE_COUNT, -1)
+        self._counters.record_macs(pe_inst.MODE_BITWIDTH, matrix_lanes, repeat)
 
-            # Incremeting the Offsets for MemA and MemB
-            new_mema_offset = instruction.get_mem_instruction().get_mema_offset().uint + instruction.get_mema_inc().uint
-            new_memb_offset = instruction.get_mem_instruction().get_memb_offset().uint + instruction.get_memb_inc().uint
+    def _execute_iteration(self, buf_inst : DecodedMemoryInstruction | None, pe_inst : DecodedProcessingElementInstruction) -> None:
 
-            # Setting the new offsets
-            instruction.get_mem_instruction().set_mema_offset(new_mema_offset)
-            instruction.get_mem_instruction().set_memb_offset(new_memb_offset)
+        # Sending the Instruction to the Main Buffer
+        if buf_inst is not None:
+            self._main_buffer.execute_instruction(buf_inst)
+        if self._integer_datapath:
+            self._execute_integer_iteration(pe_inst)
+            return
 
-            # Exiting if Condition Met
-            if iteration_count >= instruction.get_count().uint:
-                break
-            iteration_count = iteration_count + 1
+        # Sending the Main Buffer Output to the PEs
+        mem0_out = self._main_buffer.read_mem0_output()
+        mem1_out = self._main_buffer.read_mem1_output()
+
+        # Splitting Mem0 Output and Sending to Each PE while Running Command
+        for i, elem in enumerate(mem0_out.cut(self._controller_config.PE_CONFIG.INPUT_BITWIDTH)):
+
+            # Sending Elements
+            self._pe_array[i].input_a(elem)
+            self._pe_array[i].input_b(mem1_out)
+
+            # Running Instruction
+            self._pe_array[i].execute_instruction(pe_inst)
+
+        # Collating Outputs And Writing to Mem2 Input
+        output_bits = Bits().join([
+            self._pe_array[i].get_output() for i in range(self._controller_config.PE_COUNT)
+        ])
+        self._main_buffer.write_mem2_output(output_bits)
+
+    def _execute_integer_iteration(self, pe_inst : DecodedProcessingElementInstruction) -> None:
+
+        # Slicing Each PE's Input Out of the Mem0 Port (the First PE Takes the Most Significant Bits)
+        input_bitwidth  = self._controller_config.PE_CONFIG.INPUT_BITWIDTH
+        output_bitwidth = self._controller_config.PE_CONFIG.OUTPUT_BITWIDTH
+        input_mask = (1 << input_bitwidth) - 1
+        mem0_out   = self._main_buffer.read_mem0_output_uint()
+        mem1_out   = self._main_buffer.read_mem1_output_uint()
+        shift      = input_bitwidth * len(self._pe_array)
+        for pe in self._pe_array:
+            shift -= input_bitwidth
+            pe.input_a_uint((mem0_out >> shift) & input_mask)
+            pe.input_b_uint(mem1_out)
+            pe.execute_instruction(pe_inst)
+
+        # Collating Outputs And Writing to Mem2 Input
+        output = 0
+        for pe in self._pe_array:
+            output = (output << output_bitwidth) | pe.get_output_uint()
+        self._main_buffer.write_mem2_output_uint(output)
+
+    def _fast_forward_instruction(self, instruction : DecodedInstruction) -> bool:
+        mem_inst    = instruction.MEM_INSTRUCTION
+        pe_inst     = instruction.PE_INSTRUCTION
+        iterations  = instruction.COUNT + 1
+        offset_mask = (1 << self._controller_config.COUNTER_BITWIDTH) - 1
+
+        # Choosing a Single PE Instruction with the Effect of Every Iteration
+        accumulations = None
+        match (pe_inst.OPCODE, pe_inst.VALUE):
+            case (PEI.NO_VALUE, PEI.NOP | PEI.OUT | PEI.PASS | PEI.CLR):
+                # Idempotent Operations Only Depend on the Inputs of the Final Iteration
+                final_pe_inst = pe_inst
+            case (PEI.NO_VALUE, PEI.MAC):
+                accumulations = self._fast_forward_mac(instruction)
+                if accumulations is None:
+                    return False
+                final_pe_inst = dataclasses.replace(pe_inst, VALUE=PEI.NOP)
+            case (PEI.RND, _):
+                # Flooring Shifts Compose, and Shifting Past the Accumulator Width Changes Nothing Further
+                final_pe_inst = dataclasses.replace(
+                    pe_inst, VALUE=min(pe_inst.VALUE * iterations, self._controller_config.PE_CONFIG.ACCUMULATION_BITWIDTH)
+                )
+            case _:
+                return False
+
+        # Writing the Port Held Before the Instruction on the First Iteration
+        if mem_inst.OPCODE == MI.WRITE:
+            self._main_buffer.execute_instruction(mem_inst)
+
+        # Running the Final Iteration (Reads Latch the Final Addresses)
+        if accumulations is not None:
+            for pe, accumulation in zip(self._pe_array, accumulations):
+                pe.set_accumulation(accumulation)
+        last_inst = mem_inst.with_offsets(
+            (mem_inst.MEMA_OFFSET + (instruction.COUNT * instruction.MEMA_INC)) & offset_mask,
+            (mem_inst.MEMB_OFFSET + (instruction.COUNT * instruction.MEMB_INC)) & offset_mask
+        )
+        self._execute_iteration(last_inst if mem_inst.OPCODE == MI.READ else None, final_pe_inst)
+
+        # Writing the New Port to Every Later Address (Each Address is Written Once Even if the Offset Wraps)
+        if mem_inst.OPCODE == MI.WRITE:
+            distinct_writes = min(instruction.COUNT, offset_mask + 1) if instruction.MEMA_INC != 0 else 1
+            for step in range(1, distinct_writes + 1):
+                self._main_buffer.execute_instruction(mem_inst.with_offsets(
+                    (mem_inst.MEMA_OFFSET + (step * instruction.MEMA_INC)) & offset_mask,
+                    mem_inst.MEMB_OFFSET
+                ))
+        return True
+
+    def _fast_forward_mac(self, instruction : DecodedInstruction) -> list[Bits] | None:
+        mem_inst      = instruction.MEM_INSTRUCTION
+        pe_inst       = instruction.PE_INSTRUCTION
+        iterations    = instruction.COUNT + 1
+        pe_config     = self._controller_config.PE_CONFIG
+        buffer_config = self._controller_config.BUFFER_CONFIG
+        mode_bitwidth = pe_inst.MODE_BITWIDTH
+        acc_bitwidth  = mode_bitwidth * (pe_config.ACCUMULATION_BITWIDTH // pe_config.INPUT_BITWIDTH)
+        if acc_bitwidth not in LANE_DTYPES:
+            return None
+
+        # Gathering the Inputs of Every Lane on Every Iteration (Lanes Ordered PE by PE, Most Significant First)
+        if mem_inst.OPCODE == MI.READ:
+
+            # The Broadcast Sub-Word Only Lines Up with the PE Lanes When Both Use the Same Mode
+            if mem_inst.MODE_BITWIDTH != mode_bitwidth:
+                return None
+            mema_addresses, memb_addresses = self._get_iteration_addresses(instruction)
+            input_a = words_to_lanes(self._main_buffer.read_mem0_words(mema_addresses), mode_bitwidth)
+            input_b = np.broadcast_to(self._main_buffer.read_mem1_values(memb_addresses, mode_bitwidth)[:, np.newaxis], input_a.shape)
+            repeat  = 1
+        else:
+
+            # Without a Read the Ports Hold Still, so Every Iteration Adds the Same Products
+            input_a = words_to_lanes(bits_to_words([self._main_buffer.read_mem0_output()], buffer_config.MEM0_BITWIDTH), mode_bitwidth)
+            input_b = words_to_lanes(bits_to_words([self._main_buffer.read_mem1_output()], buffer_config.MEM1_BITWIDTH), mode_bitwidth)
+            input_b = np.tile(input_b, self._controller_config.PE_COUNT)
+            repeat  = iterations
+
+        # Bounding Every Partial Sum, Falling Back if Any Could Overflow the Accumulator or an int64
+        # NOTE: The float64 bound is padded well beyond its rounding error so the check stays conservative
+        acc_words = bits_to_words([pe.get_accumulation() for pe in self._pe_array], pe_config.ACCUMULATION_BITWIDTH)
+        acc_lanes = words_to_lanes(acc_words, acc_bitwidth).reshape(-1)
+        abs_bound = np.einsum('nl,nl->l', np.abs(input_a).astype(np.float64), np.abs(input_b).astype(np.float64)) * repeat
+        acc_limit = (1 << (acc_bitwidth - 1)) - 1
+        for acc, bound in zip(acc_lanes, abs_bound):
+            padded_bound = int(np.ceil(float(bound) * (1 + 2**-30))) + 1
+            if (padded_bound >= (1 << 62)) or ((abs(int(acc)) + padded_bound) > acc_limit):
+                return None
+
+        # Accumulating Exactly in int64 and Repacking Each PE's Accumulator
+        acc_lanes = acc_lanes + (np.einsum('nl,nl->l', input_a, input_b) * repeat)
+        acc_words = lanes_to_words(acc_lanes.reshape(self._controller_config.PE_COUNT, -1), acc_bitwidth)
+        return [Bits(bytes=row.tobytes(), length=pe_config.ACCUMULATION_BITWIDTH) for row in acc_words]
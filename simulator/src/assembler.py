@@ -1,6 +1,15 @@
 from .instruction import InstructionConfiguration
 from .instruction import ProcessingElementInstruction, MemoryInstruction, Instruction
 from .instruction import PEI, MI, Mode
+from bitstring import Bits
+from typing import Iterable, Iterator
+
+class AssemblyError(ValueError):
+
+    def __init__(self, line_number : int, line : str, message : str):
+        super().__init__(f"Line {line_number}: {message} (\"{line}\")")
+        self.line_number = line_number
+        self.line        = line
 
 class Assembler:
 
@@ -17,6 +26,22 @@ class Assembler:
     def assemble_instructions(self, instructions : list[str]) -> list[Instruction]:
         return [self.convert_instruction(inst) for inst in instructions]
 
+    def iterate_instructions(self, lines : Iterable[str]) -> Iterator[Instruction]:
+
+        # Parsing One Line at a Time so Only the Current Instruction is Held in Memory
+        for line_number, line in enumerate(lines, start=1):
+            line = line.strip()
+            if len(line) == 0:
+                continue
+            try:
+                yield self.convert_instruction(line)
+            except ValueError as error:
+                raise AssemblyError(line_number, line, str(error)) from error
+
+    def iterate_instruction_bits(self, lines : Iterable[str]) -> Iterator[Bits]:
+        for inst in self.iterate_instructions(lines):
+            yield inst.get_instruction()
+
     def convert_instruction(self, inst_str : str) -> Instruction:
 
         # Creating the Instruction to Populate
@@ -36,7 +61,9 @@ class Assembler:
         inst.set_pe_instruction(pe_inst)
 
         # Parsing the Controller Instruction
-        params = params[2].strip().upper().split(' ')
+        params = params[2].strip().upper().split()
+        if len(params) != 3:
+            raise ValueError(f"Expected Count, MEMA Increment and MEMB Increment in \"{inst_str}\".")
         try:     value = int(params[0])
         except:  raise ValueError(f"Unable to Convert \"{params[0]}\" to Count.")
         inst.set_count(value-1)
@@ -0,0 +1,96 @@
+from .accelerator import Accelerator, AcceleratorConfiguration
+from .numpy_accelerator import NumpyAccelerator, check_numpy_configuration
+from .processing_element import IntegerProcessingElement
+from .main_buffer import MainBuffer, ArrayMainBuffer, check_array_main_buffer_configuration
+import os
+
+# Environment Variable Selecting the Engine When None is Given Explicitly
+BACKEND_ENVIRONMENT_VARIABLE = "IVD_SIM_BACKEND"
+
+# The Bit Accurate Model is the Oracle Every Other Engine is Checked Against
+REFERENCE_BACKEND = "reference"
+AUTO_BACKEND      = "auto"
+
+def create_reference_accelerator(
+    controller_config : AcceleratorConfiguration,
+    fast_forward : bool = False,
+    collect_counters : bool = False
+) -> Accelerator:
+    return Accelerator(
+        controller_config,
+        main_buffer_type=MainBuffer,
+        fast_forward=fast_forward,
+        collect_counters=collect_counters
+    )
+
+def create_int_accelerator(
+    controller_config : AcceleratorConfiguration,
+    fast_forward : bool = False,
+    collect_counters : bool = False
+) -> Accelerator:
+    # Integer PE Registers and Byte Array Memories (Accumulators Wrap Instead of Raising on Overflow)
+    return Accelerator(
+        controller_config,
+        main_buffer_type=ArrayMainBuffer,
+        processing_element_type=IntegerProcessingElement,
+        fast_forward=fast_forward,
+        collect_counters=collect_counters
+    )
+
+def create_numpy_accelerator(
+    controller_config : AcceleratorConfiguration,
+    fast_forward : bool = False,
+    collect_counters : bool = False
+) -> NumpyAccelerator:
+    # Every Counted Instruction is Already Computed in Closed Form, so Fast Forward Has No Effect
+    if collect_counters:
+        raise ValueError("The \"numpy\" backend does not collect performance counters.")
+    return NumpyAccelerator(controller_config)
+
+BACKENDS = {
+    "reference" : create_reference_accelerator,
+    "int"       : create_int_accelerator,
+    "numpy"     : create_numpy_accelerator
+}
+BACKEND_NAMES = tuple(BACKENDS) + (AUTO_BACKEND,)
+
+def get_default_backend(fallback : str = REFERENCE_BACKEND) -> str:
+    return os.environ.get(BACKEND_ENVIRONMENT_VARIABLE, "").strip().lower() or fallback
+
+def is_backend_supported(backend : str, controller_config : AcceleratorConfiguration, collect_counters : bool = False) -> bool:
+    # The Integer Engine Stores Byte Array Memories and the NumPy Engine Also Needs Lane Aligned Registers
+    try:
+        if backend == "int":
+            check_array_main_buffer_configuration(controller_config.BUFFER_CONFIG)
+        elif backend == "numpy":
+            check_numpy_configuration(controller_config)
+    except ValueError:
+        return False
+    return (backend in BACKENDS) and not ((backend == "numpy") and collect_counters)
+
+def select_fastest_backend(controller_config : AcceleratorConfiguration, collect_counters : bool = False) -> str:
+    # Ordered Fastest First, Falling Back to the Reference for Memories that are Not Whole Bytes
+    for backend in ["numpy", "int"]:
+        if is_backend_supported(backend, controller_config, collect_counters):
+            return backend
+    return REFERENCE_BACKEND
+
+def resolve_backend(backend : str | None, controller_config : AcceleratorConfiguration, collect_counters : bool = False) -> str:
+
+    # Falling Back to the Environment, then the Reference Model
+    if backend is None:
+        backend = get_default_backend()
+    if backend == AUTO_BACKEND:
+        return select_fastest_backend(controller_config, collect_counters)
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown simulator backend \"{backend}\", expected one of {BACKEND_NAMES}.")
+    return backend
+
+def create_accelerator(
+    controller_config : AcceleratorConfiguration,
+    backend : str | None = None,
+    fast_forward : bool = False,
+    collect_counters : bool = False
+) -> Accelerator | NumpyAccelerator:
+    backend = resolve_backend(backend, controller_config, collect_counters)
+    return BACKENDS[backend](controller_config, fast_forward=fast_forward, collect_counters=collect_counters)
@@ -0,0 +1,159 @@
+from . import __version__, STDIO_FILE_NAME
+from typing import Callable
+import functools
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+# Environment Variables Enabling the Cache and Capping its Size When No Option is Given
+CACHE_DIR_ENVIRONMENT_VARIABLE       = "IVD_CACHE_DIR"
+CACHE_MAX_BYTES_ENVIRONMENT_VARIABLE = "IVD_CACHE_MAX_BYTES"
+DEFAULT_CACHE_MAX_BYTES              = 1 << 30
+
+# Entry File Holding the Messages a Build Reports, Repeated When the Entry is Reused
+REPORT_FILE_NAME = ".report.txt"
+
+# Source Files Whose Contents Invalidate Every Entry When Edited
+SOURCE_DIRECTORY = os.path.dirname(os.path.realpath(__file__))
+
+def hash_file(file_name : str) -> str:
+    digest = hashlib.sha256()
+    with open(file_name, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+@functools.lru_cache(maxsize=None)
+def get_tool_version(tool_file : str) -> str:
+
+    # The Released Version Plus the Sources (and the Script When Given One), so Local Edits Never Return Stale Artifacts
+    digest = hashlib.sha256(__version__.encode())
+    for file_name in sorted([elem for elem in os.listdir(SOURCE_DIRECTORY) if elem.endswith(".py")]):
+        digest.update(hash_file(os.path.join(SOURCE_DIRECTORY, file_name)).encode())
+    if os.path.isfile(tool_file):
+        digest.update(hash_file(tool_file).encode())
+    return f"{__version__}+{digest.hexdigest()[:16]}"
+
+def cache_key(tool_file : str, params : dict, configs : tuple = (), input_files : list[str] = ()) -> str:
+
+    # Hashing the Tool, its Parameters, the Full Configuration and the Contents of Every Input
+    description = {
+        "tool"    : os.path.basename(tool_file),
+        "version" : get_tool_version(os.path.realpath(tool_file)),
+        "params"  : params,
+        "configs" : [repr(elem) for elem in configs],
+        "inputs"  : [hash_file(elem) for elem in input_files]
+    }
+    return hashlib.sha256(json.dumps(description, sort_keys=True).encode()).hexdigest()
+
+class BuildCache:
+
+    def __init__(
+        self,
+        directory : str,
+        max_bytes : int = DEFAULT_CACHE_MAX_BYTES
+    ):
+        self._directory = directory
+        self._max_bytes = max_bytes
+        os.makedirs(self._directory, exist_ok=True)
+
+    def get_entry_path(self, key : str) -> str:
+        return os.path.join(self._directory, key)
+
+    def fetch(self, key : str, outputs : dict[str, str]) -> bool:
+
+        # Every Artifact Must be Present, Otherwise the Entry is Treated as a Miss
+        entry = self.get_entry_path(key)
+        if not all([os.path.isfile(os.path.join(entry, name)) for name in outputs]):
+            return False
+        for name, file_name in outputs.items():
+            shutil.copyfile(os.path.join(entry, name), file_name)
+
+        # Marking the Entry as Recently Used
+        os.utime(entry)
+        return True
+
+    def load_report(self, key : str) -> str | None:
+        file_name = os.path.join(self.get_entry_path(key), REPORT_FILE_NAME)
+        if not os.path.isfile(file_name):
+            return None
+        with open(file_name) as file:
+            return file.read()
+
+    def store(self, key : str, outputs : dict[str, str], report : str | None = None) -> None:
+
+        # Copying into a Scratch Directory and Renaming so Concurrent Builds Never See Partial Entries
+        entry   = self.get_entry_path(key)
+        scratch = tempfile.mkdtemp(dir=self._directory, prefix=".tmp-")
+        for name, file_name in outputs.items():
+            shutil.copyfile(file_name, os.path.join(scratch, name))
+        if report is not None:
+            with open(os.path.join(scratch, REPORT_FILE_NAME), "w") as file:
+                file.write(report)
+        try:
+            os.rename(scratch, entry)
+        except OSError:
+            shutil.rmtree(scratch, ignore_errors=True)
+            os.utime(entry)
+        self.evict()
+
+    def get_entries(self) -> list[tuple[float, int, str]]:
+
+        # Last Use, Size and Path of Every Complete Entry
+        entries = []
+        for name in os.listdir(self._directory):
+            entry = os.path.join(self._directory, name)
+            if name.startswith(".") or not os.path.isdir(entry):
+                continue
+            size = sum([os.path.getsize(os.path.join(entry, elem)) for elem in os.listdir(entry)])
+            entries.append((os.path.getmtime(entry), size, entry))
+        return entries
+
+    def get_size(self) -> int:
+        return sum([size for _, size, _ in self.get_entries()])
+
+    def evict(self) -> None:
+
+        # Removing the Least Recently Used Entries Until the Cache Fits its Cap
+        entries = sorted(self.get_entries())
+        total   = sum([size for _, size, _ in entries])
+        for _, size, entry in entries:
+            if total <= self._max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+
+def open_build_cache(directory : str | None = None, max_bytes : int | None = None) -> BuildCache | None:
+
+    # Falling Back to the Environment, Caching Nothing When No Directory is Configured
+    if directory is None:
+        directory = os.environ.get(CACHE_DIR_ENVIRONMENT_VARIABLE, "").strip() or None
+    if directory is None:
+        return None
+    if max_bytes is None:
+        max_bytes = int(os.environ.get(CACHE_MAX_BYTES_ENVIRONMENT_VARIABLE, DEFAULT_CACHE_MAX_BYTES))
+    return BuildCache(directory, max_bytes)
+
+def run_cached(cache : BuildCache | None, key : Callable[[], str], outputs : dict[str, str], build : Callable[[], str | None]) -> bool:
+
+    # Streams to Standard Output Bypass the Cache (Builds May Return a Report, Printed Whether Built or Reused)
+    if (cache is None) or any([elem == STDIO_FILE_NAME for elem in outputs.values()]):
+        print_report(build())
+        return False
+
+    # Copying a Previous Build Out, or Building and Keeping the Artifacts
+    key = key()
+    if cache.fetch(key, outputs):
+        print_report(cache.load_report(key))
+        return True
+    report = build()
+    print_report(report)
+    cache.store(key, outputs, report)
+    return False
+
+def print_report(report : str | None) -> None:
+    if report:
+        sys.stderr.write(report)
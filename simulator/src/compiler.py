@@ -1,140 +1,173 @@
-from src.accelerator import AccelConfig
-from src.main_buffer import MainBufferConfiguration
-from src.processing_element import ProcessingElementConfiguration
-from src.instruction import InstConfig, ProcessingElementInstructionConfiguration, MemoryInstructionConfiguration, Mode
+from src.configuration import AccelConfig, Mode, generate_accelerator_and_instruction_configuration
+from src.memory_image import bits_to_words, words_to_bits, words_to_lanes, lanes_to_words
 import numpy as np
 from bitstring import Bits
 
-def generate_accelerator_and_instruction_configuration(
-    processing_element_count                 = 4,
-    processing_element_input_bitwidth        = 32,
-    processing_element_accumulation_bitwidth = 32,
-    processing_element_output_bitwidth       = 32,
-    controller_counter_bitwidth              = 10
-) -> tuple[AccelConfig, InstConfig]:
-
-    # Configuring the Accelerator
-    accel_config = AccelConfig(
-        COUNTER_BITWIDTH = controller_counter_bitwidth,
-        PE_COUNT         = processing_element_count,
-        PE_CONFIG        = ProcessingElementConfiguration(
-            INPUT_BITWIDTH        = processing_element_input_bitwidth,
-            ACCUMULATION_BITWIDTH = processing_element_accumulation_bitwidth,
-            OUTPUT_BITWIDTH       = processing_element_output_bitwidth
-        ),
-        BUFFER_CONFIG    = MainBufferConfiguration(
-            MEM0_BITWIDTH = processing_element_count * processing_element_input_bitwidth,
-            MEM0_DEPTH    = (2 ** controller_counter_bitwidth),
-            MEM1_BITWIDTH = processing_element_input_bitwidth,
-            MEM1_DEPTH    = (2 ** (controller_counter_bitwidth - int(np.ceil(np.log2(processing_element_input_bitwidth/Mode.SMALLEST_MODE)))) ),
-            MEM2_BITWIDTH = processing_element_count * processing_element_output_bitwidth,
-            MEM2_DEPTH    = (2 ** controller_counter_bitwidth)
-        )
-    )
-    
-    # Configuring the Instruction Format
-    # NOTE: These Values Come From the ISA Definition
-    inst_config = InstConfig(
-        COUNT_BITWIDTH     = controller_counter_bitwidth,
-        MEMA_INC_BITWIDTH  = 1,
-        MEMB_INC_BITWIDTH  = 1,
-        MEMORY_INST_CONFIG = MemoryInstructionConfiguration(
-            OPCODE_BITWIDTH      = 2,
-            MODE_BITWIDTH        = 2, 
-            MEMA_OFFSET_BITWIDTH = controller_counter_bitwidth,
-            MEMB_OFFSET_BITWIDTH = controller_counter_bitwidth
-        ),
-        PE_INST_CONFIG     = ProcessingElementInstructionConfiguration(
-            OPCODE_BITWIDTH      = 2,
-            MODE_BITWIDTH        = 2,
-            VALUE_BITWIDTH       = 5
-        )
+def compile_matrix_vector_multiplication(
+    matrix : np.ndarray,
+    vector : np.ndarray,
+    config : AccelConfig,
+    computation_bitwidth : int
+) -> tuple[list[Bits],list[Bits],list[str],int]:
+
+    # Compiling to Packed Words and Converting Each Entry to Bits Once
+    mem0_words, mem1_words, instruction_list, row_count = compile_matrix_vector_multiplication_words(
+        matrix, vector, config, computation_bitwidth
     )
+    mem0_configs = words_to_bits(mem0_words, config.BUFFER_CONFIG.MEM0_BITWIDTH)
+    mem1_configs = words_to_bits(mem1_words, config.BUFFER_CONFIG.MEM1_BITWIDTH)
 
-    return accel_config, inst_config
+    # Returning Configurations and Instructions
+    return mem0_configs, mem1_configs, instruction_list, row_count
 
-def compile_matrix_vector_multiplication(
+def compile_matrix_vector_multiplication_words(
     matrix : np.ndarray,
     vector : np.ndarray,
     config : AccelConfig,
     computation_bitwidth : int
-) -> tuple[list[Bits],list[Bits],list[str],int]:
-    # Creating Lists to Store the Required MEM0 and MEM1 Configurations
-    mem0_configs = []
-    mem1_configs = []
-    instruction_list = []
+) -> tuple[np.ndarray,np.ndarray,list[str],int]:
+
+    # A Single Vector is a Matrix-Matrix Multiplication with One Column
+    mem0_words, mem1_words, instruction_list, _ = compile_matrix_matrix_multiplication_words(
+        matrix, np.asarray(vector).reshape(-1, 1), config, computation_bitwidth
+    )
+    return mem0_words, mem1_words, instruction_list, matrix.shape[0]
+
+def compile_matrix_matrix_multiplication(
+    matrix : np.ndarray,
+    vectors : np.ndarray,
+    config : AccelConfig,
+    computation_bitwidth : int
+) -> tuple[list[Bits],list[Bits],list[str],list[tuple[int,int]]]:
+
+    # Compiling to Packed Words and Converting Each Entry to Bits Once
+    mem0_words, mem1_words, instruction_list, result_ranges = compile_matrix_matrix_multiplication_words(
+        matrix, vectors, config, computation_bitwidth
+    )
+    mem0_configs = words_to_bits(mem0_words, config.BUFFER_CONFIG.MEM0_BITWIDTH)
+    mem1_configs = words_to_bits(mem1_words, config.BUFFER_CONFIG.MEM1_BITWIDTH)
+
+    # Returning Configurations, Instructions and Where Each Vector's Result is Written
+    return mem0_configs, mem1_configs, instruction_list, result_ranges
+
+def compile_matrix_matrix_multiplication_words(
+    matrix : np.ndarray,
+    vectors : np.ndarray,
+    config : AccelConfig,
+    computation_bitwidth : int
+) -> tuple[np.ndarray,np.ndarray,list[str],list[tuple[int,int]]]:
+
+    # Ensuring Every Value Fits in the Computation Precision (Each Column of the Vectors is One Vector)
+    vectors = np.asarray(vectors)
+    if vectors.ndim == 1:
+        vectors = vectors.reshape(-1, 1)
+    check_value_range(matrix, computation_bitwidth, "Matrix")
+    check_value_range(vectors, computation_bitwidth, "Vector")
+    (matrix_rows, matrix_cols) = matrix.shape
+    if vectors.shape[0] != matrix_cols:
+        raise ValueError(f"Vectors have {vectors.shape[0]} rows but the matrix has {matrix_cols} columns.")
+    vector_count = vectors.shape[1]
 
     # Computing How to Split the Computation into Sub-Computations
     number_of_rows         = config.PE_COUNT * int(config.PE_CONFIG.INPUT_BITWIDTH/computation_bitwidth)
-    row_sub_comp_count     = int(np.ceil(len(matrix)/number_of_rows))
-
+    row_sub_comp_count     = int(np.ceil(matrix_rows/number_of_rows))
+    number_of_cols         = int(config.PE_CONFIG.INPUT_BITWIDTH/computation_bitwidth)
+    col_sub_comp_count     = int(np.ceil(matrix_cols/number_of_cols))
+    padded_cols            = col_sub_comp_count * number_of_cols
+
+    # Ensuring the Layout Fits Every Buffer (Larger Problems Must be Split by the Tiling Compiler)
+    check_buffer_capacity("MEM0", row_sub_comp_count * matrix_cols, config.BUFFER_CONFIG.MEM0_DEPTH)
+    check_buffer_capacity("MEM1", vector_count * col_sub_comp_count, config.BUFFER_CONFIG.MEM1_DEPTH)
+    check_buffer_capacity("MEM2", vector_count * row_sub_comp_count, config.BUFFER_CONFIG.MEM2_DEPTH)
+
+    # Padding the Rows and Laying Out One Column of Each Row Block per Entry (Row Block Major, Packed Once for Every Vector)
+    padded_matrix = np.zeros((row_sub_comp_count * number_of_rows, matrix_cols), dtype=np.int64)
+    padded_matrix[:matrix_rows] = matrix
+    mem0_lanes = padded_matrix.reshape(row_sub_comp_count, number_of_rows, matrix_cols).transpose(0, 2, 1)
+    mem0_words = lanes_to_words(mem0_lanes.reshape(-1, number_of_rows), computation_bitwidth)
+
+    # Creating Instructions (Each Row Block Stays in Place While Every Vector Streams Past it)
+    mode_str = Mode.BITWIDTH_TO_STR_DICT[computation_bitwidth]
+    instruction_list = []
     for sub_matrix_row in range(row_sub_comp_count):
-        for sub_matrix_col in range(len(matrix[0])):
-
-            # Extracting the Sub Matrix and Padding
-            sub_matrix = matrix[(sub_matrix_row * number_of_rows):((sub_matrix_row+1) * number_of_rows),sub_matrix_col]
-            (elem_count,) = sub_matrix.shape
-            if elem_count < number_of_rows:
-                zero_matrix = np.zeros(number_of_rows-elem_count, dtype=np.int64)
-                sub_matrix = np.concatenate([sub_matrix, zero_matrix], axis=0)
-
-            # Packing into a Single Memory Entry
-            mem_entry = Bits().join([
-                Bits(int=elem, length=computation_bitwidth) for elem in sub_matrix
+        for vector_index in range(vector_count):
+            instruction_list.extend([
+                f"NOP | CLR {mode_str} | 1 0 0",
+                f"READ {mode_str} {sub_matrix_row * matrix_cols} {vector_index * padded_cols} | MAC {mode_str} | {matrix_cols} 1 1",
+                f"NOP | OUT {mode_str} | 1 0 0",
+                f"WRITE {vector_index * row_sub_comp_count + sub_matrix_row} | NOP {mode_str} | 1 0 0"
             ])
-            mem0_configs = mem0_configs + [mem_entry]
-
-        # Creating Instruction
-        instruction_list = instruction_list + [f"NOP | CLR {Mode.BITWIDTH_TO_STR_DICT[computation_bitwidth]} | 1 0 0"]
-        instruction_list = instruction_list + [f"READ {Mode.BITWIDTH_TO_STR_DICT[computation_bitwidth]} {sub_matrix_row * len(matrix[0])} 0 | MAC {Mode.BITWIDTH_TO_STR_DICT[computation_bitwidth]} | {len(matrix[0])} 1 1"]
-        instruction_list = instruction_list + [f"NOP | OUT {Mode.BITWIDTH_TO_STR_DICT[computation_bitwidth]} | 1 0 0"]
-        instruction_list = instruction_list + [f"WRITE {sub_matrix_row} | NOP {Mode.BITWIDTH_TO_STR_DICT[computation_bitwidth]} | 1 0 0"]
 
-    # Organizing MEM1
-    number_of_cols         = int(config.PE_CONFIG.INPUT_BITWIDTH/computation_bitwidth)
-    col_sub_comp_count     = int(np.ceil(len(matrix[0])/number_of_cols))
-    for sub_vector_col in range(col_sub_comp_count):
-
-        # Extracting the Sub Vector and Padding
-        sub_vector = vector[(sub_vector_col * number_of_cols):((sub_vector_col+1) * number_of_cols)]
-        (row_count, _) = sub_vector.shape
-        if row_count < number_of_cols:
-            zero_matrix = np.zeros((number_of_cols-row_count,1), dtype=np.int64)
-            sub_vector = np.concatenate([sub_vector, zero_matrix], axis=0)
-        
-        # Flattening the Sub-Vector and Reversing
-        sub_vector = sub_vector.flatten()
-        sub_vector = [sub_vector[-1 * (i + 1)] for i in range(len(sub_vector))]
-
-        # Packing into a Single Memory Entry
-        mem_entry = Bits().join([
-            Bits(int=elem, length=computation_bitwidth) for elem in sub_vector
-        ])
-        mem1_configs = mem1_configs + [mem_entry]
+    # Organizing MEM1 Vector after Vector (Each Sub-Vector is Reversed so its First Element Sits in the Lowest Lane)
+    padded_vectors = np.zeros((vector_count, padded_cols), dtype=np.int64)
+    padded_vectors[:, :matrix_cols] = vectors.T
+    mem1_words = lanes_to_words(padded_vectors.reshape(-1, number_of_cols)[:, ::-1], computation_bitwidth)
 
     # Padding Memory
-    mem0_configs = mem0_configs + [Bits(int=0,length=config.BUFFER_CONFIG.MEM0_BITWIDTH) for _ in range(config.BUFFER_CONFIG.MEM0_DEPTH - len(mem0_configs))]
-    mem1_configs = mem1_configs + [Bits(int=0,length=config.BUFFER_CONFIG.MEM1_BITWIDTH) for _ in range(config.BUFFER_CONFIG.MEM1_DEPTH - len(mem1_configs))]
+    mem0_words = pad_words(mem0_words, config.BUFFER_CONFIG.MEM0_DEPTH)
+    mem1_words = pad_words(mem1_words, config.BUFFER_CONFIG.MEM1_DEPTH)
 
-    # Returning Configurations and Instructions
-    return mem0_configs, mem1_configs, instruction_list, len(matrix)
+    # Returning Configurations, Instructions and the MEM2 Region Holding Each Vector's Result
+    result_ranges = [(vector_index * row_sub_comp_count, matrix_rows) for vector_index in range(vector_count)]
+    return mem0_words, mem1_words, instruction_list, result_ranges
+
+def check_value_range(values : np.ndarray, computation_bitwidth : int, name : str) -> None:
+    min_value = -(1 << (computation_bitwidth - 1))
+    max_value = (1 << (computation_bitwidth - 1)) - 1
+    if (np.size(values) != 0) and ((np.min(values) < min_value) or (np.max(values) > max_value)):
+        raise ValueError(f"{name} values must be within [{min_value}, {max_value}] for {computation_bitwidth}-bit computation.")
+
+def check_buffer_capacity(name : str, entries : int, depth : int) -> None:
+    if entries > depth:
+        raise ValueError(f"{name} layout needs {entries} entries but the buffer holds {depth}; tile the computation to fit.")
+
+def pad_words(words : np.ndarray, depth : int) -> np.ndarray:
+    # Appending Zero Entries up to the Memory Depth
+    if len(words) >= depth:
+        return words
+    return np.concatenate([words, np.zeros((depth - len(words), words.shape[1]), dtype=np.uint8)], axis=0)
 
 def extract_results_from_memory(
-    memory : list[Bits],
+    memory : list[Bits] | np.ndarray,
     num_elems_to_extract : int,
     config : AccelConfig,
     computation_bitwidth : int
 ) -> np.ndarray:
-    
-    # Computing Necessary Parameters
-    elems_per_entry = config.PE_COUNT * (config.PE_CONFIG.OUTPUT_BITWIDTH/computation_bitwidth)
-    entries_to_read = int(np.ceil(num_elems_to_extract / elems_per_entry))
+    return extract_result_ranges(memory, [(0, num_elems_to_extract)], config, computation_bitwidth)[0]
+
+def extract_result_ranges(
+    memory : list[Bits] | np.ndarray,
+    result_ranges : list[tuple[int,int]],
+    config : AccelConfig,
+    computation_bitwidth : int
+) -> list[np.ndarray]:
 
-    # Iterating
-    output = []
-    for mem_idx in range(entries_to_read):
-        value = memory[mem_idx]
-        output = output + [elem.int for elem in value.cut(computation_bitwidth)]
+    # Computing Necessary Parameters
+    elems_per_entry = config.PE_COUNT * (config.PE_CONFIG.OUTPUT_BITWIDTH // computation_bitwidth)
+    entries_to_read = [int(np.ceil(num_elems / elems_per_entry)) for _, num_elems in result_ranges]
+    last_entry      = max([start + count for (start, _), count in zip(result_ranges, entries_to_read)], default=0)
+
+    # Packing Only the Entries Holding Results (Word Arrays are Used Directly)
+    if isinstance(memory, np.ndarray):
+        words = memory[:last_entry]
+    else:
+        words = bits_to_words(memory[:last_entry], config.BUFFER_CONFIG.MEM2_BITWIDTH)
+
+    # Reinterpreting Each Range as Sign Extended Lanes (Most Significant Lane First)
+    return [
+        words_to_lanes(words[start:(start + count)], computation_bitwidth).reshape(-1)[:num_elems]
+        for (start, num_elems), count in zip(result_ranges, entries_to_read)
+    ]
+
+def extract_matrix_results_from_memory(
+    memory : list[Bits] | np.ndarray,
+    result_ranges : list[tuple[int,int]],
+    config : AccelConfig,
+    computation_bitwidth : int
+) -> np.ndarray:
 
-    # Returning
-    return np.array(list(output[:num_elems_to_extract]))
\ No newline at end of file
+    # Placing Each Vector's Result in its Own Column, Matching matrix @ vectors
+    results = extract_result_ranges(memory, result_ranges, config, computation_bitwidth)
+    if len(results) == 0:
+        return np.zeros((0, 0), dtype=np.int64)
+    return np.stack(results, axis=1)
@@ -0,0 +1,229 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+import math
+
+# Only Dataclasses and Enumerations Live Here so Tools Can Derive a Configuration Without Loading NumPy or Bitstring
+if TYPE_CHECKING:
+    from .encoding import FieldLayout
+
+@dataclass
+class ProcessingElementConfiguration:
+    INPUT_BITWIDTH        : int
+    ACCUMULATION_BITWIDTH : int
+    OUTPUT_BITWIDTH       : int
+
+@dataclass
+class MainBufferConfiguration:
+    MEM0_BITWIDTH : int
+    MEM0_DEPTH    : int
+    MEM1_BITWIDTH : int
+    MEM1_DEPTH    : int
+    MEM2_BITWIDTH : int
+    MEM2_DEPTH    : int
+
+@dataclass
+class AcceleratorConfiguration:
+
+    # Top Level Specific Values
+    COUNTER_BITWIDTH : int
+    PE_COUNT         : int
+
+    # Internal Buffer/PE Configurations
+    PE_CONFIG        : ProcessingElementConfiguration
+    BUFFER_CONFIG    : MainBufferConfiguration
+
+    # Function to Validate Configuration
+    def validate(self) -> None:
+
+        # Ensuring the Width of the Main Buffer Matches the
+        # Number of PEs in the Array accounting for Input Width
+        if (self.PE_COUNT != (self.BUFFER_CONFIG.MEM0_BITWIDTH/self.PE_CONFIG.INPUT_BITWIDTH)):
+            raise ValueError(f"Incorrect number of PEs ({self.PE_COUNT}) with input bitwidth {self.PE_CONFIG.INPUT_BITWIDTH} for memory output bitwidth {self.BUFFER_CONFIG.MEM0_BITWIDTH}.")
+
+        # Ensuring the Width of the Main Buffer Matches the PE input bitwidth
+        if (self.PE_CONFIG.INPUT_BITWIDTH != self.BUFFER_CONFIG.MEM1_BITWIDTH):
+            raise ValueError(f"Incorrect PE input bitwidth {self.PE_CONFIG.INPUT_BITWIDTH} for memory bitwidth {self.BUFFER_CONFIG.MEM1_BITWIDTH}.")
+
+        # Ensuring the Width of the Main Buffer Matches the PE output bitwidth
+        if (self.PE_COUNT != (self.BUFFER_CONFIG.MEM2_BITWIDTH/self.PE_CONFIG.OUTPUT_BITWIDTH)):
+            raise ValueError(f"Incorrect number of PEs ({self.PE_COUNT}) with output bitwidth {self.PE_CONFIG.OUTPUT_BITWIDTH} for memory input bitwidth {self.BUFFER_CONFIG.MEM2_BITWIDTH}.")
+AccelConfig=AcceleratorConfiguration
+
+@dataclass
+class MemoryInstructionConfiguration:
+    OPCODE_BITWIDTH      : int
+    MODE_BITWIDTH        : int
+    MEMA_OFFSET_BITWIDTH : int
+    MEMB_OFFSET_BITWIDTH : int
+
+    def get_width(self):
+        return self.OPCODE_BITWIDTH + self.MODE_BITWIDTH + self.MEMA_OFFSET_BITWIDTH + self.MEMB_OFFSET_BITWIDTH
+
+    def get_layout(self) -> 'FieldLayout':
+        from .encoding import get_field_layout
+        return get_field_layout((
+            ("OPCODE",      self.OPCODE_BITWIDTH),
+            ("MODE",        self.MODE_BITWIDTH),
+            ("MEMA_OFFSET", self.MEMA_OFFSET_BITWIDTH),
+            ("MEMB_OFFSET", self.MEMB_OFFSET_BITWIDTH)
+        ))
+
+class MemoryInstructionEnum:
+    READ   = 0
+    WRITE  = 1
+    NOP    = 2
+
+    # Dictionaries for Convient Translation
+    STR_TO_OPCODE_DICT = {
+        'READ'  : [READ],
+        'WRITE' : [WRITE],
+        'NOP'   : [NOP]
+    }
+
+MI=MemoryInstructionEnum
+
+@dataclass
+class ProcessingElementInstructionConfiguration:
+    OPCODE_BITWIDTH      : int
+    MODE_BITWIDTH        : int
+    VALUE_BITWIDTH       : int
+
+    def get_width(self):
+        return self.OPCODE_BITWIDTH + self.MODE_BITWIDTH + self.VALUE_BITWIDTH
+
+    def get_layout(self) -> 'FieldLayout':
+        from .encoding import get_field_layout
+        return get_field_layout((
+            ("OPCODE", self.OPCODE_BITWIDTH),
+            ("MODE",   self.MODE_BITWIDTH),
+            ("VALUE",  self.VALUE_BITWIDTH)
+        ))
+
+class ProcessingElementInstructionEnum:
+
+    # Instructions Which Use the Value
+    # Field as the "Opcode"
+    NO_VALUE = 0
+    MAC      = 0
+    NOP      = 1
+    OUT      = 2
+    PASS     = 3
+    CLR      = 4
+
+    # Instructions Which Require the Value Field
+    RND      = 1
+
+    # Dictionaries for Convient Translation
+    STR_TO_OPCODE_DICT = {
+        'MAC'  : [NO_VALUE, MAC],
+        'NOP'  : [NO_VALUE, NOP],
+        'OUT'  : [NO_VALUE, OUT],
+        'PASS' : [NO_VALUE, PASS],
+        'CLR'  : [NO_VALUE, CLR],
+        'RND'  : [RND]
+    }
+
+PEI=ProcessingElementInstructionEnum
+
+class Mode:
+
+    # Bitwidths
+    INT8    = 8
+    INT16   = 16
+    INT32   = 32
+    SMALLEST_MODE = 8
+
+    @staticmethod
+    def opcode(value : int) -> int:
+        return math.ceil(math.log2(value/8))
+
+    @staticmethod
+    def bitwidth(value : int) -> int:
+        return ((2**value) * 8)
+
+    # Dictionaries for Convient Translation
+    STR_TO_BITWIDTH_DICT = {
+        'INT8'  : [INT8],
+        'INT16' : [INT16],
+        'INT32' : [INT32]
+    }
+    BITWIDTH_TO_STR_DICT = {
+        INT8    : 'INT8',
+        INT16   : 'INT16',
+        INT32   : 'INT32'
+    }
+
+@dataclass
+class InstructionConfiguration:
+
+    # Instruction-Level Configuration Options
+    COUNT_BITWIDTH       : int
+    MEMA_INC_BITWIDTH    : int
+    MEMB_INC_BITWIDTH    : int
+
+    # Configurations for Sub-Instructions
+    MEMORY_INST_CONFIG   : MemoryInstructionConfiguration
+    PE_INST_CONFIG       : ProcessingElementInstructionConfiguration
+
+    def get_width(self):
+        return self.COUNT_BITWIDTH + self.MEMA_INC_BITWIDTH + self.MEMB_INC_BITWIDTH
+
+    def get_layout(self) -> 'FieldLayout':
+        from .encoding import get_field_layout
+        # Sub-Instructions First (Most Significant), then the Controller Fields
+        return get_field_layout((
+            ("MEM_INSTRUCTION", self.MEMORY_INST_CONFIG.get_width()),
+            ("PE_INSTRUCTION",  self.PE_INST_CONFIG.get_width()),
+            ("COUNT",           self.COUNT_BITWIDTH),
+            ("MEMA_INC",        self.MEMA_INC_BITWIDTH),
+            ("MEMB_INC",        self.MEMB_INC_BITWIDTH)
+        ))
+InstConfig=InstructionConfiguration
+
+def generate_accelerator_and_instruction_configuration(
+    processing_element_count                 = 4,
+    processing_element_input_bitwidth        = 32,
+    processing_element_accumulation_bitwidth = 32,
+    processing_element_output_bitwidth       = 32,
+    controller_counter_bitwidth              = 10
+) -> tuple[AccelConfig, InstConfig]:
+
+    # Configuring the Accelerator
+    accel_config = AccelConfig(
+        COUNTER_BITWIDTH = controller_counter_bitwidth,
+        PE_COUNT         = processing_element_count,
+        PE_CONFIG        = ProcessingElementConfiguration(
+            INPUT_BITWIDTH        = processing_element_input_bitwidth,
+            ACCUMULATION_BITWIDTH = processing_element_accumulation_bitwidth,
+            OUTPUT_BITWIDTH       = processing_element_output_bitwidth
+        ),
+        BUFFER_CONFIG    = MainBufferConfiguration(
+            MEM0_BITWIDTH = processing_element_count * processing_element_input_bitwidth,
+            MEM0_DEPTH    = (2 ** controller_counter_bitwidth),
+            MEM1_BITWIDTH = processing_element_input_bitwidth,
+            MEM1_DEPTH    = (2 ** (controller_counter_bitwidth - math.ceil(math.log2(processing_element_input_bitwidth/Mode.SMALLEST_MODE))) ),
+            MEM2_BITWIDTH = processing_element_count * processing_element_output_bitwidth,
+            MEM2_DEPTH    = (2 ** controller_counter_bitwidth)
+        )
+    )
+    
+    # Configuring the Instruction Format
+    # NOTE: These Values Come From the ISA Definition
+    inst_config = InstConfig(
+        COUNT_BITWIDTH     = controller_counter_bitwidth,
+        MEMA_INC_BITWIDTH  = 1,
+        MEMB_INC_BITWIDTH  = 1,
+        MEMORY_INST_CONFIG = MemoryInstructionConfiguration(
+            OPCODE_BITWIDTH      = 2,
+            MODE_BITWIDTH        = 2, 
+            MEMA_OFFSET_BITWIDTH = controller_counter_bitwidth,
+            MEMB_OFFSET_BITWIDTH = controller_counter_bitwidth
+        ),
+        PE_INST_CONFIG     = ProcessingElementInstructionConfiguration(
+            OPCODE_BITWIDTH      = 2,
+            MODE_BITWIDTH        = 2,
+            VALUE_BITWIDTH       = 5
+        )
+    )
+
+    return accel_config, inst_config
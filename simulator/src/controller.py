@@ -0,0 +1,80 @@
+from .instruction import DecodedInstruction, DecodedMemoryInstruction, DecodedProcessingElementInstruction
+
+
+class ControllerState:
+    IDLE      = 0
+    EXECUTING = 1
+
+
+class Controller:
+
+    def __init__(
+        self,
+        counter_bitwidth : int,
+        default_counter_value = 0
+    ):
+
+        # Saving the Configuration
+        self._counter_bitwidth = counter_bitwidth
+        self._counter_mask     = (1 << counter_bitwidth) - 1
+
+        # Creating the Registers Mirrored from controller.sv
+        self._state         = ControllerState.IDLE
+        self._counter       = default_counter_value & self._counter_mask
+        self._inst_internal = None
+        self._buf_inst      = None
+
+        # Counting Clock Cycles as controller.sv Spends Them
+        self._cycle_count   = 0
+
+    def load_instruction(self, instruction : DecodedInstruction) -> None:
+
+        # Registering the Instruction on the IDLE to EXECUTING Transition (One IDLE Cycle)
+        self._inst_internal = instruction
+        self._buf_inst      = instruction.MEM_INSTRUCTION
+        self._counter       = 0
+        self._state         = ControllerState.EXECUTING
+        self._cycle_count  += 1
+
+    def get_buf_instruction(self) -> DecodedMemoryInstruction:
+        return self._buf_inst
+
+    def get_pe_instruction(self) -> DecodedProcessingElementInstruction:
+        return self._inst_internal.PE_INSTRUCTION
+
+    def get_counter(self) -> int:
+        return self._counter
+
+    def is_executing(self) -> bool:
+        return self._state == ControllerState.EXECUTING
+
+    def get_cycle_count(self) -> int:
+        return self._cycle_count
+
+    def advance(self) -> bool:
+
+        # Every Call is One EXECUTING Cycle
+        self._cycle_count += 1
+
+        # Switching Back to Idle Once the Count is Achieved
+        if self._counter >= self._inst_internal.COUNT:
+            self._state    = ControllerState.IDLE
+            self._buf_inst = self._inst_internal.MEM_INSTRUCTION
+            self._counter  = (self._counter + 1) & self._counter_mask
+            return False
+
+        # Stepping the Offsets of the Registered Buffer Instruction (Wrapping at the Offset Bitwidth)
+        self._buf_inst = self._buf_inst.with_offsets(
+            (self._buf_inst.MEMA_OFFSET + self._inst_internal.MEMA_INC) & self._counter_mask,
+            (self._buf_inst.MEMB_OFFSET + self._inst_internal.MEMB_INC) & self._counter_mask
+        )
+        self._counter = (self._counter + 1) & self._counter_mask
+        return True
+
+    def finish(self) -> None:
+
+        # Leaving the Registers and Cycle Count as if Every Iteration Had Been Stepped Through
+        self._cycle_count += self._inst_internal.COUNT + 1
+        self._state    = ControllerState.IDLE
+        self._buf_inst = self._inst_internal.MEM_INSTRUCTION
+        self._counter  = (self._inst_internal.COUNT + 1) & self._counter_mask
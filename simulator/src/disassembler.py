@@ -0,0 +1,129 @@
+from .instruction import InstructionConfiguration, InstructionEncoding, DecodedInstruction
+from .instruction import DecodedMemoryInstruction, DecodedProcessingElementInstruction
+from .instruction import PEI, MI, Mode
+from .assembler import Assembler
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+import numpy as np
+
+# Operations Selected by the Value Field When the PE Opcode is NO_VALUE
+PE_VALUE_TO_STR_DICT = {opcode[1] : name for name, opcode in PEI.STR_TO_OPCODE_DICT.items() if len(opcode) == 2}
+
+class DisassemblyError(ValueError):
+
+    def __init__(self, index : int, value : int, message : str):
+        super().__init__(f"Word {index}: {message} (0x{value:x})")
+        self.index = index
+        self.value = value
+
+@dataclass
+class ProgramListing:
+    LINES        : list[str]
+    PADDING      : int
+    UNREACHABLE  : list[int]
+    TERMINATED   : bool
+
+class Disassembler:
+
+    def __init__(
+        self,
+        inst_config : InstructionConfiguration,
+    ):
+
+        # Saving Configs
+        self._inst_config = inst_config
+        self._encoding    = InstructionEncoding(inst_config)
+
+    def get_encoding(self) -> InstructionEncoding:
+        return self._encoding
+
+    def disassemble_value(self, value : int) -> str:
+        return self.convert_instruction(self._encoding.decode(value))
+
+    def disassemble_values(self, values : np.ndarray) -> list[str]:
+
+        # Unpacking Every Word at Once, Reporting the Index of the First Word Without a Source Line
+        lines = []
+        for index, (value, inst) in enumerate(zip(values, self._encoding.decode_array(values))):
+            try:
+                lines.append(self.convert_instruction(inst))
+            except ValueError as error:
+                raise DisassemblyError(index, int(value), str(error)) from error
+        return lines
+
+    def iterate_disassembly(self, values : Iterable[int]) -> Iterator[str]:
+        for index, value in enumerate(values):
+            try:
+                yield self.disassemble_value(value)
+            except ValueError as error:
+                raise DisassemblyError(index, value, str(error)) from error
+
+    def list_program(self, values : np.ndarray) -> ProgramListing:
+
+        # The Simulator Stops at the First Zero Word, so Only the Words Before it are the Program
+        values = np.asarray(values)
+        zeros  = np.flatnonzero(values == 0)
+        length = int(zeros[0]) if len(zeros) else len(values)
+        return ProgramListing(
+            LINES       = self.disassemble_values(values[:length]),
+            PADDING     = int(np.count_nonzero(values[length:] == 0)),
+            UNREACHABLE = [length + int(elem) for elem in np.flatnonzero(values[length:] != 0)],
+            TERMINATED  = len(zeros) > 0
+        )
+
+    def convert_instruction(self, inst : DecodedInstruction) -> str:
+        mem_str = self.convert_mem_instruction(inst.MEM_INSTRUCTION)
+        pe_str  = self.convert_pe_instruction(inst.PE_INSTRUCTION)
+        return f"{mem_str} | {pe_str} | {inst.COUNT + 1} {inst.MEMA_INC} {inst.MEMB_INC}"
+
+    def convert_mem_instruction(self, inst : DecodedMemoryInstruction) -> str:
+
+        # Handling NOP (the Assembler Leaves Every Other Field Zero)
+        if inst.OPCODE == MI.NOP:
+            if inst.MODE or inst.MEMA_OFFSET or inst.MEMB_OFFSET:
+                raise ValueError("Memory NOP with non-zero fields has no assembly form.")
+            return "NOP"
+
+        # Handling Write (the Assembler Leaves the Mode and MEMB Offset Zero)
+        if inst.OPCODE == MI.WRITE:
+            if inst.MODE or inst.MEMB_OFFSET:
+                raise ValueError("Memory WRITE with a mode or MEMB offset has no assembly form.")
+            return f"WRITE {inst.MEMA_OFFSET}"
+
+        # Handling Read
+        if inst.OPCODE == MI.READ:
+            return f"READ {self.convert_mode(inst.MODE)} {inst.MEMA_OFFSET} {inst.MEMB_OFFSET}"
+        raise ValueError(f"Memory opcode {inst.OPCODE} not recognized.")
+
+    def convert_pe_instruction(self, inst : DecodedProcessingElementInstruction) -> str:
+
+        # Operations Encoded in the Value Field
+        mode_str = self.convert_mode(inst.MODE)
+        if inst.OPCODE == PEI.NO_VALUE:
+            operation = PE_VALUE_TO_STR_DICT.get(inst.VALUE)
+            if operation is None:
+                raise ValueError(f"PE operation {inst.VALUE} not recognized.")
+            return f"{operation} {mode_str}"
+
+        # Round Carries its Shift in the Value Field
+        if inst.OPCODE == PEI.RND:
+            return f"RND {mode_str} {inst.VALUE}"
+        raise ValueError(f"PE opcode {inst.OPCODE} not recognized.")
+
+    def convert_mode(self, mode : int) -> str:
+        mode_str = Mode.BITWIDTH_TO_STR_DICT.get(Mode.bitwidth(mode))
+        if mode_str is None:
+            raise ValueError(f"Mode {mode} not recognized.")
+        return mode_str
+
+def verify_round_trip(inst_config : InstructionConfiguration, values : np.ndarray) -> list[int]:
+
+    # Disassembling and Reassembling Every Word at Once, Returning the Indices that Change
+    disassembler = Disassembler(inst_config)
+    encoding     = disassembler.get_encoding()
+    values       = np.asarray(values).astype(encoding.get_layout().get_dtype())
+    if len(values) == 0:
+        return []
+    lines        = disassembler.disassemble_values(values)
+    reassembled  = encoding.encode_array(Assembler(inst_config).assemble_instructions(lines))
+    return [int(elem) for elem in np.flatnonzero(reassembled != values)]
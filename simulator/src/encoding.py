@@ -0,0 +1,98 @@
+from dataclasses import dataclass
+import functools
+import numpy as np
+
+# Widest Layout Packed into Fixed Width NumPy Integers (Wider Layouts Use Python Integers)
+MAX_ARRAY_BITWIDTH = 64
+
+@dataclass(frozen=True)
+class BitField:
+    NAME  : str
+    SHIFT : int
+    WIDTH : int
+    MASK  : int
+
+def check_field_value(name : str, value : int, width : int) -> int:
+    if (value < 0) or (value >> width):
+        raise ValueError(f"{name} value {value} does not fit in an unsigned {width}-bit field.")
+    return value
+
+class FieldLayout:
+
+    def __init__(
+        self,
+        fields : list[tuple[str, int]]
+    ):
+
+        # Computing Every Shift and Mask Once (the First Field is the Most Significant)
+        self.WIDTH  = sum([width for _, width in fields])
+        self.FIELDS = {}
+        shift = self.WIDTH
+        for name, width in fields:
+            shift -= width
+            self.FIELDS[name] = BitField(name, shift, width, (1 << width) - 1)
+        self._fields = tuple(self.FIELDS.values())
+
+    def get_dtype(self) -> type:
+        return np.uint64 if self.WIDTH <= MAX_ARRAY_BITWIDTH else object
+
+    def pack(self, values : tuple[int, ...] | list[int]) -> int:
+        result = 0
+        for field, value in zip(self._fields, values):
+            if (value < 0) or (value > field.MASK):
+                check_field_value(field.NAME, value, field.WIDTH)
+            result |= value << field.SHIFT
+        return result
+
+    def unpack(self, value : int) -> tuple[int, ...]:
+        return tuple((value >> field.SHIFT) & field.MASK for field in self._fields)
+
+    def pack_array(self, columns : dict[str, np.ndarray]) -> np.ndarray:
+
+        # Range Checking Whole Columns Before Shifting them into Place
+        dtype  = self.get_dtype()
+        length = len(next(iter(columns.values()))) if len(columns) else 0
+        result = np.zeros(length, dtype=dtype)
+        for field in self._fields:
+            column = np.asarray(columns.get(field.NAME, np.zeros(length, dtype=np.int64)))
+            if len(column) and ((column.min() < 0) or (column.max() > field.MASK)):
+                raise ValueError(f"{field.NAME} values do not all fit in an unsigned {field.WIDTH}-bit field.")
+            if dtype is np.uint64:
+                result |= column.astype(np.uint64) << np.uint64(field.SHIFT)
+            else:
+                result |= column.astype(object) << field.SHIFT
+        return result
+
+    def unpack_array(self, values : np.ndarray) -> dict[str, np.ndarray]:
+        dtype  = self.get_dtype()
+        values = np.asarray(values).astype(dtype)
+        if dtype is np.uint64:
+            return {field.NAME : ((values >> np.uint64(field.SHIFT)) & np.uint64(field.MASK)).astype(np.int64) for field in self._fields}
+        return {field.NAME : ((values >> field.SHIFT) & field.MASK).astype(np.int64) for field in self._fields}
+
+@functools.lru_cache(maxsize=None)
+def get_field_layout(fields : tuple[tuple[str, int], ...]) -> FieldLayout:
+    # Sharing One Layout Between Every Instruction Built from the Same Configuration
+    return FieldLayout(list(fields))
+
+def words_to_values(words : np.ndarray) -> np.ndarray:
+
+    # Reading Each Row of Big-Endian Bytes as One Unsigned Integer
+    words = np.ascontiguousarray(words, dtype=np.uint8)
+    word_bytes = words.shape[1]
+    if word_bytes * 8 <= MAX_ARRAY_BITWIDTH:
+        padded = np.zeros((len(words), MAX_ARRAY_BITWIDTH // 8), dtype=np.uint8)
+        padded[:, (MAX_ARRAY_BITWIDTH // 8) - word_bytes:] = words
+        return padded.view('>u8').reshape(len(words)).astype(np.uint64)
+    return np.array([int.from_bytes(elem.tobytes(), 'big') for elem in words], dtype=object)
+
+def values_to_words(values : np.ndarray, bitwidth : int) -> np.ndarray:
+
+    # Writing Each Unsigned Integer as a Row of Big-Endian Bytes (Right Aligned When Not Whole Bytes)
+    word_bytes = (bitwidth + 7) // 8
+    values = np.asarray(values)
+    if (word_bytes * 8 <= MAX_ARRAY_BITWIDTH) and (values.dtype != object):
+        data = values.astype('>u8').view(np.uint8).reshape(len(values), MAX_ARRAY_BITWIDTH // 8)
+        return np.ascontiguousarray(data[:, (MAX_ARRAY_BITWIDTH // 8) - word_bytes:])
+    data = b"".join([int(elem).to_bytes(word_bytes, 'big') for elem in values])
+    return np.frombuffer(data, dtype=np.uint8).reshape(len(values), word_bytes).copy()
@@ -0,0 +1,296 @@
+from .accelerator import AcceleratorConfiguration
+from .assembler import Assembler
+from .backends import BACKENDS, REFERENCE_BACKEND, create_accelerator, is_backend_supported
+from .instruction import InstructionConfiguration, Mode
+from .memory_image import lanes_to_words, words_to_bits, save_bit_list
+from bitstring import Bits
+from dataclasses import dataclass
+import numpy as np
+import os
+
+# Relative Weights of Each Operation in Generated Programs
+MEMORY_OP_WEIGHTS = {
+    "READ"  : 5,
+    "WRITE" : 2,
+    "NOP"   : 3
+}
+PE_OP_WEIGHTS = {
+    "MAC"  : 6,
+    "NOP"  : 2,
+    "OUT"  : 3,
+    "PASS" : 2,
+    "CLR"  : 2,
+    "RND"  : 2
+}
+
+# File Names the Equivalence Testing Flow Expects for a Program, its Memories and the Simulated MEM2
+CASE_FILE_NAMES = {
+    "ASM"  : "mat_mul.asm",
+    "MEM0" : "mem0.bits",
+    "MEM1" : "mem1.bits",
+    "MEM2" : "out.bits"
+}
+
+@dataclass(frozen=True)
+class Engine:
+    BACKEND      : str
+    FAST_FORWARD : bool
+
+    def get_name(self) -> str:
+        return f"{self.BACKEND}{'+fast_forward' if self.FAST_FORWARD else ''}"
+
+@dataclass
+class SimulationState:
+    MEM2          : list[Bits]
+    ACCUMULATIONS : list[Bits]
+    CYCLES        : int
+
+@dataclass
+class FuzzCase:
+    PROGRAM : list[str]
+    MEM0    : list[Bits]
+    MEM1    : list[Bits]
+
+def get_engines(controller_config : AcceleratorConfiguration, backends : list[str] = None) -> list[Engine]:
+
+    # Running Every Supported Backend Both Cycle by Cycle and Fast Forwarded (the Reference First)
+    backends = list(BACKENDS) if backends is None else backends
+    engines = []
+    for backend in sorted(backends, key=lambda elem: elem != REFERENCE_BACKEND):
+        if not is_backend_supported(backend, controller_config):
+            continue
+        engines.append(Engine(backend, False))
+        if backend != "numpy":
+            engines.append(Engine(backend, True))
+    return engines
+
+def generate_random_memories(
+    rng : np.random.Generator,
+    controller_config : AcceleratorConfiguration,
+    max_value : int = 4,
+    zero_probability : float = 0.5
+) -> tuple[list[Bits], list[Bits]]:
+
+    # Filling Every Byte with a Small Signed Value, Many of Them Zero (Like Padded Tiles)
+    buffer_config = controller_config.BUFFER_CONFIG
+    memories = []
+    for depth, bitwidth in [
+        (buffer_config.MEM0_DEPTH, buffer_config.MEM0_BITWIDTH),
+        (buffer_config.MEM1_DEPTH, buffer_config.MEM1_BITWIDTH)
+    ]:
+        lanes = rng.integers(-max_value, max_value + 1, size=(depth, bitwidth // Mode.SMALLEST_MODE))
+        lanes[rng.random(lanes.shape) < zero_probability] = 0
+        memories.append(words_to_bits(lanes_to_words(lanes, Mode.SMALLEST_MODE), bitwidth))
+    return memories[0], memories[1]
+
+def generate_random_instruction(
+    rng : np.random.Generator,
+    controller_config : AcceleratorConfiguration,
+    inst_config : InstructionConfiguration,
+    max_count : int
+) -> str:
+
+    # Picking the Operations, Modes (No Wider than a PE Input) and Iteration Shape
+    buffer_config = controller_config.BUFFER_CONFIG
+    mem_op   = rng.choice(list(MEMORY_OP_WEIGHTS), p=get_probabilities(MEMORY_OP_WEIGHTS))
+    pe_op    = rng.choice(list(PE_OP_WEIGHTS), p=get_probabilities(PE_OP_WEIGHTS))
+    modes    = [name for name, bitwidth in Mode.STR_TO_BITWIDTH_DICT.items() if bitwidth[0] <= controller_config.PE_CONFIG.INPUT_BITWIDTH]
+    mem_mode = rng.choice(modes)
+    pe_mode  = mem_mode if rng.random() < 0.8 else rng.choice(modes)
+    count    = int(rng.integers(1, min(max_count, 2 ** inst_config.COUNT_BITWIDTH) + 1))
+    mema_inc = int(rng.integers(0, 2 ** inst_config.MEMA_INC_BITWIDTH))
+    memb_inc = int(rng.integers(0, 2 ** inst_config.MEMB_INC_BITWIDTH))
+
+    # Choosing Offsets so Every Iteration Stays Inside its Memory
+    address_limit = 2 ** controller_config.COUNTER_BITWIDTH
+    match mem_op:
+        case "READ":
+            mem1_lanes = buffer_config.MEM1_BITWIDTH // Mode.STR_TO_BITWIDTH_DICT[mem_mode][0]
+            mema_limit = min(buffer_config.MEM0_DEPTH, address_limit)
+            memb_limit = min(buffer_config.MEM1_DEPTH * mem1_lanes, address_limit)
+            count = min(count, get_iteration_limit(mema_limit, mema_inc), get_iteration_limit(memb_limit, memb_inc))
+            mema_offset = int(rng.integers(0, mema_limit - ((count - 1) * mema_inc)))
+            memb_offset = int(rng.integers(0, memb_limit - ((count - 1) * memb_inc)))
+            mem_str = f"READ {mem_mode} {mema_offset} {memb_offset}"
+        case "WRITE":
+            mema_limit = min(buffer_config.MEM2_DEPTH, address_limit)
+            count = min(count, get_iteration_limit(mema_limit, mema_inc))
+            mem_str = f"WRITE {int(rng.integers(0, mema_limit - ((count - 1) * mema_inc)))}"
+        case _:
+            mem_str = "NOP"
+
+    # RND Takes a Shift Amount Spanning the Whole Value Field
+    pe_str = f"{pe_op} {pe_mode}"
+    if pe_op == "RND":
+        pe_str += f" {int(rng.integers(0, 2 ** inst_config.PE_INST_CONFIG.VALUE_BITWIDTH))}"
+    return f"{mem_str} | {pe_str} | {count} {mema_inc} {memb_inc}"
+
+def generate_random_program(
+    rng : np.random.Generator,
+    controller_config : AcceleratorConfiguration,
+    inst_config : InstructionConfiguration,
+    length : int,
+    max_count : int = 16
+) -> list[str]:
+    return [generate_random_instruction(rng, controller_config, inst_config, max_count) for _ in range(length)]
+
+def get_probabilities(weights : dict) -> list[float]:
+    total = sum(weights.values())
+    return [elem / total for elem in weights.values()]
+
+def get_iteration_limit(limit : int, increment : int) -> int:
+    return limit if increment == 0 else ((limit - 1) // increment) + 1
+
+def run_case(
+    case : FuzzCase,
+    engine : Engine,
+    controller_config : AcceleratorConfiguration,
+    inst_config : InstructionConfiguration
+) -> SimulationState:
+    accel = create_accelerator(controller_config, engine.BACKEND, engine.FAST_FORWARD)
+    accel.set_memory(case.MEM0, case.MEM1)
+    accel.execute_instructions(Assembler(inst_config).assemble_instructions(case.PROGRAM))
+    return SimulationState(
+        MEM2          = accel.get_mem2(),
+        ACCUMULATIONS = accel.get_accumulations(),
+        CYCLES        = accel.get_cycle_count()
+    )
+
+def find_divergence(
+    case : FuzzCase,
+    engines : list[Engine],
+    controller_config : AcceleratorConfiguration,
+    inst_config : InstructionConfiguration
+) -> str | None:
+
+    # Running Every Engine, the Reference Raises on Accumulator Overflow where the Hardware Wraps, so it Abstains
+    expected, expected_name = None, None
+    for engine in engines:
+        try:
+            state = run_case(case, engine, controller_config, inst_config)
+        except ValueError as error:
+            if engine.BACKEND == REFERENCE_BACKEND:
+                continue
+            return f"{engine.get_name()} raised {type(error).__name__}: {error}"
+        except Exception as error:
+            return f"{engine.get_name()} raised {type(error).__name__}: {error}"
+
+        # Comparing Against the First Engine that Produced a State
+        if expected is None:
+            expected, expected_name = state, engine.get_name()
+            continue
+        for field, name in [("MEM2", "MEM2 entry"), ("ACCUMULATIONS", "accumulator of PE")]:
+            for i, (elem, gold) in enumerate(zip(getattr(state, field), getattr(expected, field))):
+                if elem != gold:
+                    return f"{engine.get_name()} {name} {i} is {elem.bin}, {expected_name} has {gold.bin}."
+        if state.CYCLES != expected.CYCLES:
+            return f"{engine.get_name()} took {state.CYCLES} cycles, {expected_name} took {expected.CYCLES}."
+    return None
+
+def minimize_program(program : list[str], is_failing) -> list[str]:
+
+    # Delta Debugging: Dropping Ever Smaller Chunks of Instructions While the Failure Persists
+    granularity = 2
+    while len(program) >= 2:
+        chunk_size = -(-len(program) // granularity)
+        for start in range(0, len(program), chunk_size):
+            complement = program[:start] + program[(start + chunk_size):]
+            if is_failing(complement):
+                program = complement
+                granularity = max(granularity - 1, 2)
+                break
+        else:
+            if granularity >= len(program):
+                break
+            granularity = min(granularity * 2, len(program))
+    return program
+
+def minimize_counts(program : list[str], is_failing) -> list[str]:
+
+    # Shrinking the Iteration Count of Each Instruction Towards One While the Failure Persists
+    program = list(program)
+    for i, line in enumerate(program):
+        prefix, controls = line.rsplit("|", 1)
+        count, mema_inc, memb_inc = controls.split()
+        count = int(count)
+        while count > 1:
+            for candidate in [1, count // 2, count - 1]:
+                trial = program[:i] + [f"{prefix}| {candidate} {mema_inc} {memb_inc}"] + program[(i + 1):]
+                if (candidate < count) and is_failing(trial):
+                    program, count = trial, candidate
+                    break
+            else:
+                break
+    return program
+
+def minimize_memory(memory : list[Bits], is_failing) -> list[Bits]:
+
+    # Zeroing Ever Smaller Blocks of Words While the Failure Persists
+    zero_entry = Bits(uint=0, length=len(memory[0])) if len(memory) else None
+    block_size = len(memory)
+    while block_size >= 1:
+        for start in range(0, len(memory), block_size):
+            block = memory[start:(start + block_size)]
+            if all(elem == zero_entry for elem in block):
+                continue
+            trial = memory[:start] + [zero_entry] * len(block) + memory[(start + block_size):]
+            if is_failing(trial):
+                memory = trial
+        block_size //= 2
+    return memory
+
+def minimize_case(
+    case : FuzzCase,
+    engines : list[Engine],
+    controller_config : AcceleratorConfiguration,
+    inst_config : InstructionConfiguration
+) -> FuzzCase:
+
+    # Any Divergence Counts, so the Minimal Case May Expose a Simpler Bug than the Original
+    def diverges(trial : FuzzCase) -> bool:
+        return find_divergence(trial, engines, controller_config, inst_config) is not None
+
+    program = minimize_program(case.PROGRAM, lambda elem: diverges(FuzzCase(elem, case.MEM0, case.MEM1)))
+    program = minimize_counts(program, lambda elem: diverges(FuzzCase(elem, case.MEM0, case.MEM1)))
+    mem0 = minimize_memory(case.MEM0, lambda elem: diverges(FuzzCase(program, elem, case.MEM1)))
+    mem1 = minimize_memory(case.MEM1, lambda elem: diverges(FuzzCase(program, mem0, elem)))
+    return FuzzCase(program, mem0, mem1)
+
+def generate_fuzz_case(
+    rng : np.random.Generator,
+    controller_config : AcceleratorConfiguration,
+    inst_config : InstructionConfiguration,
+    length : int,
+    max_count : int = 16
+) -> FuzzCase:
+    mem0, mem1 = generate_random_memories(rng, controller_config)
+    program = generate_random_program(rng, controller_config, inst_config, length, max_count)
+    return FuzzCase(program, mem0, mem1)
+
+def save_fuzz_case(
+    directory : str,
+    case : FuzzCase,
+    divergence : str,
+    engines : list[Engine],
+    controller_config : AcceleratorConfiguration,
+    inst_config : InstructionConfiguration
+) -> None:
+
+    # Writing the Program and Memories so the RTL Testbench Can Run the Case Too
+    os.makedirs(directory, exist_ok=True)
+    buffer_config = controller_config.BUFFER_CONFIG
+    with open(os.path.join(directory, CASE_FILE_NAMES["ASM"]), "w") as file:
+        file.write("".join([f"{elem}\n" for elem in case.PROGRAM]))
+    save_bit_list(os.path.join(directory, CASE_FILE_NAMES["MEM0"]), case.MEM0, buffer_config.MEM0_BITWIDTH)
+    save_bit_list(os.path.join(directory, CASE_FILE_NAMES["MEM1"]), case.MEM1, buffer_config.MEM1_BITWIDTH)
+    with open(os.path.join(directory, "divergence.txt"), "w") as file:
+        file.write(f"{divergence}\n")
+
+    # Recording MEM2 from the First Engine that Completes, to Diff Against the RTL Dump
+    for engine in engines:
+        try:
+            state = run_case(case, engine, controller_config, inst_config)
+        except Exception:
+            continue
+        save_bit_list(os.path.join(directory, CASE_FILE_NAMES["MEM2"]), state.MEM2, buffer_config.MEM2_BITWIDTH)
+        return
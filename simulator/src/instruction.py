@@ -1,30 +1,23 @@
 from dataclasses import dataclass
 from bitstring import Bits
+from .configuration import MemoryInstructionConfiguration, ProcessingElementInstructionConfiguration, InstructionConfiguration, InstConfig
+from .configuration import MemoryInstructionEnum, ProcessingElementInstructionEnum, MI, PEI, Mode
+from .encoding import FieldLayout, check_field_value, get_field_layout, words_to_values
 import numpy as np
 
-@dataclass
-class MemoryInstructionConfiguration:
-    OPCODE_BITWIDTH      : int
-    MODE_BITWIDTH        : int
-    MEMA_OFFSET_BITWIDTH : int
-    MEMB_OFFSET_BITWIDTH : int
+@dataclass(frozen=True, slots=True)
+class DecodedMemoryInstruction:
+    OPCODE        : int
+    MODE          : int
+    MODE_BITWIDTH : int
+    MEMA_OFFSET   : int
+    MEMB_OFFSET   : int
 
-    def get_width(self):
-        return self.OPCODE_BITWIDTH + self.MODE_BITWIDTH + self.MEMA_OFFSET_BITWIDTH + self.MEMB_OFFSET_BITWIDTH
+    def decode(self) -> 'DecodedMemoryInstruction':
+        return self
 
-class MemoryInstructionEnum:
-    READ   = 0
-    WRITE  = 1
-    NOP    = 2
-
-    # Dictionaries for Convient Translation
-    STR_TO_OPCODE_DICT = {
-        'READ'  : [READ],
-        'WRITE' : [WRITE],
-        'NOP'   : [NOP]
-    }
-
-MI=MemoryInstructionEnum
+    def with_offsets(self, mema_offset : int, memb_offset : int) -> 'DecodedMemoryInstruction':
+        return DecodedMemoryInstruction(self.OPCODE, self.MODE, self.MODE_BITWIDTH, mema_offset, memb_offset)
 
 class MemoryInstruction:
 
@@ -35,131 +28,70 @@ class MemoryInstruction:
         # Ensuring the Memory Configuration is Valid
         self._memory_config = memory_config
 
-        # Generating the Bitstring Representation
-        self._instruction_value = Bits(uint=0, length=self._memory_config.get_width())
-
-        # Computing the Indicies of the Pertinent Values within the Instruction
-        self._opcode_start = 0
-        self._mode_start        = self._opcode_start      + self._memory_config.OPCODE_BITWIDTH
-        self._mema_offset_start = self._mode_start        + self._memory_config.MODE_BITWIDTH
-        self._memb_offset_start = self._mema_offset_start + self._memory_config.MEMA_OFFSET_BITWIDTH
+        # Holding Each Field as an Integer, Packed with the Layout Derived from the Configuration
+        self._layout      = self._memory_config.get_layout()
+        self._opcode      = 0
+        self._mode        = 0
+        self._mema_offset = 0
+        self._memb_offset = 0
 
     def get_width(self) -> int:
         return self._memory_config.get_width()
 
     def set_opcode(self, value : int) -> None:
-        self._instruction_value = Bits().join([
-            Bits(uint=value,length=self._memory_config.OPCODE_BITWIDTH),
-            self.get_mode(),
-            self.get_mema_offset(),
-            self.get_memb_offset()
-        ])
+        self._opcode = check_field_value("Opcode", value, self._memory_config.OPCODE_BITWIDTH)
 
     def get_opcode(self) -> Bits:
-        return self._instruction_value[self._opcode_start:(self._opcode_start + self._memory_config.OPCODE_BITWIDTH)]
+        return Bits(uint=self._opcode, length=self._memory_config.OPCODE_BITWIDTH)
 
     def set_mode(self, value : int) -> None:
-        self._instruction_value = Bits().join([
-            self.get_opcode(),
-            Bits(uint=value,length=self._memory_config.MODE_BITWIDTH),
-            self.get_mema_offset(),
-            self.get_memb_offset()
-        ])
+        self._mode = check_field_value("Mode", value, self._memory_config.MODE_BITWIDTH)
 
     def get_mode(self) -> Bits:
-        return self._instruction_value[self._mode_start:(self._mode_start + self._memory_config.MODE_BITWIDTH)]
+        return Bits(uint=self._mode, length=self._memory_config.MODE_BITWIDTH)
 
     def set_mema_offset(self, value : int) -> None:
-        self._instruction_value = Bits().join([
-            self.get_opcode(),
-            self.get_mode(),
-            Bits(uint=value,length=self._memory_config.MEMA_OFFSET_BITWIDTH),
-            self.get_memb_offset()
-        ])
+        self._mema_offset = check_field_value("MEMA Offset", value, self._memory_config.MEMA_OFFSET_BITWIDTH)
 
     def get_mema_offset(self) -> Bits:
-        return self._instruction_value[self._mema_offset_start:(self._mema_offset_start + self._memory_config.MEMA_OFFSET_BITWIDTH)]
+        return Bits(uint=self._mema_offset, length=self._memory_config.MEMA_OFFSET_BITWIDTH)
 
     def set_memb_offset(self, value : int) -> None:
-        self._instruction_value = Bits().join([
-            self.get_opcode(),
-            self.get_mode(),
-            self.get_mema_offset(),
-            Bits(uint=value,length=self._memory_config.MEMB_OFFSET_BITWIDTH),
-        ])
+        self._memb_offset = check_field_value("MEMB Offset", value, self._memory_config.MEMB_OFFSET_BITWIDTH)
 
     def get_memb_offset(self) -> Bits:
-        return self._instruction_value[self._memb_offset_start:(self._memb_offset_start + self._memory_config.MEMB_OFFSET_BITWIDTH)]
+        return Bits(uint=self._memb_offset, length=self._memory_config.MEMB_OFFSET_BITWIDTH)
+
+    def decode(self) -> DecodedMemoryInstruction:
+        return DecodedMemoryInstruction(
+            OPCODE        = self._opcode,
+            MODE          = self._mode,
+            MODE_BITWIDTH = Mode.bitwidth(self._mode),
+            MEMA_OFFSET   = self._mema_offset,
+            MEMB_OFFSET   = self._memb_offset
+        )
+
+    def get_instruction_value(self) -> int:
+        return self._layout.pack((self._opcode, self._mode, self._mema_offset, self._memb_offset))
+
+    def set_instruction_value(self, value : int) -> None:
+        self._opcode, self._mode, self._mema_offset, self._memb_offset = self._layout.unpack(value)
 
     def get_instruction(self) -> Bits:
-        return self._instruction_value
+        return Bits(uint=self.get_instruction_value(), length=self._layout.WIDTH)
 
     def set_instruction(self, value : Bits) -> None:
-        self._instruction_value = value
-
-@dataclass
-class ProcessingElementInstructionConfiguration:
-    OPCODE_BITWIDTH      : int
-    MODE_BITWIDTH        : int
-    VALUE_BITWIDTH       : int
-
-    def get_width(self):
-        return self.OPCODE_BITWIDTH + self.MODE_BITWIDTH + self.VALUE_BITWIDTH
-
-class ProcessingElementInstructionEnum:
-
-    # Instructions Which Use the Value
-    # Field as the "Opcode"
-    NO_VALUE = 0
-    MAC      = 0
-    NOP      = 1
-    OUT      = 2
-    PASS     = 3
-    CLR      = 4
-
-    # Instructions Which Require the Value Field
-    RND      = 1
-
-    # Dictionaries for Convient Translation
-    STR_TO_OPCODE_DICT = {
-        'MAC'  : [NO_VALUE, MAC],
-        'NOP'  : [NO_VALUE, NOP],
-        'OUT'  : [NO_VALUE, OUT],
-        'PASS' : [NO_VALUE, PASS],
-        'CLR'  : [NO_VALUE, CLR],
-        'RND'  : [RND]
-    }
-
-PEI=ProcessingElementInstructionEnum
-
-class Mode:
-
-    # Bitwidths
-    INT8    = 8
-    INT16   = 16
-    INT32   = 32
-    SMALLEST_MODE = 8
-
-    @staticmethod
-    def opcode(value : int) -> int:
-        return int(np.ceil(np.log2(value/8)))
-
-    @staticmethod
-    def bitwidth(value : int) -> int:
-        return ((2**value) * 8)
-
-    # Dictionaries for Convient Translation
-    STR_TO_BITWIDTH_DICT = {
-        'INT8'  : [INT8],
-        'INT16' : [INT16],
-        'INT32' : [INT32]
-    }
-    BITWIDTH_TO_STR_DICT = {
-        INT8    : 'INT8',
-        INT16   : 'INT16',
-        INT32   : 'INT32'
-    }
+        self.set_instruction_value(value.uint)
+
+@dataclass(frozen=True, slots=True)
+class DecodedProcessingElementInstruction:
+    OPCODE        : int
+    MODE          : int
+    MODE_BITWIDTH : int
+    VALUE         : int
 
+    def decode(self) -> 'DecodedProcessingElementInstruction':
+        return self
 
 class ProcessingElementInstruction:
 
@@ -170,71 +102,66 @@ class ProcessingElementInstruction:
         # Saving the Memory Configuration
         self._memory_config = memory_config
 
-        # Generating the Bitstring Representation
-        self._instruction_value = Bits(uint=0, length=self._memory_config.get_width())
-
-        # Computing the Indicies of the Pertinent Values within the Instruction
-        self._opcode_start = 0
-        self._mode_start   = self._opcode_start + self._memory_config.OPCODE_BITWIDTH
-        self._value_start  = self._mode_start   + self._memory_config.MODE_BITWIDTH
+        # Holding Each Field as an Integer, Packed with the Layout Derived from the Configuration
+        self._layout = self._memory_config.get_layout()
+        self._opcode = 0
+        self._mode   = 0
+        self._value  = 0
 
     def get_width(self) -> int:
         return self._memory_config.get_width()
 
     def set_opcode(self, value : int) -> None:
-        self._instruction_value = Bits().join([
-            Bits(uint=value,length=self._memory_config.OPCODE_BITWIDTH),
-            self.get_mode(),
-            self.get_value()
-        ])
+        self._opcode = check_field_value("Opcode", value, self._memory_config.OPCODE_BITWIDTH)
 
     def get_opcode(self) -> Bits:
-        return self._instruction_value[self._opcode_start:(self._opcode_start + self._memory_config.OPCODE_BITWIDTH)]
+        return Bits(uint=self._opcode, length=self._memory_config.OPCODE_BITWIDTH)
 
     def set_mode(self, value : int) -> None:
-        self._instruction_value = Bits().join([
-            self.get_opcode(),
-            Bits(uint=value,length=self._memory_config.MODE_BITWIDTH),
-            self.get_value()
-        ])
+        self._mode = check_field_value("Mode", value, self._memory_config.MODE_BITWIDTH)
 
     def get_mode(self) -> Bits:
-        return self._instruction_value[self._mode_start:(self._mode_start + self._memory_config.MODE_BITWIDTH)]
+        return Bits(uint=self._mode, length=self._memory_config.MODE_BITWIDTH)
 
     def get_mode_bitwidth(self) -> int:
-        return Mode.bitwidth(int(self.get_mode().uint))
+        return Mode.bitwidth(self._mode)
 
     def set_value(self, value : int) -> None:
-        self._instruction_value = Bits().join([
-            self.get_opcode(),
-            self.get_mode(),
-            Bits(uint=value,length=self._memory_config.VALUE_BITWIDTH)
-        ])
+        self._value = check_field_value("Value", value, self._memory_config.VALUE_BITWIDTH)
 
     def get_value(self) -> Bits:
-        return self._instruction_value[self._value_start:(self._value_start + self._memory_config.VALUE_BITWIDTH)]
+        return Bits(uint=self._value, length=self._memory_config.VALUE_BITWIDTH)
 
-    def get_instruction(self) -> Bits:
-        return self._instruction_value
+    def decode(self) -> DecodedProcessingElementInstruction:
+        return DecodedProcessingElementInstruction(
+            OPCODE        = self._opcode,
+            MODE          = self._mode,
+            MODE_BITWIDTH = Mode.bitwidth(self._mode),
+            VALUE         = self._value
+        )
 
-    def set_instruction(self, value : Bits) -> None:
-        self._instruction_value = value
+    def get_instruction_value(self) -> int:
+        return self._layout.pack((self._opcode, self._mode, self._value))
 
-@dataclass
-class InstructionConfiguration:
+    def set_instruction_value(self, value : int) -> None:
+        self._opcode, self._mode, self._value = self._layout.unpack(value)
 
-    # Instruction-Level Configuration Options
-    COUNT_BITWIDTH       : int
-    MEMA_INC_BITWIDTH    : int
-    MEMB_INC_BITWIDTH    : int
+    def get_instruction(self) -> Bits:
+        return Bits(uint=self.get_instruction_value(), length=self._layout.WIDTH)
+
+    def set_instruction(self, value : Bits) -> None:
+        self.set_instruction_value(value.uint)
 
-    # Configurations for Sub-Instructions
-    MEMORY_INST_CONFIG   : MemoryInstructionConfiguration
-    PE_INST_CONFIG       : ProcessingElementInstructionConfiguration
+@dataclass(frozen=True, slots=True)
+class DecodedInstruction:
+    MEM_INSTRUCTION : DecodedMemoryInstruction
+    PE_INSTRUCTION  : DecodedProcessingElementInstruction
+    COUNT           : int
+    MEMA_INC        : int
+    MEMB_INC        : int
 
-    def get_width(self):
-        return self.COUNT_BITWIDTH + self.MEMA_INC_BITWIDTH + self.MEMB_INC_BITWIDTH
-InstConfig=InstructionConfiguration
+    def decode(self) -> 'DecodedInstruction':
+        return self
 
 class Instruction:
     def __init__(
@@ -244,22 +171,18 @@ class Instruction:
         # Saving Memory Configurations
         self._inst_config = inst_config
 
-        # Computing the Indicies of the Pertinent Values within the Instruction
-        self._mem_inst_start  = 0
-        self._pe_inst_start   = self._mem_inst_start + self._inst_config.MEMORY_INST_CONFIG.get_width()
-        self._count_start     = self._pe_inst_start  + self._inst_config.PE_INST_CONFIG.get_width()
-        self._mema_inc_start  = self._count_start    + self._inst_config.COUNT_BITWIDTH
-        self._memb_inc_start  = self._mema_inc_start + self._inst_config.MEMA_INC_BITWIDTH
+        # Packing the Sub-Instructions and Controller Fields with the Layout Derived from the Configuration
+        self._layout = self._inst_config.get_layout()
 
         # Creating Empty Variables
         self._mem_instruction = MemoryInstruction(self._inst_config.MEMORY_INST_CONFIG)
         self._pe_instruction  = ProcessingElementInstruction(self._inst_config.PE_INST_CONFIG)
-        self._count    = Bits(uint=0,length=self._inst_config.COUNT_BITWIDTH)
-        self._mema_inc = Bits(uint=0,length=self._inst_config.MEMA_INC_BITWIDTH)
-        self._memb_inc = Bits(uint=0,length=self._inst_config.MEMB_INC_BITWIDTH)
+        self._count    = 0
+        self._mema_inc = 0
+        self._memb_inc = 0
 
     def get_width(self) -> int:
-        return self._inst_config.get_width() + self._inst_config.MEMORY_INST_CONFIG.get_width() + self._inst_config.PE_INST_CONFIG.get_width()
+        return self._layout.WIDTH
 
     def set_mem_instruction(self, value : MemoryInstruction) -> None:
         self._mem_instruction = value
@@ -274,45 +197,140 @@ class Instruction:
         return self._pe_instruction
 
     def set_count(self, value : int) -> None:
-        self._count = Bits(uint=value,length=self._inst_config.COUNT_BITWIDTH)
+        self._count = check_field_value("Count", value, self._inst_config.COUNT_BITWIDTH)
 
     def get_count(self) -> Bits:
-        return self._count
+        return Bits(uint=self._count, length=self._inst_config.COUNT_BITWIDTH)
 
     def set_mema_inc(self, value : int) -> None:
-        self._mema_inc = Bits(uint=value,length=self._inst_config.MEMA_INC_BITWIDTH)
+        self._mema_inc = check_field_value("MEMA Increment", value, self._inst_config.MEMA_INC_BITWIDTH)
 
     def get_mema_inc(self) -> Bits:
-        return self._mema_inc
+        return Bits(uint=self._mema_inc, length=self._inst_config.MEMA_INC_BITWIDTH)
 
     def set_memb_inc(self, value : int) -> None:
-        self._memb_inc = Bits(uint=value,length=self._inst_config.MEMB_INC_BITWIDTH)
+        self._memb_inc = check_field_value("MEMB Increment", value, self._inst_config.MEMB_INC_BITWIDTH)
 
     def get_memb_inc(self) -> Bits:
-        return self._memb_inc
-
-    def get_instruction(self) -> Bits:
-        # print(self._pe_instruction.get_instruction())
-        return Bits().join([
-            self._mem_instruction.get_instruction(),
-            self._pe_instruction.get_instruction(),
+        return Bits(uint=self._memb_inc, length=self._inst_config.MEMB_INC_BITWIDTH)
+
+    def decode(self) -> DecodedInstruction:
+        return DecodedInstruction(
+            MEM_INSTRUCTION = self._mem_instruction.decode(),
+            PE_INSTRUCTION  = self._pe_instruction.decode(),
+            COUNT           = self._count,
+            MEMA_INC        = self._mema_inc,
+            MEMB_INC        = self._memb_inc
+        )
+
+    def get_instruction_value(self) -> int:
+        return self._layout.pack((
+            self._mem_instruction.get_instruction_value(),
+            self._pe_instruction.get_instruction_value(),
             self._count,
             self._mema_inc,
             self._memb_inc
-        ])
+        ))
+
+    def set_instruction_value(self, value : int) -> None:
+        mem_value, pe_value, self._count, self._mema_inc, self._memb_inc = self._layout.unpack(value)
+        self._mem_instruction.set_instruction_value(mem_value)
+        self._pe_instruction.set_instruction_value(pe_value)
+
+    def get_instruction(self) -> Bits:
+        return Bits(uint=self.get_instruction_value(), length=self._layout.WIDTH)
 
     def set_instruction(self, value : Bits) -> None:
+        self.set_instruction_value(value.uint)
+
+class InstructionEncoding:
+
+    # Every Field of an Instruction, Most Significant First
+    FIELD_NAMES = (
+        "MEM_OPCODE", "MEM_MODE", "MEMA_OFFSET", "MEMB_OFFSET",
+        "PE_OPCODE", "PE_MODE", "PE_VALUE",
+        "COUNT", "MEMA_INC", "MEMB_INC"
+    )
+
+    def __init__(
+        self,
+        inst_config : InstructionConfiguration
+    ):
 
-        # Slicing the input
-        mem_inst_bits = value[self._mem_inst_start :(self._mem_inst_start + self._inst_config.MEMORY_INST_CONFIG.get_width())]
-        pe_inst_bits  = value[self._pe_inst_start  :(self._pe_inst_start  + self._inst_config.PE_INST_CONFIG.get_width())    ]
-        count_bits    = value[self._count_start    :(self._count_start    + self._inst_config.COUNT_BITWIDTH)                ]
-        mema_inc_bits = value[self._mema_inc_start :(self._mema_inc_start + self._inst_config.MEMA_INC_BITWIDTH)             ]
-        memb_inc_bits = value[self._memb_inc_start :(self._memb_inc_start + self._inst_config.MEMB_INC_BITWIDTH)             ]
-
-        # Setting Values
-        self._mem_instruction.set_instruction(mem_inst_bits)
-        self._pe_instruction.set_instruction(pe_inst_bits)
-        self._count = count_bits
-        self._mema_inc = mema_inc_bits
-        self._memb_inc = memb_inc_bits
+        # Flattening the Sub-Instruction Layouts into One Table of Shifts and Masks
+        mem_config = inst_config.MEMORY_INST_CONFIG
+        pe_config  = inst_config.PE_INST_CONFIG
+        self._layout = get_field_layout(tuple(zip(self.FIELD_NAMES, (
+            mem_config.OPCODE_BITWIDTH, mem_config.MODE_BITWIDTH, mem_config.MEMA_OFFSET_BITWIDTH, mem_config.MEMB_OFFSET_BITWIDTH,
+            pe_config.OPCODE_BITWIDTH, pe_config.MODE_BITWIDTH, pe_config.VALUE_BITWIDTH,
+            inst_config.COUNT_BITWIDTH, inst_config.MEMA_INC_BITWIDTH, inst_config.MEMB_INC_BITWIDTH
+        ))))
+        self.WIDTH = self._layout.WIDTH
+
+        # Mode Bitwidths for Every Encodable Mode
+        self._mode_bitwidths = [Mode.bitwidth(elem) for elem in range(1 << max(mem_config.MODE_BITWIDTH, pe_config.MODE_BITWIDTH))]
+
+    def get_layout(self) -> FieldLayout:
+        return self._layout
+
+    def encode(self, instruction : 'Instruction | DecodedInstruction') -> int:
+        instruction = instruction.decode()
+        mem_inst    = instruction.MEM_INSTRUCTION
+        pe_inst     = instruction.PE_INSTRUCTION
+        return self._layout.pack((
+            mem_inst.OPCODE, mem_inst.MODE, mem_inst.MEMA_OFFSET, mem_inst.MEMB_OFFSET,
+            pe_inst.OPCODE, pe_inst.MODE, pe_inst.VALUE,
+            instruction.COUNT, instruction.MEMA_INC, instruction.MEMB_INC
+        ))
+
+    def decode(self, value : int) -> DecodedInstruction:
+        mem_opcode, mem_mode, mema_offset, memb_offset, pe_opcode, pe_mode, pe_value, count, mema_inc, memb_inc = self._layout.unpack(value)
+        return DecodedInstruction(
+            MEM_INSTRUCTION = DecodedMemoryInstruction(mem_opcode, mem_mode, self._mode_bitwidths[mem_mode], mema_offset, memb_offset),
+            PE_INSTRUCTION  = DecodedProcessingElementInstruction(pe_opcode, pe_mode, self._mode_bitwidths[pe_mode], pe_value),
+            COUNT           = count,
+            MEMA_INC        = mema_inc,
+            MEMB_INC        = memb_inc
+        )
+
+    def encode_bits(self, instruction : 'Instruction | DecodedInstruction') -> Bits:
+        return Bits(uint=self.encode(instruction), length=self.WIDTH)
+
+    def decode_bits(self, value : Bits) -> DecodedInstruction:
+        return self.decode(value.uint)
+
+    def encode_fields(self, fields : dict[str, np.ndarray]) -> np.ndarray:
+        return self._layout.pack_array(fields)
+
+    def decode_fields(self, values : np.ndarray) -> dict[str, np.ndarray]:
+        return self._layout.unpack_array(values)
+
+    def encode_array(self, instructions : list['Instruction | DecodedInstruction']) -> np.ndarray:
+
+        # Gathering Each Field into a Column and Packing Every Instruction at Once
+        decoded = [elem.decode() for elem in instructions]
+        columns = zip(*[(
+            elem.MEM_INSTRUCTION.OPCODE, elem.MEM_INSTRUCTION.MODE, elem.MEM_INSTRUCTION.MEMA_OFFSET, elem.MEM_INSTRUCTION.MEMB_OFFSET,
+            elem.PE_INSTRUCTION.OPCODE, elem.PE_INSTRUCTION.MODE, elem.PE_INSTRUCTION.VALUE,
+            elem.COUNT, elem.MEMA_INC, elem.MEMB_INC
+        ) for elem in decoded])
+        return self.encode_fields({name : np.array(column, dtype=np.int64) for name, column in zip(self.FIELD_NAMES, columns)})
+
+    def decode_array(self, values : np.ndarray) -> list[DecodedInstruction]:
+
+        # Unpacking Every Field at Once, then Building the Records Row by Row
+        fields = self.decode_fields(values)
+        rows = zip(*[fields[name].tolist() for name in self.FIELD_NAMES])
+        return [
+            DecodedInstruction(
+                MEM_INSTRUCTION = DecodedMemoryInstruction(mem_opcode, mem_mode, self._mode_bitwidths[mem_mode], mema_offset, memb_offset),
+                PE_INSTRUCTION  = DecodedProcessingElementInstruction(pe_opcode, pe_mode, self._mode_bitwidths[pe_mode], pe_value),
+                COUNT           = count,
+                MEMA_INC        = mema_inc,
+                MEMB_INC        = memb_inc
+            ) for mem_opcode, mem_mode, mema_offset, memb_offset, pe_opcode, pe_mode, pe_value, count, mema_inc, memb_inc in rows
+        ]
+
+    def decode_words(self, words : np.ndarray) -> list[DecodedInstruction]:
+        # Decoding Rows of Big-Endian Bytes, as Held by Packed Bit Files
+        return self.decode_array(words_to_values(words))
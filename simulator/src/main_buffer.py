@@ -1,17 +1,9 @@
 from bitstring import Bits
-from .instruction import MemoryInstruction, MI, Mode
-from dataclasses import dataclass
+from .instruction import MemoryInstruction, DecodedMemoryInstruction, MI, Mode
+from .configuration import MainBufferConfiguration
+from .memory_image import bits_to_words, words_to_bits, words_to_lanes, ints_to_words, gather_words, load_memory_image, save_memory_image
 import numpy as np
 
-@dataclass
-class MainBufferConfiguration:
-    MEM0_BITWIDTH : int
-    MEM0_DEPTH    : int
-    MEM1_BITWIDTH : int
-    MEM1_DEPTH    : int
-    MEM2_BITWIDTH : int
-    MEM2_DEPTH    : int
-
 class MainBuffer:
 
     def __init__(
@@ -33,37 +25,43 @@ class MainBuffer:
         self._mem1_output_port = Bits(int=default_value, length=self._buffer_config.MEM1_BITWIDTH)
         self._mem2_input_port  = Bits(int=default_value, length=self._buffer_config.MEM2_BITWIDTH)
 
-    def execute_instruction(self, instruction : MemoryInstruction) -> None:
-        match int(instruction.get_opcode().uint):
-            case MI.READ:
-                self._handle_read(instruction)
-            case MI.WRITE:
-                self._handle_write(instruction)
-            case MI.NOP:
-                return
-            case _:
-                raise ValueError(f"Invalid Opcode: {int(instruction.get_opcode().uint)}")
+    def execute_instruction(self, instruction : MemoryInstruction | DecodedMemoryInstruction) -> None:
+        instruction = instruction.decode()
+        handler = self._INSTRUCTION_HANDLERS.get(instruction.OPCODE)
+        if handler is None:
+            raise ValueError(f"Invalid Opcode: {instruction.OPCODE}")
+        handler(self, instruction)
 
-    def _handle_read(self, instruction : MemoryInstruction) -> None:
+    def _handle_read(self, instruction : DecodedMemoryInstruction) -> None:
 
         # Setting the Mem0 Output Port
-        self._mem0_output_port = self._mem0[instruction.get_mema_offset().uint]
+        self._mem0_output_port = self._mem0[instruction.MEMA_OFFSET]
 
         # Setting the Mem1 Output Port
-        memb_offset = instruction.get_memb_offset().uint
-        shift_amount = int(np.ceil(np.log2(self._buffer_config.MEM1_BITWIDTH/Mode.bitwidth(instruction.get_mode().uint))))
+        memb_offset = instruction.MEMB_OFFSET
+        shift_amount = int(np.ceil(np.log2(self._buffer_config.MEM1_BITWIDTH/instruction.MODE_BITWIDTH)))
         memory_address = memb_offset >> shift_amount
         cut_index = memb_offset - (memory_address << shift_amount)
-        output = [elem for elem in self._mem1[memory_address].cut(Mode.bitwidth(instruction.get_mode().uint))]
+        output = [elem for elem in self._mem1[memory_address].cut(instruction.MODE_BITWIDTH)]
 
         # Recombining
         output_port_value = Bits().join(
-            [output[-1 * (cut_index + 1)] for _ in range(int(self._buffer_config.MEM1_BITWIDTH/Mode.bitwidth(instruction.get_mode().uint)))]
+            [output[-1 * (cut_index + 1)] for _ in range(int(self._buffer_config.MEM1_BITWIDTH/instruction.MODE_BITWIDTH))]
         )
         self._mem1_output_port = output_port_value
 
-    def _handle_write(self, instruction : MemoryInstruction) -> None:
-        self._mem2[instruction.get_mema_offset().uint] = self._mem2_input_port
+    def _handle_write(self, instruction : DecodedMemoryInstruction) -> None:
+        self._mem2[instruction.MEMA_OFFSET] = self._mem2_input_port
+
+    def _handle_nop(self, instruction : DecodedMemoryInstruction) -> None:
+        return
+
+    # Dispatch Table from Opcode to Handler
+    _INSTRUCTION_HANDLERS = {
+        MI.READ  : _handle_read,
+        MI.WRITE : _handle_write,
+        MI.NOP   : _handle_nop
+    }
 
     def read_mem0_output(self) -> Bits:
         return self._mem0_output_port
@@ -74,6 +72,31 @@ class MainBuffer:
     def write_mem2_output(self, value : Bits) -> None:
         self._mem2_input_port = value
 
+    def read_mem0_output_uint(self) -> int:
+        return self.read_mem0_output().uint
+
+    def read_mem1_output_uint(self) -> int:
+        return self.read_mem1_output().uint
+
+    def write_mem2_output_uint(self, value : int) -> None:
+        self.write_mem2_output(Bits(uint=value, length=self._buffer_config.MEM2_BITWIDTH))
+
+    def read_mem0_words(self, addresses : np.ndarray) -> np.ndarray:
+        return bits_to_words([self._mem0[address] for address in addresses], self._buffer_config.MEM0_BITWIDTH)
+
+    def read_mem1_words(self, addresses : np.ndarray) -> np.ndarray:
+        return bits_to_words([self._mem1[address] for address in addresses], self._buffer_config.MEM1_BITWIDTH)
+
+    def read_mem1_values(self, addresses : np.ndarray, mode_bitwidth : int) -> np.ndarray:
+
+        # Selecting the Signed Sub-Word a READ at Each Address Broadcasts (Counted from the Least Significant Lane)
+        lane_count       = self._buffer_config.MEM1_BITWIDTH // mode_bitwidth
+        shift_amount     = (lane_count - 1).bit_length()
+        memory_addresses = addresses >> shift_amount
+        cut_indices      = addresses - (memory_addresses << shift_amount)
+        mem1_lanes = words_to_lanes(self.read_mem1_words(memory_addresses), mode_bitwidth)
+        return mem1_lanes[np.arange(len(cut_indices)), lane_count - 1 - cut_indices]
+
     def set_mem0(self, mem : list[int]) -> None:
         # Ensuring the Memory List is the Proper Length and Writing
         if len(mem) != self._buffer_config.MEM0_DEPTH:
@@ -98,8 +121,174 @@ class MainBuffer:
             raise ValueError(f"Length of Memory [{len(mem)}] is incorrect for depth [{self._buffer_config.MEM1_DEPTH}] ")
         self._mem1 = mem
 
+    def set_mem0_words(self, words : np.ndarray) -> None:
+        # Converting the Words (Padded with Zero Words up to the Depth) to Bits Entries
+        if (len(words) > self._buffer_config.MEM0_DEPTH) or (words.shape[1] * 8 != self._buffer_config.MEM0_BITWIDTH):
+            raise ValueError(f"Memory words with shape {words.shape} do not fit depth [{self._buffer_config.MEM0_DEPTH}] and bitwidth [{self._buffer_config.MEM0_BITWIDTH}]")
+        self._mem0 = words_to_bits(words, self._buffer_config.MEM0_BITWIDTH) + [
+            Bits(uint=0, length=self._buffer_config.MEM0_BITWIDTH) for _ in range(self._buffer_config.MEM0_DEPTH - len(words))
+        ]
+
+    def set_mem1_words(self, words : np.ndarray) -> None:
+        # Converting the Words (Padded with Zero Words up to the Depth) to Bits Entries
+        if (len(words) > self._buffer_config.MEM1_DEPTH) or (words.shape[1] * 8 != self._buffer_config.MEM1_BITWIDTH):
+            raise ValueError(f"Memory words with shape {words.shape} do not fit depth [{self._buffer_config.MEM1_DEPTH}] and bitwidth [{self._buffer_config.MEM1_BITWIDTH}]")
+        self._mem1 = words_to_bits(words, self._buffer_config.MEM1_BITWIDTH) + [
+            Bits(uint=0, length=self._buffer_config.MEM1_BITWIDTH) for _ in range(self._buffer_config.MEM1_DEPTH - len(words))
+        ]
+
+    def load_mem0_image(self, file_name : str) -> None:
+        self.set_mem0_words(load_memory_image(file_name, self._buffer_config.MEM0_BITWIDTH, self._buffer_config.MEM0_DEPTH))
+
+    def load_mem1_image(self, file_name : str) -> None:
+        self.set_mem1_words(load_memory_image(file_name, self._buffer_config.MEM1_BITWIDTH, self._buffer_config.MEM1_DEPTH))
+
+    def dump_mem2_image(self, file_name : str) -> None:
+        save_memory_image(file_name, self.read_mem2_words())
+
     def read_mem2(self) -> list[int]:
         return [elem.int for elem in self._mem2]
 
     def read_mem2_bits(self) -> list[Bits]:
         return self._mem2
+
+    def read_mem2_words(self) -> np.ndarray:
+        return bits_to_words(self._mem2, self._buffer_config.MEM2_BITWIDTH)
+
+
+def check_array_main_buffer_configuration(config : MainBufferConfiguration) -> None:
+    # Ensuring Every Memory Word Maps onto Whole Bytes
+    for name, value in [("MEM0_BITWIDTH", config.MEM0_BITWIDTH), ("MEM1_BITWIDTH", config.MEM1_BITWIDTH), ("MEM2_BITWIDTH", config.MEM2_BITWIDTH)]:
+        if value % 8 != 0:
+            raise ValueError(f"{name} ({value}) must be a multiple of 8 for the array main buffer.")
+
+class ArrayMainBuffer(MainBuffer):
+
+    def __init__(
+        self,
+        config : MainBufferConfiguration,
+        default_value = 0
+    ):
+
+        # Saving the Config
+        check_array_main_buffer_configuration(config)
+        self._buffer_config = config
+
+        # Creating the Individual Memories as Contiguous Byte Arrays (One Row per Word)
+        self._mem0 = self._create_memory(self._buffer_config.MEM0_BITWIDTH, self._buffer_config.MEM0_DEPTH, default_value)
+        self._mem1 = self._create_memory(self._buffer_config.MEM1_BITWIDTH, self._buffer_config.MEM1_DEPTH, default_value)
+        self._mem2 = self._create_memory(self._buffer_config.MEM2_BITWIDTH, self._buffer_config.MEM2_DEPTH, default_value)
+
+        # Creating the Output And Input Ports as Unsigned Integers of their Bitwidth
+        self._mem0_output_port = default_value & ((1 << self._buffer_config.MEM0_BITWIDTH) - 1)
+        self._mem1_output_port = default_value & ((1 << self._buffer_config.MEM1_BITWIDTH) - 1)
+        self._mem2_input_port  = default_value & ((1 << self._buffer_config.MEM2_BITWIDTH) - 1)
+
+    @staticmethod
+    def _create_memory(bitwidth : int, depth : int, default_value : int) -> np.ndarray:
+        # Zeroed Arrays are Allocated Lazily by the OS, so Untouched Words Cost Nothing
+        memory = np.zeros((depth, bitwidth // 8), dtype=np.uint8)
+        if default_value != 0:
+            memory[:] = ints_to_words([default_value], bitwidth)
+        return memory
+
+    def _handle_read(self, instruction : DecodedMemoryInstruction) -> None:
+
+        # Setting the Mem0 Output Port (Words Past the End of a Short Image Read as Zero)
+        if instruction.MEMA_OFFSET < len(self._mem0):
+            self._mem0_output_port = int.from_bytes(self._mem0[instruction.MEMA_OFFSET].tobytes(), 'big')
+        else:
+            self._mem0_output_port = 0
+
+        # Selecting the Addressed Sub-Word of Mem1 (Counted from the Least Significant Lane)
+        lane_count     = self._buffer_config.MEM1_BITWIDTH // instruction.MODE_BITWIDTH
+        shift_amount   = (lane_count - 1).bit_length()
+        memory_address = instruction.MEMB_OFFSET >> shift_amount
+        cut_index      = instruction.MEMB_OFFSET - (memory_address << shift_amount)
+        word  = int.from_bytes(self._mem1[memory_address].tobytes(), 'big') if memory_address < len(self._mem1) else 0
+        value = (word >> (cut_index * instruction.MODE_BITWIDTH)) & ((1 << instruction.MODE_BITWIDTH) - 1)
+
+        # Broadcasting the Sub-Word Across the Mem1 Output Port (Multiplying by 0b0..01 Repeated in Every Lane)
+        lane_ones = ((1 << (lane_count * instruction.MODE_BITWIDTH)) - 1) // ((1 << instruction.MODE_BITWIDTH) - 1)
+        self._mem1_output_port = value * lane_ones
+
+    def _handle_write(self, instruction : DecodedMemoryInstruction) -> None:
+        self._mem2[instruction.MEMA_OFFSET] = np.frombuffer(
+            self._mem2_input_port.to_bytes(self._buffer_config.MEM2_BITWIDTH // 8, 'big'), dtype=np.uint8
+        )
+
+    # Dispatch Table from Opcode to Handler
+    _INSTRUCTION_HANDLERS = {
+        MI.READ  : _handle_read,
+        MI.WRITE : _handle_write,
+        MI.NOP   : MainBuffer._handle_nop
+    }
+
+    def read_mem0_output(self) -> Bits:
+        return Bits(uint=self._mem0_output_port, length=self._buffer_config.MEM0_BITWIDTH)
+
+    def read_mem1_output(self) -> Bits:
+        return Bits(uint=self._mem1_output_port, length=self._buffer_config.MEM1_BITWIDTH)
+
+    def write_mem2_output(self, value : Bits) -> None:
+        self._mem2_input_port = value.uint
+
+    def read_mem0_output_uint(self) -> int:
+        return self._mem0_output_port
+
+    def read_mem1_output_uint(self) -> int:
+        return self._mem1_output_port
+
+    def write_mem2_output_uint(self, value : int) -> None:
+        self._mem2_input_port = value
+
+    def read_mem0_words(self, addresses : np.ndarray) -> np.ndarray:
+        return gather_words(self._mem0, addresses)
+
+    def read_mem1_words(self, addresses : np.ndarray) -> np.ndarray:
+        return gather_words(self._mem1, addresses)
+
+    def set_mem0(self, mem : list[int]) -> None:
+        # Ensuring the Memory List is the Proper Length and Writing
+        if len(mem) != self._buffer_config.MEM0_DEPTH:
+            raise ValueError(f"Length of Memory [{len(mem)}] is incorrect for depth [{self._buffer_config.MEM0_DEPTH}] ")
+        self._mem0 = ints_to_words(mem, self._buffer_config.MEM0_BITWIDTH)
+
+    def set_mem1(self, mem : list[int]) -> None:
+        # Ensuring the Memory List is the Proper Length and Writing
+        if len(mem) != self._buffer_config.MEM1_DEPTH:
+            raise ValueError(f"Length of Memory [{len(mem)}] is incorrect for depth [{self._buffer_config.MEM1_DEPTH}] ")
+        self._mem1 = ints_to_words(mem, self._buffer_config.MEM1_BITWIDTH)
+
+    def set_mem0_bits(self, mem : list[Bits]) -> None:
+        # Ensuring the Memory List is the Proper Length and Writing
+        if len(mem) != self._buffer_config.MEM0_DEPTH:
+            raise ValueError(f"Length of Memory [{len(mem)}] is incorrect for depth [{self._buffer_config.MEM0_DEPTH}] ")
+        self._mem0 = bits_to_words(mem, self._buffer_config.MEM0_BITWIDTH)
+
+    def set_mem1_bits(self, mem : list[Bits]) -> None:
+        # Ensuring the Memory List is the Proper Length and Writing
+        if len(mem) != self._buffer_config.MEM1_DEPTH:
+            raise ValueError(f"Length of Memory [{len(mem)}] is incorrect for depth [{self._buffer_config.MEM1_DEPTH}] ")
+        self._mem1 = bits_to_words(mem, self._buffer_config.MEM1_BITWIDTH)
+
+    def set_mem0_words(self, words : np.ndarray) -> None:
+        # Shorter Images are Allowed, the Remaining Words Read as Zero
+        if (len(words) > self._buffer_config.MEM0_DEPTH) or (words.shape[1] * 8 != self._buffer_config.MEM0_BITWIDTH):
+            raise ValueError(f"Memory words with shape {words.shape} do not fit depth [{self._buffer_config.MEM0_DEPTH}] and bitwidth [{self._buffer_config.MEM0_BITWIDTH}]")
+        self._mem0 = words
+
+    def set_mem1_words(self, words : np.ndarray) -> None:
+        # Shorter Images are Allowed, the Remaining Words Read as Zero
+        if (len(words) > self._buffer_config.MEM1_DEPTH) or (words.shape[1] * 8 != self._buffer_config.MEM1_BITWIDTH):
+            raise ValueError(f"Memory words with shape {words.shape} do not fit depth [{self._buffer_config.MEM1_DEPTH}] and bitwidth [{self._buffer_config.MEM1_BITWIDTH}]")
+        self._mem1 = words
+
+    def read_mem2(self) -> list[int]:
+        return [int.from_bytes(row.tobytes(), 'big', signed=True) for row in self._mem2]
+
+    def read_mem2_bits(self) -> list[Bits]:
+        return words_to_bits(self._mem2, self._buffer_config.MEM2_BITWIDTH)
+
+    def read_mem2_words(self) -> np.ndarray:
+        return self._mem2
@@ -0,0 +1,6 @@
+import numpy as np
+
+def generate_random_matrix(rows : int, cols : int, min_value : int, max_value : int, seed : int = 0) -> np.ndarray:
+    # Seeding the Global Generator so Matrices Match Those Saved by Earlier Versions of ivd-mg
+    np.random.seed(seed)
+    return np.random.randint(min_value, max_value, size=(rows, cols))
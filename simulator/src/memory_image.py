@@ -0,0 +1,305 @@
+from . import STDIO_FILE_NAME
+from bitstring import Bits
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+import numpy as np
+import itertools
+import hashlib
+import struct
+import sys
+
+# Signed Big-Endian Views Used to Reinterpret Memory Words as Lanes
+LANE_DTYPES = {
+    8  : '>i1',
+    16 : '>i2',
+    32 : '>i4',
+    64 : '>i8'
+}
+
+# Packed Bit File Layout: Magic, Version, Endianness, Padding, Width, Depth and Config Hash, Followed by the Words
+BIT_FILE_FORMATS = ("ascii", "packed")
+PACKED_MAGIC     = b"IVDBITS\0"
+PACKED_VERSION   = 1
+PACKED_HEADER    = struct.Struct("<8sHBxIQ8s")
+NO_CONFIG_HASH   = bytes(8)
+
+# Streams Convert this Many Words at a Time
+STREAM_CHUNK_WORDS = 4096
+
+class Endianness:
+    BIG    = 0
+    LITTLE = 1
+
+@dataclass
+class PackedBitsHeader:
+    VERSION     : int
+    ENDIANNESS  : int
+    WIDTH       : int
+    DEPTH       : int
+    CONFIG_HASH : bytes
+
+def get_word_bytes(bitwidth : int) -> int:
+    return (bitwidth + 7) // 8
+
+def bits_to_words(bit_list : list[Bits], bitwidth : int) -> np.ndarray:
+
+    # Ensuring Every Entry Has the Expected Bitwidth
+    word_bytes = get_word_bytes(bitwidth)
+    if any(len(elem) != bitwidth for elem in bit_list):
+        raise ValueError(f"Memory entries do not all have bitwidth [{bitwidth}].")
+
+    # Packing Every Entry into One Row of a Contiguous Byte Array (Right Aligned When Not Whole Bytes)
+    if bitwidth % 8 == 0:
+        data = b"".join([elem.tobytes() for elem in bit_list])
+    else:
+        data = b"".join([elem.uint.to_bytes(word_bytes, 'big') for elem in bit_list])
+    return np.frombuffer(data, dtype=np.uint8).reshape(len(bit_list), word_bytes).copy()
+
+def words_to_bits(words : np.ndarray, bitwidth : int) -> list[Bits]:
+
+    # Sharing a Single Zero Entry as Bits Objects are Immutable
+    zero_entry = Bits(uint=0, length=bitwidth)
+    non_zero   = words.any(axis=1)
+    offset     = (get_word_bytes(bitwidth) * 8) - bitwidth
+    return [
+        Bits(bytes=row.tobytes(), offset=offset, length=bitwidth) if non_zero[i] else zero_entry for i, row in enumerate(words)
+    ]
+
+def words_to_lanes(words : np.ndarray, lane_bitwidth : int) -> np.ndarray:
+
+    # Reinterpreting the Trailing Byte Axis as Signed Lanes (Most Significant Lane First)
+    dtype = LANE_DTYPES.get(lane_bitwidth)
+    if dtype is None:
+        raise ValueError(f"Unsupported lane bitwidth [{lane_bitwidth}].")
+    return np.ascontiguousarray(words, dtype=np.uint8).view(dtype).astype(np.int64)
+
+def lanes_to_words(lanes : np.ndarray, lane_bitwidth : int) -> np.ndarray:
+
+    # Truncating Each Lane to its Bitwidth (Two's Complement Wrap) and Repacking as Bytes
+    dtype = LANE_DTYPES.get(lane_bitwidth)
+    if dtype is None:
+        raise ValueError(f"Unsupported lane bitwidth [{lane_bitwidth}].")
+    return np.ascontiguousarray(np.asarray(lanes).astype(dtype)).view(np.uint8)
+
+def gather_words(memory : np.ndarray, addresses : np.ndarray) -> np.ndarray:
+
+    # Words Past the End of a Short Memory Image Read as Zero
+    if (len(addresses) == 0) or (addresses.max() < len(memory)):
+        return memory[addresses]
+    words = np.zeros((len(addresses), memory.shape[1]), dtype=np.uint8)
+    in_image = addresses < len(memory)
+    words[in_image] = memory[addresses[in_image]]
+    return words
+
+def ints_to_words(values : list[int], bitwidth : int) -> np.ndarray:
+
+    # Packing Signed or Unsigned Integers as Big-Endian Rows of Bytes
+    word_bytes = get_word_bytes(bitwidth)
+    mask = (1 << bitwidth) - 1
+    data = b"".join([(int(elem) & mask).to_bytes(word_bytes, 'big') for elem in values])
+    return np.frombuffer(data, dtype=np.uint8).reshape(len(values), word_bytes).copy()
+
+def save_memory_image(file_name : str, words : np.ndarray) -> None:
+    np.save(file_name, np.ascontiguousarray(words, dtype=np.uint8))
+
+def load_memory_image(file_name : str, bitwidth : int, depth : int, mmap : bool = True) -> np.ndarray:
+
+    # Mapping the Image Without Reading it so Only Touched Words are Paged In
+    words = np.load(file_name, mmap_mode=('r' if mmap else None))
+
+    # Ensuring the Image Matches the Memory it is Loaded Into
+    if (words.dtype != np.uint8) or (words.ndim != 2) or (words.shape[1] * 8 != bitwidth):
+        raise ValueError(f"Memory image \"{file_name}\" with shape {words.shape} and type {words.dtype} does not hold {bitwidth}-bit words.")
+    if len(words) > depth:
+        raise ValueError(f"Memory image \"{file_name}\" has {len(words)} words but the memory depth is [{depth}].")
+    return words
+
+def configuration_hash(*configs) -> bytes:
+    # Hashing the Configuration Dataclasses so Files Built for Another Design are Caught
+    return hashlib.sha256("".join([repr(elem) for elem in configs]).encode()).digest()[:len(NO_CONFIG_HASH)]
+
+def is_packed_bits(file_name : str) -> bool:
+    with open(file_name, "rb") as file:
+        return file.read(len(PACKED_MAGIC)) == PACKED_MAGIC
+
+def read_packed_header(file_name : str) -> PackedBitsHeader:
+
+    # Reading and Checking the Fixed Size Header
+    with open(file_name, "rb") as file:
+        data = file.read(PACKED_HEADER.size)
+    if len(data) != PACKED_HEADER.size:
+        raise ValueError(f"Packed bit file \"{file_name}\" is too short to hold a header.")
+    magic, version, endianness, width, depth, config_hash = PACKED_HEADER.unpack(data)
+    if magic != PACKED_MAGIC:
+        raise ValueError(f"File \"{file_name}\" is not a packed bit file.")
+    if version != PACKED_VERSION:
+        raise ValueError(f"Packed bit file \"{file_name}\" has unsupported version [{version}].")
+    if endianness not in (Endianness.BIG, Endianness.LITTLE):
+        raise ValueError(f"Packed bit file \"{file_name}\" has invalid endianness [{endianness}].")
+    return PackedBitsHeader(
+        VERSION     = version,
+        ENDIANNESS  = endianness,
+        WIDTH       = width,
+        DEPTH       = depth,
+        CONFIG_HASH = config_hash
+    )
+
+def save_packed_bits(
+        file_name : str,
+        words : np.ndarray,
+        bitwidth : int,
+        config_hash : bytes = NO_CONFIG_HASH,
+        endianness : int = Endianness.BIG
+    ) -> None:
+
+    # Ensuring the Words Match the Header
+    if (words.ndim != 2) or (words.shape[1] != get_word_bytes(bitwidth)):
+        raise ValueError(f"Words with shape {words.shape} do not hold {bitwidth}-bit entries.")
+    if endianness == Endianness.LITTLE:
+        words = words[:, ::-1]
+
+    # Writing the Header Followed by the Raw Words
+    with open(file_name, "wb") as file:
+        file.write(PACKED_HEADER.pack(PACKED_MAGIC, PACKED_VERSION, endianness, bitwidth, len(words), config_hash))
+        file.write(np.ascontiguousarray(words, dtype=np.uint8).tobytes())
+
+def load_packed_bits(file_name : str, bitwidth : int = None, config_hash : bytes = None) -> np.ndarray:
+
+    # Validating the Header Against What the Caller Expects
+    header = read_packed_header(file_name)
+    if (bitwidth is not None) and (header.WIDTH != bitwidth):
+        raise ValueError(f"Packed bit file \"{file_name}\" holds {header.WIDTH}-bit words, expected {bitwidth}-bit words.")
+    if (config_hash is not None) and (config_hash != NO_CONFIG_HASH) and (header.CONFIG_HASH != NO_CONFIG_HASH) and (header.CONFIG_HASH != config_hash):
+        raise ValueError(f"Packed bit file \"{file_name}\" was generated for a different configuration.")
+
+    # Mapping the Words Without Copying (Little Endian Files are Viewed Byte Reversed)
+    word_bytes = get_word_bytes(header.WIDTH)
+    if header.DEPTH == 0:
+        return np.zeros((0, word_bytes), dtype=np.uint8)
+    words = np.memmap(file_name, dtype=np.uint8, mode='r', offset=PACKED_HEADER.size, shape=(header.DEPTH, word_bytes))
+    if header.ENDIANNESS == Endianness.LITTLE:
+        words = words[:, ::-1]
+    return words
+
+def load_ascii_bits(file_name : str) -> list[Bits]:
+    with open(file_name, "r") as file:
+        return [Bits(bin=line) for line in file.read().split()]
+
+def load_bit_list(file_name : str, bitwidth : int = None, config_hash : bytes = None) -> list[Bits]:
+
+    # Detecting the Format from the Magic Bytes
+    if is_packed_bits(file_name):
+        words = load_packed_bits(file_name, bitwidth, config_hash)
+        return words_to_bits(words, read_packed_header(file_name).WIDTH)
+    bit_list = load_ascii_bits(file_name)
+    if (bitwidth is not None) and any(len(elem) != bitwidth for elem in bit_list):
+        raise ValueError(f"Bit file \"{file_name}\" does not hold {bitwidth}-bit words.")
+    return bit_list
+
+def load_bit_words(file_name : str, bitwidth : int, config_hash : bytes = None) -> np.ndarray:
+
+    # Packed Files are Mapped Directly, ASCII Files are Parsed and Packed
+    if is_packed_bits(file_name):
+        return load_packed_bits(file_name, bitwidth, config_hash)
+    return bits_to_words(load_ascii_bits(file_name), bitwidth)
+
+def save_bit_list(
+        file_name : str,
+        bit_list : list[Bits],
+        bitwidth : int,
+        file_format : str = "ascii",
+        config_hash : bytes = NO_CONFIG_HASH
+    ) -> None:
+    match file_format:
+        case "ascii":
+            with open(file_name, "w") as file:
+                file.write("".join([f"{elem.bin}\n" for elem in bit_list]))
+        case "packed":
+            save_packed_bits(file_name, bits_to_words(bit_list, bitwidth), bitwidth, config_hash)
+        case _:
+            raise ValueError(f"Unknown bit file format \"{file_format}\", expected one of {BIT_FILE_FORMATS}.")
+
+def save_bit_words(
+        file_name : str,
+        words : np.ndarray,
+        bitwidth : int,
+        file_format : str = "ascii",
+        config_hash : bytes = NO_CONFIG_HASH
+    ) -> None:
+    if file_format == "packed":
+        save_packed_bits(file_name, words, bitwidth, config_hash)
+    else:
+        save_bit_list(file_name, words_to_bits(words, bitwidth), bitwidth, file_format, config_hash)
+
+def iter_ascii_bits(lines : Iterable[str], bitwidth : int = None, file_name : str = STDIO_FILE_NAME) -> Iterator[Bits]:
+    for line_number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if len(line) == 0:
+            continue
+        if (bitwidth is not None) and (len(line) != bitwidth):
+            raise ValueError(f"Bit file \"{file_name}\" line {line_number} does not hold a {bitwidth}-bit word.")
+        yield Bits(bin=line)
+
+def iter_bit_list(file_name : str, bitwidth : int = None, config_hash : bytes = None) -> Iterator[Bits]:
+
+    # Reading Standard Input Line by Line (Only ASCII Can be Piped)
+    if file_name == STDIO_FILE_NAME:
+        yield from iter_ascii_bits(sys.stdin, bitwidth)
+        return
+
+    # Converting Mapped Packed Words a Chunk at a Time, Text a Line at a Time
+    if is_packed_bits(file_name):
+        words = load_packed_bits(file_name, bitwidth, config_hash)
+        width = read_packed_header(file_name).WIDTH
+        for start in range(0, len(words), STREAM_CHUNK_WORDS):
+            yield from words_to_bits(words[start:(start + STREAM_CHUNK_WORDS)], width)
+        return
+    with open(file_name, "r") as file:
+        yield from iter_ascii_bits(file, bitwidth, file_name)
+
+def save_bit_stream(
+        file_name : str,
+        bit_iter : Iterable[Bits],
+        bitwidth : int,
+        file_format : str = "ascii",
+        config_hash : bytes = NO_CONFIG_HASH,
+        min_depth : int = 0
+    ) -> int:
+
+    # Padding with Zero Words up to the Minimum Depth Once the Stream Ends
+    count = 0
+    def padded_words() -> Iterator[Bits]:
+        nonlocal count
+        for elem in bit_iter:
+            if len(elem) != bitwidth:
+                raise ValueError(f"Word {count} does not have bitwidth [{bitwidth}].")
+            count += 1
+            yield elem
+        yield from itertools.repeat(Bits(uint=0, length=bitwidth), max(0, min_depth - count))
+
+    match file_format:
+        case "ascii":
+            file = sys.stdout if file_name == STDIO_FILE_NAME else open(file_name, "w")
+            try:
+                for elem in padded_words():
+                    file.write(f"{elem.bin}\n")
+            finally:
+                if file is not sys.stdout:
+                    file.close()
+        case "packed":
+
+            # The Header Holds the Depth, so it is Rewritten Once the Stream Ends
+            if file_name == STDIO_FILE_NAME:
+                raise ValueError("Packed bit files need a seekable output file, not standard output.")
+            words = padded_words()
+            depth = 0
+            with open(file_name, "wb") as file:
+                file.write(PACKED_HEADER.pack(PACKED_MAGIC, PACKED_VERSION, Endianness.BIG, bitwidth, 0, config_hash))
+                while len(chunk := list(itertools.islice(words, STREAM_CHUNK_WORDS))) > 0:
+                    file.write(bits_to_words(chunk, bitwidth).tobytes())
+                    depth += len(chunk)
+                file.seek(0)
+                file.write(PACKED_HEADER.pack(PACKED_MAGIC, PACKED_VERSION, Endianness.BIG, bitwidth, depth, config_hash))
+        case _:
+            raise ValueError(f"Unknown bit file format \"{file_format}\", expected one of {BIT_FILE_FORMATS}.")
+    return count
@@ -0,0 +1,187 @@
+from .compiler import check_value_range, check_buffer_capacity, pad_words
+from .configuration import AcceleratorConfiguration, Mode
+from .memory_image import bits_to_words, lanes_to_words, words_to_lanes
+from dataclasses import dataclass
+from bitstring import Bits
+import numpy as np
+import json
+
+# Precision Name Selecting the Per Row Block Mode Instead of One Global Mode
+MIXED_PRECISION = "MIXED"
+
+@dataclass
+class RowBlock:
+    ROW_START : int
+    ROW_STOP  : int
+    BITWIDTH  : int
+    BOUND     : int
+    EXACT     : bool
+
+@dataclass
+class MixedPrecisionProgram:
+    MEM0         : np.ndarray
+    MEM1         : np.ndarray
+    INSTRUCTIONS : list[str]
+    ROW_BLOCKS   : list[RowBlock]
+    VECTOR_COUNT : int
+
+    def get_result_entry(self, block_index : int, vector_index : int) -> int:
+        return (vector_index * len(self.ROW_BLOCKS)) + block_index
+
+    def get_row_count(self) -> int:
+        return self.ROW_BLOCKS[-1].ROW_STOP if self.ROW_BLOCKS else 0
+
+    def get_mode_block_counts(self) -> dict[int, int]:
+        counts = {}
+        for block in self.ROW_BLOCKS:
+            counts[block.BITWIDTH] = counts.get(block.BITWIDTH, 0) + 1
+        return counts
+
+def get_available_modes(config : AcceleratorConfiguration) -> list[int]:
+    # Narrowest First, Keeping Only Modes that Evenly Divide a PE Input
+    input_bitwidth = config.PE_CONFIG.INPUT_BITWIDTH
+    return sorted([elem for elem in Mode.BITWIDTH_TO_STR_DICT if (elem <= input_bitwidth) and (input_bitwidth % elem == 0)])
+
+def get_mode_limit(config : AcceleratorConfiguration, computation_bitwidth : int) -> int:
+
+    # The Largest Magnitude Both an Accumulation Lane and the Output Lane OUT Keeps Can Hold
+    acc_bitwidth = computation_bitwidth * (config.PE_CONFIG.ACCUMULATION_BITWIDTH // config.PE_CONFIG.INPUT_BITWIDTH)
+    return min((1 << (computation_bitwidth - 1)) - 1, (1 << (acc_bitwidth - 1)) - 1)
+
+def values_fit(values : np.ndarray, computation_bitwidth : int) -> bool:
+    min_value = -(1 << (computation_bitwidth - 1))
+    max_value = (1 << (computation_bitwidth - 1)) - 1
+    return (np.size(values) == 0) or ((np.min(values) >= min_value) and (np.max(values) <= max_value))
+
+def select_row_blocks(
+    matrix : np.ndarray,
+    vectors : np.ndarray,
+    config : AcceleratorConfiguration
+) -> list[RowBlock]:
+
+    # Bounding Every Row's Accumulation by the Largest Vector Magnitude, so the Choice Holds for Any Vector in Range
+    modes       = get_available_modes(config)
+    vector_max  = int(np.max(np.abs(vectors))) if np.size(vectors) else 0
+    row_abs_sum = np.abs(np.asarray(matrix, dtype=np.int64)).sum(axis=1) if np.size(matrix) else np.zeros(len(matrix), dtype=np.int64)
+
+    # Taking the Narrowest Mode Whose Row Block Holds its Values and Cannot Overflow, Falling Back to the Widest
+    blocks = []
+    start  = 0
+    while start < len(matrix):
+        for mode in modes:
+            stop  = min(start + (config.PE_COUNT * (config.PE_CONFIG.INPUT_BITWIDTH // mode)), len(matrix))
+            bound = int(row_abs_sum[start:stop].max()) * vector_max
+            exact = bound <= get_mode_limit(config, mode)
+            if (values_fit(matrix[start:stop], mode) and values_fit(vectors, mode) and exact) or (mode == modes[-1]):
+                blocks.append(RowBlock(start, stop, mode, bound, exact))
+                break
+        start = stop
+    return blocks
+
+def compile_mixed_precision_multiplication_words(
+    matrix : np.ndarray,
+    vectors : np.ndarray,
+    config : AcceleratorConfiguration
+) -> MixedPrecisionProgram:
+
+    # Ensuring Every Value Fits the Widest Mode (Each Column of the Vectors is One Vector)
+    matrix  = np.asarray(matrix)
+    vectors = np.asarray(vectors)
+    if vectors.ndim == 1:
+        vectors = vectors.reshape(-1, 1)
+    modes = get_available_modes(config)
+    check_value_range(matrix, modes[-1], "Matrix")
+    check_value_range(vectors, modes[-1], "Vector")
+    (matrix_rows, matrix_cols) = matrix.shape
+    if vectors.shape[0] != matrix_cols:
+        raise ValueError(f"Vectors have {vectors.shape[0]} rows but the matrix has {matrix_cols} columns.")
+    vector_count = vectors.shape[1]
+    blocks = select_row_blocks(matrix, vectors, config)
+
+    # Laying Out Each Row Block in its Own Mode (Every Mode Fills a Whole MEM0 Entry)
+    mem0_parts = []
+    for block in blocks:
+        number_of_rows = config.PE_COUNT * (config.PE_CONFIG.INPUT_BITWIDTH // block.BITWIDTH)
+        padded_block = np.zeros((number_of_rows, matrix_cols), dtype=np.int64)
+        padded_block[:(block.ROW_STOP - block.ROW_START)] = matrix[block.ROW_START:block.ROW_STOP]
+        mem0_parts.append(lanes_to_words(padded_block.T, block.BITWIDTH))
+
+    # Laying Out the Vectors Once per Mode in Use, Each Copy Starting on a Fresh Entry
+    mem1_parts = []
+    mem1_bases = {}
+    mem1_entries = 0
+    for mode in sorted(set([block.BITWIDTH for block in blocks])):
+        number_of_cols     = config.PE_CONFIG.INPUT_BITWIDTH // mode
+        col_sub_comp_count = int(np.ceil(matrix_cols / number_of_cols))
+        padded_vectors = np.zeros((vector_count, col_sub_comp_count * number_of_cols), dtype=np.int64)
+        padded_vectors[:, :matrix_cols] = vectors.T
+        mem1_parts.append(lanes_to_words(padded_vectors.reshape(-1, number_of_cols)[:, ::-1], mode))
+        mem1_bases[mode] = mem1_entries
+        mem1_entries += vector_count * col_sub_comp_count
+
+    # Ensuring the Layout Fits Every Buffer
+    check_buffer_capacity("MEM0", len(blocks) * matrix_cols, config.BUFFER_CONFIG.MEM0_DEPTH)
+    check_buffer_capacity("MEM1", mem1_entries, config.BUFFER_CONFIG.MEM1_DEPTH)
+    check_buffer_capacity("MEM2", vector_count * len(blocks), config.BUFFER_CONFIG.MEM2_DEPTH)
+
+    # Creating Instructions, Switching Mode with Each Row Block (MEMB Offsets Count Elements of the Block's Mode)
+    instruction_list = []
+    for block_index, block in enumerate(blocks):
+        mode_str       = Mode.BITWIDTH_TO_STR_DICT[block.BITWIDTH]
+        number_of_cols = config.PE_CONFIG.INPUT_BITWIDTH // block.BITWIDTH
+        padded_cols    = int(np.ceil(matrix_cols / number_of_cols)) * number_of_cols
+        for vector_index in range(vector_count):
+            memb_offset = (mem1_bases[block.BITWIDTH] * number_of_cols) + (vector_index * padded_cols)
+            instruction_list.extend([
+                f"NOP | CLR {mode_str} | 1 0 0",
+                f"READ {mode_str} {block_index * matrix_cols} {memb_offset} | MAC {mode_str} | {matrix_cols} 1 1",
+                f"NOP | OUT {mode_str} | 1 0 0",
+                f"WRITE {(vector_index * len(blocks)) + block_index} | NOP {mode_str} | 1 0 0"
+            ])
+
+    # Padding Memory
+    mem0_width = config.BUFFER_CONFIG.MEM0_BITWIDTH // 8
+    mem1_width = config.BUFFER_CONFIG.MEM1_BITWIDTH // 8
+    mem0_words = pad_words(np.concatenate(mem0_parts) if mem0_parts else np.zeros((0, mem0_width), dtype=np.uint8), config.BUFFER_CONFIG.MEM0_DEPTH)
+    mem1_words = pad_words(np.concatenate(mem1_parts) if mem1_parts else np.zeros((0, mem1_width), dtype=np.uint8), config.BUFFER_CONFIG.MEM1_DEPTH)
+    return MixedPrecisionProgram(mem0_words, mem1_words, instruction_list, blocks, vector_count)
+
+def extract_mixed_precision_results(
+    program : MixedPrecisionProgram,
+    memory : list[Bits] | np.ndarray,
+    config : AcceleratorConfiguration
+) -> np.ndarray:
+
+    # Packing Only the Entries Holding Results (Word Arrays are Used Directly)
+    last_entry = program.VECTOR_COUNT * len(program.ROW_BLOCKS)
+    if isinstance(memory, np.ndarray):
+        words = memory[:last_entry]
+    else:
+        words = bits_to_words(memory[:last_entry], config.BUFFER_CONFIG.MEM2_BITWIDTH)
+
+    # Reading Each Row Block's Entry in the Mode it was Computed in
+    result = np.zeros((program.get_row_count(), program.VECTOR_COUNT), dtype=np.int64)
+    for block_index, block in enumerate(program.ROW_BLOCKS):
+        row_count = block.ROW_STOP - block.ROW_START
+        for vector_index in range(program.VECTOR_COUNT):
+            entry = program.get_result_entry(block_index, vector_index)
+            result[block.ROW_START:block.ROW_STOP, vector_index] = words_to_lanes(words[entry:(entry + 1)], block.BITWIDTH).reshape(-1)[:row_count]
+    return result
+
+def save_mixed_precision_layout(program : MixedPrecisionProgram, file_name : str) -> None:
+
+    # Recording the Mode and MEM2 Entries of Each Row Block, Which a Reader of MEM2 Needs to Decode it
+    with open(file_name, "w") as file:
+        json.dump({
+            "rows"         : program.get_row_count(),
+            "vector_count" : program.VECTOR_COUNT,
+            "row_blocks"   : [
+                {
+                    "rows"         : [block.ROW_START, block.ROW_STOP],
+                    "precision"    : Mode.BITWIDTH_TO_STR_DICT[block.BITWIDTH],
+                    "exact"        : block.EXACT,
+                    "mem2_entries" : [program.get_result_entry(block_index, elem) for elem in range(program.VECTOR_COUNT)]
+                }
+                for block_index, block in enumerate(program.ROW_BLOCKS)
+            ]
+        }, file, indent=2)
@@ -0,0 +1,225 @@
+from bitstring import Bits
+from .accelerator import AcceleratorConfiguration
+from .instruction import Instruction, DecodedInstruction, MI, PEI, Mode
+from .timing import get_instruction_cycles
+from .memory_image import bits_to_words, words_to_bits, words_to_lanes, lanes_to_words, gather_words, load_memory_image, save_memory_image
+import numpy as np
+
+
+class NumpyAccelerator:
+
+    def __init__(
+        self,
+        controller_config : AcceleratorConfiguration
+    ):
+
+        # Saving the Configuration and Validating
+        self._controller_config = controller_config
+        self._controller_config.validate()
+        self._pe_config     = self._controller_config.PE_CONFIG
+        self._buffer_config = self._controller_config.BUFFER_CONFIG
+        self._validate()
+
+        # Creating the Memories (One Row of Bytes per Memory Word)
+        self._mem0 = np.zeros((self._buffer_config.MEM0_DEPTH, self._buffer_config.MEM0_BITWIDTH // 8), dtype=np.uint8)
+        self._mem1 = np.zeros((self._buffer_config.MEM1_DEPTH, self._buffer_config.MEM1_BITWIDTH // 8), dtype=np.uint8)
+        self._mem2 = np.zeros((self._buffer_config.MEM2_DEPTH, self._buffer_config.MEM2_BITWIDTH // 8), dtype=np.uint8)
+
+        # Creating the Buffer Output Ports
+        # NOTE: The MEM2 input port always equals the PE outputs between instructions, so it is not stored
+        self._mem0_output_port = np.zeros(self._buffer_config.MEM0_BITWIDTH // 8, dtype=np.uint8)
+        self._mem1_output_port = np.zeros(self._buffer_config.MEM1_BITWIDTH // 8, dtype=np.uint8)
+
+        # Creating the State of Every PE (One Row of Bytes per PE)
+        self._acc_value    = np.zeros((self._controller_config.PE_COUNT, self._pe_config.ACCUMULATION_BITWIDTH // 8), dtype=np.uint8)
+        self._output_value = np.zeros((self._controller_config.PE_COUNT, self._pe_config.OUTPUT_BITWIDTH // 8), dtype=np.uint8)
+
+        # Counting Clock Cycles as controller.sv Spends Them
+        self._cycle_count = 0
+
+    def _validate(self) -> None:
+        check_numpy_configuration(self._controller_config)
+
+    def _get_accumulation_ratio(self) -> int:
+        return self._pe_config.ACCUMULATION_BITWIDTH // self._pe_config.INPUT_BITWIDTH
+
+    def set_memory(self, mem0 : list[Bits], mem1 : list[Bits]) -> None:
+        self.set_mem0(mem0)
+        self.set_mem1(mem1)
+
+    def set_mem0(self, mem : list[Bits]) -> None:
+        if len(mem) != self._buffer_config.MEM0_DEPTH:
+            raise ValueError(f"Length of Memory [{len(mem)}] is incorrect for depth [{self._buffer_config.MEM0_DEPTH}] ")
+        self._mem0 = bits_to_words(mem, self._buffer_config.MEM0_BITWIDTH)
+
+    def set_mem1(self, mem : list[Bits]) -> None:
+        if len(mem) != self._buffer_config.MEM1_DEPTH:
+            raise ValueError(f"Length of Memory [{len(mem)}] is incorrect for depth [{self._buffer_config.MEM1_DEPTH}] ")
+        self._mem1 = bits_to_words(mem, self._buffer_config.MEM1_BITWIDTH)
+
+    def set_memory_words(self, mem0 : np.ndarray, mem1 : np.ndarray) -> None:
+
+        # Keeping the Words As Given (Mapped Files Stay Mapped), Shorter Memories Read as Zero Past Their End
+        for name, words, bitwidth, depth in [
+            ("MEM0", mem0, self._buffer_config.MEM0_BITWIDTH, self._buffer_config.MEM0_DEPTH),
+            ("MEM1", mem1, self._buffer_config.MEM1_BITWIDTH, self._buffer_config.MEM1_DEPTH)
+        ]:
+            if (len(words) > depth) or (words.shape[1] * 8 != bitwidth):
+                raise ValueError(f"{name} words with shape {words.shape} do not fit depth [{depth}] and bitwidth [{bitwidth}]")
+        self._mem0 = mem0
+        self._mem1 = mem1
+
+    def load_memory_images(self, mem0_file : str, mem1_file : str) -> None:
+        # Keeping the Images Mapped, Reads Only Page In the Words a Program Touches
+        self.set_memory_words(
+            load_memory_image(mem0_file, self._buffer_config.MEM0_BITWIDTH, self._buffer_config.MEM0_DEPTH),
+            load_memory_image(mem1_file, self._buffer_config.MEM1_BITWIDTH, self._buffer_config.MEM1_DEPTH)
+        )
+
+    def dump_mem2_image(self, file_name : str) -> None:
+        save_memory_image(file_name, self._mem2)
+
+    def get_mem2(self) -> list[Bits]:
+        return words_to_bits(self._mem2, self._buffer_config.MEM2_BITWIDTH)
+
+    def get_mem2_words(self) -> np.ndarray:
+        return self._mem2.copy()
+
+    def get_accumulations(self) -> list[Bits]:
+        return words_to_bits(self._acc_value, self._pe_config.ACCUMULATION_BITWIDTH)
+
+    def get_cycle_count(self) -> int:
+        return self._cycle_count
+
+    def execute_instructions(self, instructions : list[Instruction | DecodedInstruction]):
+
+        # Decoding the Whole Program Once Before Executing It
+        for inst in [elem.decode() for elem in instructions]:
+            self.execute_instruction(inst)
+
+    def execute_instruction(self, instruction : Instruction | DecodedInstruction):
+
+        # Decoding the Instruction Fields Once
+        instruction = instruction.decode()
+        mem_inst    = instruction.MEM_INSTRUCTION
+        pe_inst     = instruction.PE_INSTRUCTION
+        mem_opcode  = mem_inst.OPCODE
+        iterations  = instruction.COUNT + 1
+        self._cycle_count += get_instruction_cycles(instruction)
+
+        # Generating Every Address the Controller Steps Through (Wrapping at the Counter Bitwidth)
+        steps = np.arange(iterations, dtype=np.int64)
+        offset_mask = (1 << self._controller_config.COUNTER_BITWIDTH) - 1
+        mema_addresses = (mem_inst.MEMA_OFFSET + (steps * instruction.MEMA_INC)) & offset_mask
+        memb_addresses = (mem_inst.MEMB_OFFSET + (steps * instruction.MEMB_INC)) & offset_mask
+
+        # Determining the Buffer Outputs Seen by the PEs on Each Iteration
+        match mem_opcode:
+            case MI.READ:
+                mem0_words, mem1_words = self._read_memories(mema_addresses, memb_addresses, mem_inst.MODE_BITWIDTH)
+                repeat = 1
+            case MI.WRITE | MI.NOP:
+                mem0_words = self._mem0_output_port[np.newaxis, :]
+                mem1_words = self._mem1_output_port[np.newaxis, :]
+                repeat = iterations
+            case _:
+                raise ValueError(f"Invalid Opcode: {mem_opcode}")
+
+        # Executing the PE Operation for All Iterations at Once
+        output_before = self._output_value.reshape(-1).copy()
+        self._execute_pe_instruction(
+            pe_inst.OPCODE,
+            pe_inst.VALUE,
+            pe_inst.MODE_BITWIDTH,
+            mem0_words, mem1_words, repeat
+        )
+
+        # Writing the MEM2 Input Port, which Lags the PE Output by One Iteration
+        if mem_opcode == MI.WRITE:
+            self._mem2[mema_addresses[0]] = output_before
+            if iterations > 1:
+                self._mem2[mema_addresses[1:]] = self._output_value.reshape(-1)
+
+        # Latching the Final Buffer Outputs
+        if mem_opcode == MI.READ:
+            self._mem0_output_port = mem0_words[-1].copy()
+            self._mem1_output_port = mem1_words[-1].copy()
+
+    def _read_memories(self, mema_addresses : np.ndarray, memb_addresses : np.ndarray, mode_bitwidth : int) -> tuple[np.ndarray, np.ndarray]:
+
+        # Reading MEM0 Directly
+        mem0_words = gather_words(self._mem0, mema_addresses)
+
+        # Selecting the Addressed Sub-Word of MEM1 (Counted from the Least Significant Lane)
+        lane_count   = self._buffer_config.MEM1_BITWIDTH // mode_bitwidth
+        shift_amount = (lane_count - 1).bit_length()
+        memory_addresses = memb_addresses >> shift_amount
+        cut_indices      = memb_addresses - (memory_addresses << shift_amount)
+        mem1_lanes = words_to_lanes(gather_words(self._mem1, memory_addresses), mode_bitwidth)
+        selected   = mem1_lanes[np.arange(len(cut_indices)), lane_count - 1 - cut_indices]
+
+        # Broadcasting the Sub-Word Across the Whole Port
+        mem1_words = lanes_to_words(np.repeat(selected[:, np.newaxis], lane_count, axis=1), mode_bitwidth)
+        return mem0_words, mem1_words
+
+    def _execute_pe_instruction(
+        self,
+        opcode : int,
+        value : int,
+        mode_bitwidth : int,
+        mem0_words : np.ndarray,
+        mem1_words : np.ndarray,
+        repeat : int
+    ) -> None:
+        acc_bitwidth = mode_bitwidth * self._get_accumulation_ratio()
+        match opcode:
+            case PEI.NO_VALUE:
+                match value:
+                    case PEI.MAC:
+                        input_a = words_to_lanes(mem0_words.reshape(len(mem0_words), self._controller_config.PE_COUNT, -1), mode_bitwidth)
+                        input_b = words_to_lanes(mem1_words, mode_bitwidth)
+                        acc     = words_to_lanes(self._acc_value, acc_bitwidth)
+                        acc     = acc + (np.einsum('tpl,tl->pl', input_a, input_b) * repeat)
+                        self._acc_value = lanes_to_words(acc, acc_bitwidth)
+                    case PEI.NOP:
+                        return
+                    case PEI.OUT:
+                        acc = words_to_lanes(self._acc_value, acc_bitwidth)
+                        self._output_value = lanes_to_words(acc, mode_bitwidth)
+                    case PEI.PASS:
+                        input_a = words_to_lanes(mem0_words[-1].reshape(self._controller_config.PE_COUNT, -1), mode_bitwidth)
+                        self._acc_value = lanes_to_words(input_a, acc_bitwidth)
+                    case PEI.CLR:
+                        self._acc_value    = np.zeros_like(self._acc_value)
+                        self._output_value = np.zeros_like(self._output_value)
+                    case _:
+                        raise ValueError(f"Invalid Value for Opcode {PEI.NO_VALUE}: {value}.")
+            case PEI.RND:
+                acc = words_to_lanes(self._acc_value, acc_bitwidth)
+                self._acc_value = lanes_to_words(acc >> min(value * len(mem0_words) * repeat, 63), acc_bitwidth)
+            case _:
+                raise ValueError(f"Invalid Opcode: {opcode}")
+
+def check_numpy_configuration(controller_config : AcceleratorConfiguration) -> None:
+    pe_config     = controller_config.PE_CONFIG
+    buffer_config = controller_config.BUFFER_CONFIG
+
+    # Ensuring Every Memory and PE Register Maps onto Whole Bytes
+    for name, value in [
+        ("MEM0_BITWIDTH", buffer_config.MEM0_BITWIDTH),
+        ("MEM1_BITWIDTH", buffer_config.MEM1_BITWIDTH),
+        ("MEM2_BITWIDTH", buffer_config.MEM2_BITWIDTH),
+        ("ACCUMULATION_BITWIDTH", pe_config.ACCUMULATION_BITWIDTH)
+    ]:
+        if value % 8 != 0:
+            raise ValueError(f"{name} ({value}) must be a multiple of 8 for the NumPy accelerator.")
+
+    # Ensuring the Lanes of the Input, Accumulation and Output Registers Line Up
+    if pe_config.ACCUMULATION_BITWIDTH % pe_config.INPUT_BITWIDTH != 0:
+        raise ValueError(f"Accumulation bitwidth {pe_config.ACCUMULATION_BITWIDTH} must be a multiple of input bitwidth {pe_config.INPUT_BITWIDTH}.")
+    if pe_config.OUTPUT_BITWIDTH != pe_config.INPUT_BITWIDTH:
+        raise ValueError(f"Output bitwidth {pe_config.OUTPUT_BITWIDTH} must match input bitwidth {pe_config.INPUT_BITWIDTH} for the NumPy accelerator.")
+
+    # Ensuring Every Accumulation Lane Fits in a 64-bit Integer
+    if (Mode.INT32 * (pe_config.ACCUMULATION_BITWIDTH // pe_config.INPUT_BITWIDTH)) > 64:
+        raise ValueError(f"Accumulation lanes wider than 64 bits are not supported by the NumPy accelerator.")
@@ -0,0 +1,99 @@
+from .instruction import InstructionConfiguration, Instruction, DecodedInstruction, PEI, MI
+from .assembler import Assembler
+from .disassembler import Disassembler
+from .timing import TimingConfiguration, estimate_program_timing
+from dataclasses import dataclass
+import dataclasses
+
+# PE Operations that Load the Main Buffer Outputs into the Accumulators
+INPUT_PE_OPERATIONS = (PEI.MAC, PEI.PASS)
+
+@dataclass
+class OptimizationResult:
+    INSTRUCTIONS   : list[DecodedInstruction]
+    REMOVED_NOPS   : int
+    REMOVED_CLEARS : int
+    FUSED          : int
+    CYCLES_BEFORE  : int
+    CYCLES_AFTER   : int
+
+    def get_cycle_savings(self) -> int:
+        return self.CYCLES_BEFORE - self.CYCLES_AFTER
+
+def get_pe_operation(instruction : DecodedInstruction) -> int | None:
+    # The Value-less Operation, or None for Operations Carrying a Value (RND)
+    pe_inst = instruction.PE_INSTRUCTION
+    return pe_inst.VALUE if pe_inst.OPCODE == PEI.NO_VALUE else None
+
+def is_no_operation(instruction : DecodedInstruction) -> bool:
+    # Neither Slot Changes State (the Main Buffer Keeps its Outputs and the PEs Keep Every Register)
+    return (instruction.MEM_INSTRUCTION.OPCODE == MI.NOP) and (get_pe_operation(instruction) == PEI.NOP)
+
+def can_fuse(first : DecodedInstruction, second : DecodedInstruction) -> bool:
+
+    # Only Single Iteration Instructions with Complementary Empty Slots
+    if (first.COUNT != 0) or (second.COUNT != 0):
+        return False
+    if (get_pe_operation(first) != PEI.NOP) or (second.MEM_INSTRUCTION.OPCODE != MI.NOP):
+        return False
+
+    # Each Iteration Runs the Memory Slot Before the PE Slot, so a READ Still Feeds a MAC or PASS Moved in with it,
+    # and WRITE Stores the Outputs Latched by the Previous Iteration Either Way
+    return True
+
+def optimize_instructions(
+    instructions : list[Instruction | DecodedInstruction],
+    timing_config : TimingConfiguration = TimingConfiguration()
+) -> OptimizationResult:
+
+    # Walking the Program Once, Tracking Whether the Accumulators and Outputs are Known to be Zero
+    instructions = [elem.decode() for elem in instructions]
+    optimized    = []
+    removed_nops, removed_clears, fused = 0, 0, 0
+    cleared = False
+    for inst in instructions:
+        operation = get_pe_operation(inst)
+
+        # Clearing Registers Already Known to be Zero (Keeping Any Memory Operation in the Same Slot)
+        if cleared and (operation == PEI.CLR):
+            removed_clears += 1
+            inst = dataclasses.replace(inst, PE_INSTRUCTION=dataclasses.replace(inst.PE_INSTRUCTION, VALUE=PEI.NOP))
+            operation = PEI.NOP
+
+        # Dropping Instructions that Do Nothing
+        if is_no_operation(inst):
+            removed_nops += 1
+            continue
+
+        # Moving the PE Slot into the Free PE Slot of the Previous Instruction
+        if optimized and can_fuse(optimized[-1], inst):
+            fused += 1
+            optimized[-1] = dataclasses.replace(optimized[-1], PE_INSTRUCTION=inst.PE_INSTRUCTION)
+        else:
+            optimized.append(inst)
+
+        # Only MAC and PASS Load Non-Zero Values (OUT and RND of Zero Accumulators Leave Zeros)
+        if operation == PEI.CLR:
+            cleared = True
+        elif operation in INPUT_PE_OPERATIONS:
+            cleared = False
+
+    # Measuring the Savings with the Cycle Model
+    return OptimizationResult(
+        INSTRUCTIONS   = optimized,
+        REMOVED_NOPS   = removed_nops,
+        REMOVED_CLEARS = removed_clears,
+        FUSED          = fused,
+        CYCLES_BEFORE  = estimate_program_timing(instructions, timing_config).TOTAL_CYCLES,
+        CYCLES_AFTER   = estimate_program_timing(optimized, timing_config).TOTAL_CYCLES
+    )
+
+def optimize_assembly(
+    inst_config : InstructionConfiguration,
+    assembly : list[str],
+    timing_config : TimingConfiguration = TimingConfiguration()
+) -> tuple[list[str], OptimizationResult]:
+
+    # Optimizing the Assembled Program and Listing it Back as Assembly
+    result = optimize_instructions(Assembler(inst_config).assemble_instructions(assembly), timing_config)
+    return [Disassembler(inst_config).convert_instruction(elem) for elem in result.INSTRUCTIONS], result
@@ -0,0 +1,121 @@
+from .instruction import DecodedInstruction, MI, PEI, Mode
+import numpy as np
+
+
+class PerformanceCounters:
+
+    def __init__(
+        self,
+        pe_count : int,
+        pe_input_bitwidth : int
+    ):
+
+        # Saving the Array Shape
+        self._pe_count          = pe_count
+        self._pe_input_bitwidth = pe_input_bitwidth
+
+        # Instruction and Memory Traffic Counters
+        self._instructions      = 0
+        self._mem0_reads        = 0
+        self._mem1_reads        = 0
+        self._mem2_writes       = 0
+        self._buffer_nop_cycles = 0
+        self._pe_nop_cycles     = 0
+        self._nop_cycles        = 0
+
+        # Cycles Spent on Each PE Operation
+        self._pe_op_cycles = {elem : 0 for elem in PEI.STR_TO_OPCODE_DICT}
+
+        # Per PE MAC Counters for Each Mode (Cycles, and Lane Operations Within Them)
+        self._mac_cycles            = {elem : np.zeros(pe_count, dtype=np.int64) for elem in Mode.BITWIDTH_TO_STR_DICT}
+        self._zero_input_mac_cycles = {elem : np.zeros(pe_count, dtype=np.int64) for elem in Mode.BITWIDTH_TO_STR_DICT}
+        self._zero_input_lane_macs  = {elem : np.zeros(pe_count, dtype=np.int64) for elem in Mode.BITWIDTH_TO_STR_DICT}
+
+        # MAC Cycles Whose Operands Could Not be Inspected (Memories that are Not Whole Bytes)
+        self._unclassified_mac_cycles = {elem : np.zeros(pe_count, dtype=np.int64) for elem in Mode.BITWIDTH_TO_STR_DICT}
+
+    def record_instruction(self, instruction : DecodedInstruction) -> None:
+        iterations = instruction.COUNT + 1
+        mem_opcode = instruction.MEM_INSTRUCTION.OPCODE
+        pe_inst    = instruction.PE_INSTRUCTION
+        pe_op      = get_pe_op_name(pe_inst.OPCODE, pe_inst.VALUE)
+        self._instructions += 1
+
+        # Counting Buffer Traffic (a READ Reads Both Input Memories Every Iteration)
+        match mem_opcode:
+            case MI.READ:
+                self._mem0_reads += iterations
+                self._mem1_reads += iterations
+            case MI.WRITE:
+                self._mem2_writes += iterations
+            case MI.NOP:
+                self._buffer_nop_cycles += iterations
+
+        # Counting PE Operations and Cycles Where Neither Unit Does Anything
+        if pe_op is not None:
+            self._pe_op_cycles[pe_op] += iterations
+        if pe_op == 'NOP':
+            self._pe_nop_cycles += iterations
+            if mem_opcode == MI.NOP:
+                self._nop_cycles += iterations
+
+    def record_macs(self, mode_bitwidth : int, matrix_lanes : np.ndarray, repeat : int = 1) -> None:
+
+        # Matrix Lanes Hold One Row per Cycle of Every PE's Input Lanes (Cycles x PEs x Lanes)
+        if mode_bitwidth not in self._mac_cycles:
+            return
+        zero_lanes = (matrix_lanes == 0)
+        self._mac_cycles[mode_bitwidth]            += len(matrix_lanes) * repeat
+        self._zero_input_mac_cycles[mode_bitwidth] += zero_lanes.all(axis=2).sum(axis=0) * repeat
+        self._zero_input_lane_macs[mode_bitwidth]  += zero_lanes.sum(axis=2).sum(axis=0) * repeat
+
+    def record_unclassified_macs(self, mode_bitwidth : int, cycles : int) -> None:
+        # Counted as Issued, but Left Out of the Zero Operand Statistics
+        if mode_bitwidth not in self._mac_cycles:
+            return
+        self._mac_cycles[mode_bitwidth]              += cycles
+        self._unclassified_mac_cycles[mode_bitwidth] += cycles
+
+    def to_dict(self, cycles : int) -> dict:
+
+        # Reporting Each Mode by Name
+        mac_cycles, lane_macs, zero_input_mac_cycles, zero_input_lane_macs, unclassified_mac_cycles = {}, {}, {}, {}, {}
+        for mode_bitwidth, mode_str in Mode.BITWIDTH_TO_STR_DICT.items():
+            lanes = self._pe_input_bitwidth // mode_bitwidth
+            mac_cycles[mode_str]              = self._mac_cycles[mode_bitwidth].tolist()
+            lane_macs[mode_str]               = (self._mac_cycles[mode_bitwidth] * lanes).tolist()
+            zero_input_mac_cycles[mode_str]   = self._zero_input_mac_cycles[mode_bitwidth].tolist()
+            zero_input_lane_macs[mode_str]    = self._zero_input_lane_macs[mode_bitwidth].tolist()
+            unclassified_mac_cycles[mode_str] = self._unclassified_mac_cycles[mode_bitwidth].tolist()
+
+        # Fraction of Inspected Lane MACs with a Non-Zero Matrix Operand (Padded Rows and Genuine Zero Values Look Alike)
+        total_lane_macs = sum([
+            int(((self._mac_cycles[elem] - self._unclassified_mac_cycles[elem]) * (self._pe_input_bitwidth // elem)).sum()) for elem in Mode.BITWIDTH_TO_STR_DICT
+        ])
+        total_zero_macs = sum([sum(elem) for elem in zero_input_lane_macs.values()])
+        nonzero_operand_fraction = ((total_lane_macs - total_zero_macs) / total_lane_macs) if total_lane_macs else 0.0
+
+        return {
+            "instructions"             : self._instructions,
+            "cycles"                   : cycles,
+            "pe_count"                 : self._pe_count,
+            "mem0_reads"               : self._mem0_reads,
+            "mem1_reads"               : self._mem1_reads,
+            "mem2_writes"              : self._mem2_writes,
+            "buffer_nop_cycles"        : self._buffer_nop_cycles,
+            "pe_nop_cycles"            : self._pe_nop_cycles,
+            "nop_cycles"               : self._nop_cycles,
+            "pe_op_cycles"             : dict(self._pe_op_cycles),
+            "mac_cycles"               : mac_cycles,
+            "lane_macs"                : lane_macs,
+            "zero_input_mac_cycles"    : zero_input_mac_cycles,
+            "zero_input_lane_macs"     : zero_input_lane_macs,
+            "unclassified_mac_cycles"  : unclassified_mac_cycles,
+            "nonzero_operand_fraction" : nonzero_operand_fraction
+        }
+
+def get_pe_op_name(opcode : int, value : int) -> str | None:
+    for name, encoding in PEI.STR_TO_OPCODE_DICT.items():
+        if (encoding[0] == opcode) and ((len(encoding) == 1) or (encoding[1] == value)):
+            return name
+    return None
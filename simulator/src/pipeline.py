@@ -0,0 +1,221 @@
+from .configuration import AcceleratorConfiguration
+from .assembler import Assembler
+from .build_cache import BuildCache, cache_key, run_cached
+from .compiler import generate_accelerator_and_instruction_configuration, compile_matrix_vector_multiplication_words, extract_results_from_memory
+from .defines import generate_defines
+from .encoding import values_to_words
+from .instruction import InstructionConfiguration, InstructionEncoding, Mode
+from .matrix_generator import generate_random_matrix
+from .memory_image import configuration_hash, save_bit_words, save_bit_stream
+from dataclasses import dataclass, asdict
+from bitstring import Bits
+import numpy as np
+import os
+
+# Files the RTL Testbench Reads, Named as the Equivalence Makefile Names Them
+PIPELINE_FILE_NAMES = {
+    "instructions" : "inst.bits",
+    "mem0"         : "mem0.bits",
+    "mem1"         : "mem1.bits",
+    "assembly"     : "mat_mul.asm"
+}
+
+@dataclass
+class PipelineConfiguration:
+    ROWS                     : int
+    COLS                     : int
+    PRECISION                : int = Mode.INT8
+    MIN_VALUE                : int = -5
+    MAX_VALUE                : int = 5
+    MATRIX_SEED              : int = 0
+    VECTOR_SEED              : int = 12345
+    PE_COUNT                 : int = 16
+    PE_INPUT_BITWIDTH        : int = 32
+    PE_ACCUMULATION_BITWIDTH : int = 64
+    PE_OUTPUT_BITWIDTH       : int = 32
+    COUNTER_BITWIDTH         : int = 16
+    IMEM_DEPTH               : int = 128
+
+    def get_configurations(self) -> tuple[AcceleratorConfiguration, InstructionConfiguration]:
+        return generate_accelerator_and_instruction_configuration(
+            processing_element_count=self.PE_COUNT,
+            processing_element_input_bitwidth=self.PE_INPUT_BITWIDTH,
+            processing_element_accumulation_bitwidth=self.PE_ACCUMULATION_BITWIDTH,
+            processing_element_output_bitwidth=self.PE_OUTPUT_BITWIDTH,
+            controller_counter_bitwidth=self.COUNTER_BITWIDTH
+        )
+
+@dataclass
+class PipelineResult:
+    ACCEL_CONFIG : AcceleratorConfiguration
+    INST_CONFIG  : InstructionConfiguration
+    MATRIX       : np.ndarray
+    VECTOR       : np.ndarray
+    MEM0         : np.ndarray
+    MEM1         : np.ndarray
+    ASSEMBLY     : list[str]
+    INSTRUCTIONS : np.ndarray
+    DEFINES      : str
+    MEM2         : list[Bits]
+    RESULT       : np.ndarray
+    GOLD         : np.ndarray
+
+    def is_correct(self) -> bool:
+        return bool(np.array_equal(self.RESULT, self.GOLD))
+
+    def get_instruction_count(self) -> int:
+        return len(self.ASSEMBLY)
+
+def assemble_program(inst_config : InstructionConfiguration, assembly : list[str], imem_depth : int) -> np.ndarray:
+
+    # Encoding Every Instruction at Once and Padding with Zero Words to the Instruction Memory Depth
+    encoding = InstructionEncoding(inst_config)
+    values   = encoding.encode_array(Assembler(inst_config).assemble_instructions(assembly))
+    padding  = np.zeros(max(0, imem_depth - len(values)), dtype=encoding.get_layout().get_dtype())
+    return np.concatenate([values, padding])
+
+def simulate_program(
+    accel_config : AcceleratorConfiguration,
+    inst_config : InstructionConfiguration,
+    mem0 : np.ndarray,
+    mem1 : np.ndarray,
+    instructions : np.ndarray,
+    backend : str = None,
+    fast_forward : bool = False
+) -> list[Bits]:
+
+    # Loading the Simulator Only When Simulating, so Compile-Only Tools Stay Light
+    from .backends import create_accelerator
+
+    # Executing Up to the First Zero Word, as ivd-sim and the Testbench Do
+    zeros   = np.flatnonzero(instructions == 0)
+    program = instructions[:int(zeros[0])] if len(zeros) else instructions
+    accelerator = create_accelerator(accel_config, backend, fast_forward)
+    accelerator.set_memory_words(mem0, mem1)
+    accelerator.execute_instructions(InstructionEncoding(inst_config).decode_array(program))
+    return accelerator.get_mem2()
+
+def run_pipeline(
+    config : PipelineConfiguration,
+    matrix : np.ndarray = None,
+    vector : np.ndarray = None,
+    backend : str = None,
+    fast_forward : bool = False
+) -> PipelineResult:
+
+    # Deriving the Configuration Once for Every Stage
+    accel_config, inst_config = config.get_configurations()
+
+    # Generating the Operands (as ivd-mg Would) Unless Given
+    if matrix is None:
+        matrix = generate_random_matrix(config.ROWS, config.COLS, config.MIN_VALUE, config.MAX_VALUE, config.MATRIX_SEED)
+    if vector is None:
+        vector = generate_random_matrix(config.COLS, 1, config.MIN_VALUE, config.MAX_VALUE, config.VECTOR_SEED)
+
+    # Compiling, Assembling and Generating the Defines (as ivd-cc, ivd-as and ivd-gv Would)
+    mem0, mem1, assembly, row_count = compile_matrix_vector_multiplication_words(matrix, vector, accel_config, config.PRECISION)
+    instructions = assemble_program(inst_config, assembly, config.IMEM_DEPTH)
+    defines      = generate_defines(accel_config, inst_config, config.IMEM_DEPTH)
+
+    # Simulating (as ivd-sim Would) and Checking Against the Gold Result
+    mem2 = simulate_program(accel_config, inst_config, mem0, mem1, instructions, backend, fast_forward)
+    return PipelineResult(
+        ACCEL_CONFIG = accel_config,
+        INST_CONFIG  = inst_config,
+        MATRIX       = matrix,
+        VECTOR       = vector,
+        MEM0         = mem0,
+        MEM1         = mem1,
+        ASSEMBLY     = assembly,
+        INSTRUCTIONS = instructions,
+        DEFINES      = defines,
+        MEM2         = mem2,
+        RESULT       = extract_results_from_memory(mem2, row_count, accel_config, config.PRECISION),
+        GOLD         = (np.asarray(matrix) @ np.asarray(vector)).flatten()
+    )
+
+def save_pipeline_outputs(
+    result : PipelineResult,
+    out_dir : str,
+    defines_file : str = None,
+    out_file : str = None,
+    save_assembly : bool = False,
+    file_format : str = "ascii"
+) -> list[str]:
+
+    # Writing Only the Collateral the Testbench Reads (Plus the Optional Assembly Listing)
+    os.makedirs(out_dir, exist_ok=True)
+    config_hash   = configuration_hash(result.ACCEL_CONFIG, result.INST_CONFIG)
+    buffer_config = result.ACCEL_CONFIG.BUFFER_CONFIG
+    width         = InstructionEncoding(result.INST_CONFIG).WIDTH
+    file_names    = {name : os.path.join(out_dir, elem) for name, elem in PIPELINE_FILE_NAMES.items()}
+    save_bit_words(file_names["instructions"], values_to_words(result.INSTRUCTIONS, width), width, file_format, config_hash)
+    save_bit_words(file_names["mem0"], result.MEM0, buffer_config.MEM0_BITWIDTH, file_format, config_hash)
+    save_bit_words(file_names["mem1"], result.MEM1, buffer_config.MEM1_BITWIDTH, file_format, config_hash)
+    written = [file_names["instructions"], file_names["mem0"], file_names["mem1"]]
+    if save_assembly:
+        with open(file_names["assembly"], "w") as file:
+            file.write("".join([f"{elem}\n" for elem in result.ASSEMBLY]))
+        written.append(file_names["assembly"])
+
+    # The Defines and the Simulated MEM2 the Hardware Result is Compared Against
+    if defines_file is not None:
+        with open(defines_file, "w") as file:
+            file.write(result.DEFINES)
+        written.append(defines_file)
+    if out_file is not None:
+        save_bit_stream(out_file, result.MEM2, buffer_config.MEM2_BITWIDTH, file_format, config_hash)
+        written.append(out_file)
+    return written
+
+def get_pipeline_report(result : PipelineResult, imem_depth : int) -> str:
+
+    # Reporting the Program Size and Whether the Simulator Matches the Gold Result
+    report = ""
+    if result.get_instruction_count() > imem_depth:
+        report += f"WARNING: {result.get_instruction_count()} instructions do not fit the instruction memory depth of {imem_depth}.\n"
+    return report + f"{result.get_instruction_count()} instructions simulated, result matches the gold result.\n"
+
+def run_and_save_pipeline(
+    config : PipelineConfiguration,
+    out_dir : str,
+    defines_file : str = None,
+    out_file : str = None,
+    save_assembly : bool = False,
+    file_format : str = "ascii",
+    matrix_file : str = None,
+    vector_file : str = None,
+    backend : str = None,
+    fast_forward : bool = False,
+    cache : BuildCache = None
+) -> bool:
+
+    # Naming Every File the Run Writes (the Requested Set is Part of the Key, as for ivd-cc)
+    os.makedirs(out_dir, exist_ok=True)
+    names   = ["instructions", "mem0", "mem1"] + (["assembly"] if save_assembly else [])
+    outputs = {PIPELINE_FILE_NAMES[elem] : os.path.join(out_dir, PIPELINE_FILE_NAMES[elem]) for elem in names}
+    if defines_file is not None:
+        outputs["defines.sv"] = defines_file
+    if out_file is not None:
+        outputs["out.bits"] = out_file
+
+    # Keying on the Configuration (Including the Generator Seeds and Range) and Any Operand Files
+    input_files = [elem for elem in [matrix_file, vector_file] if elem is not None]
+    params      = {"config" : asdict(config), "format" : file_format, "outputs" : sorted(outputs)}
+
+    # A Result that Disagrees with the Gold Result is Still Written for Debugging, but Never Cached
+    def build() -> str:
+        matrix = np.load(matrix_file) if matrix_file is not None else None
+        vector = np.load(vector_file) if vector_file is not None else None
+        result = run_pipeline(config, matrix, vector, backend, fast_forward)
+        save_pipeline_outputs(result, out_dir, defines_file, out_file, save_assembly, file_format)
+        if not result.is_correct():
+            raise ValueError("The simulated result does not match the gold result.")
+        return get_pipeline_report(result, config.IMEM_DEPTH)
+
+    return run_cached(
+        cache,
+        lambda: cache_key(__file__, params, config.get_configurations(), input_files),
+        outputs,
+        build
+    )
@@ -1,12 +1,6 @@
 from bitstring import Bits
-from .instruction import ProcessingElementInstruction, PEI
-from dataclasses import dataclass
-
-@dataclass
-class ProcessingElementConfiguration:
-    INPUT_BITWIDTH        : int
-    ACCUMULATION_BITWIDTH : int
-    OUTPUT_BITWIDTH       : int
+from .instruction import ProcessingElementInstruction, DecodedProcessingElementInstruction, PEI
+from .configuration import ProcessingElementConfiguration
 
 class ProcessingElement:
 
@@ -32,64 +26,220 @@ class ProcessingElement:
         self._input_b_value = value
 
     # Handling Each Instruction
-    def execute_instruction(self, instruction : ProcessingElementInstruction) -> None:
-        match int(instruction.get_opcode().uint):
-            case PEI.NO_VALUE:
-                match int(instruction.get_value().uint):
-                    case PEI.MAC:
-                        self._handle_mac(instruction)
-                    case PEI.NOP:
-                        return
-                    case PEI.OUT:
-                        self._handle_out(instruction)
-                    case PEI.PASS:
-                        self._handle_pass(instruction)
-                    case PEI.CLR:
-                        self._handle_clr(instruction)
-                    case _:
-                        raise ValueError(f"Invalid Value for Opcode {PEI.NOP_OUT} (NOP/OUT): {int(instruction.get_value().uint)}, should be {PEI.OUT} or {PEI.NOP}.")
-            case PEI.RND:
-                self._handle_rnd(instruction)
-            case _:
-                raise ValueError(f"Invalid Opcode: {int(instruction.get_opcode().uint)}")
-
-    def _handle_mac(self, instruction : ProcessingElementInstruction):
+    def execute_instruction(self, instruction : ProcessingElementInstruction | DecodedProcessingElementInstruction) -> None:
+        instruction = instruction.decode()
+        handler = self._INSTRUCTION_HANDLERS.get(instruction.OPCODE)
+        if handler is None:
+            raise ValueError(f"Invalid Opcode: {instruction.OPCODE}")
+        handler(self, instruction)
+
+    def _handle_no_value(self, instruction : DecodedProcessingElementInstruction) -> None:
+        handler = self._NO_VALUE_HANDLERS.get(instruction.VALUE)
+        if handler is None:
+            raise ValueError(f"Invalid Value for Opcode {PEI.NO_VALUE}: {instruction.VALUE}.")
+        handler(self, instruction)
+
+    def _handle_mac(self, instruction : DecodedProcessingElementInstruction):
 
         # Splitting the Bitstring on the Mode
-        sectioned_input_a      = [elem for elem in self._input_a_value.cut(instruction.get_mode_bitwidth())]
-        sectioned_input_b      = [elem for elem in self._input_b_value.cut(instruction.get_mode_bitwidth())]
-        sectioned_accumulation = [elem for elem in self._acc_value.cut(instruction.get_mode_bitwidth() * (self._config.ACCUMULATION_BITWIDTH // self._config.INPUT_BITWIDTH))]
+        acc_length = instruction.MODE_BITWIDTH * (self._config.ACCUMULATION_BITWIDTH // self._config.INPUT_BITWIDTH)
+        sectioned_input_a      = [elem for elem in self._input_a_value.cut(instruction.MODE_BITWIDTH)]
+        sectioned_input_b      = [elem for elem in self._input_b_value.cut(instruction.MODE_BITWIDTH)]
+        sectioned_accumulation = [elem for elem in self._acc_value.cut(acc_length)]
 
         # Performing MAC for each element
         for i in range(len(sectioned_input_a)):
             result = sectioned_accumulation[i].int + (sectioned_input_a[i].int * sectioned_input_b[i].int)
-            sectioned_accumulation[i] = Bits(int=result, length=(instruction.get_mode_bitwidth() * (self._config.ACCUMULATION_BITWIDTH // self._config.INPUT_BITWIDTH)))
+            sectioned_accumulation[i] = Bits(int=result, length=acc_length)
 
         # Storing the Result in the Accumulation
         self._acc_value = Bits().join(sectioned_accumulation)
 
-    def _handle_out(self, instruction : ProcessingElementInstruction):
-        sectioned_accumulation = [elem for elem in self._acc_value.cut(instruction.get_mode_bitwidth() * (self._config.ACCUMULATION_BITWIDTH // self._config.INPUT_BITWIDTH))]
-        sectioned_output = [elem[(-1 * instruction.get_mode_bitwidth()):] for elem in sectioned_accumulation]
+    def _handle_nop(self, instruction : DecodedProcessingElementInstruction):
+        return
+
+    def _handle_out(self, instruction : DecodedProcessingElementInstruction):
+        acc_length = instruction.MODE_BITWIDTH * (self._config.ACCUMULATION_BITWIDTH // self._config.INPUT_BITWIDTH)
+        sectioned_accumulation = [elem for elem in self._acc_value.cut(acc_length)]
+        sectioned_output = [elem[(-1 * instruction.MODE_BITWIDTH):] for elem in sectioned_accumulation]
         self._output_value = Bits().join(sectioned_output)
 
-    def _handle_pass(self, instruction : ProcessingElementInstruction):
-        sectioned_input_a      = [elem for elem in self._input_a_value.cut(instruction.get_mode_bitwidth())]
-        acc_length = instruction.get_mode_bitwidth() * (self._config.ACCUMULATION_BITWIDTH // self._config.INPUT_BITWIDTH)
+    def _handle_pass(self, instruction : DecodedProcessingElementInstruction):
+        sectioned_input_a = [elem for elem in self._input_a_value.cut(instruction.MODE_BITWIDTH)]
+        acc_length = instruction.MODE_BITWIDTH * (self._config.ACCUMULATION_BITWIDTH // self._config.INPUT_BITWIDTH)
         self._acc_value = Bits().join([Bits(int=elem.int, length=acc_length) for elem in sectioned_input_a])
 
-    def _handle_clr(self, instruction : ProcessingElementInstruction):
+    def _handle_clr(self, instruction : DecodedProcessingElementInstruction):
         self._acc_value    = Bits(uint=0, length=self._config.ACCUMULATION_BITWIDTH)
         self._output_value = Bits(uint=0, length=self._config.OUTPUT_BITWIDTH)
 
-    def _handle_rnd(self, instruction : ProcessingElementInstruction):
-        sectioned_accumulation = [elem.int for elem in self._acc_value.cut(instruction.get_mode_bitwidth() * (self._config.ACCUMULATION_BITWIDTH // self._config.INPUT_BITWIDTH))]
-        shifted_accumulation = [elem // (2 ** instruction.get_value().uint) for elem in sectioned_accumulation]
-        acc_length = instruction.get_mode_bitwidth() * (self._config.ACCUMULATION_BITWIDTH // self._config.INPUT_BITWIDTH)
+    def _handle_rnd(self, instruction : DecodedProcessingElementInstruction):
+        acc_length = instruction.MODE_BITWIDTH * (self._config.ACCUMULATION_BITWIDTH // self._config.INPUT_BITWIDTH)
+        sectioned_accumulation = [elem.int for elem in self._acc_value.cut(acc_length)]
+        shifted_accumulation = [elem // (2 ** instruction.VALUE) for elem in sectioned_accumulation]
         self._acc_value = Bits().join([Bits(int=elem, length=acc_length) for elem in shifted_accumulation])
 
+    # Dispatch Tables from Opcode (and Value for Value-less Opcodes) to Handler
+    _NO_VALUE_HANDLERS = {
+        PEI.MAC  : _handle_mac,
+        PEI.NOP  : _handle_nop,
+        PEI.OUT  : _handle_out,
+        PEI.PASS : _handle_pass,
+        PEI.CLR  : _handle_clr
+    }
+    _INSTRUCTION_HANDLERS = {
+        PEI.NO_VALUE : _handle_no_value,
+        PEI.RND      : _handle_rnd
+    }
+
     def get_output(self) -> Bits:
         return self._output_value
 
     def get_accumulation(self) -> Bits:
         return self._acc_value
+
+    def set_accumulation(self, value : Bits) -> None:
+        self._acc_value = value
+
+
+class IntegerProcessingElement:
+
+    # Fixed Attribute Set Keeps Per-PE Memory and Attribute Access Cheap
+    __slots__ = (
+        '_config',
+        '_acc_ratio',
+        '_input_a_value',
+        '_input_b_value',
+        '_acc_value',
+        '_output_value'
+    )
+
+    def __init__(
+        self,
+        config : ProcessingElementConfiguration,
+        default_value = 0
+    ):
+
+        # Saving Inputs
+        self._config    = config
+        self._acc_ratio = self._config.ACCUMULATION_BITWIDTH // self._config.INPUT_BITWIDTH
+
+        # Storing Every Register as an Unsigned Integer of its Bitwidth
+        self._input_a_value = default_value & ((1 << self._config.INPUT_BITWIDTH) - 1)
+        self._input_b_value = default_value & ((1 << self._config.INPUT_BITWIDTH) - 1)
+        self._acc_value     = default_value & ((1 << self._config.ACCUMULATION_BITWIDTH) - 1)
+        self._output_value  = default_value & ((1 << self._config.OUTPUT_BITWIDTH) - 1)
+
+    def input_a(self, value : Bits) -> None:
+        self._input_a_value = value.uint
+
+    def input_b(self, value : Bits) -> None:
+        self._input_b_value = value.uint
+
+    def input_a_uint(self, value : int) -> None:
+        self._input_a_value = value
+
+    def input_b_uint(self, value : int) -> None:
+        self._input_b_value = value
+
+    # Handling Each Instruction
+    def execute_instruction(self, instruction : ProcessingElementInstruction | DecodedProcessingElementInstruction) -> None:
+        instruction = instruction.decode()
+        handler = self._INSTRUCTION_HANDLERS.get(instruction.OPCODE)
+        if handler is None:
+            raise ValueError(f"Invalid Opcode: {instruction.OPCODE}")
+        handler(self, instruction)
+
+    def _handle_no_value(self, instruction : DecodedProcessingElementInstruction) -> None:
+        handler = self._NO_VALUE_HANDLERS.get(instruction.VALUE)
+        if handler is None:
+            raise ValueError(f"Invalid Value for Opcode {PEI.NO_VALUE}: {instruction.VALUE}.")
+        handler(self, instruction)
+
+    def _handle_mac(self, instruction : DecodedProcessingElementInstruction) -> None:
+
+        # Masks and Sign Bits for the Input and Accumulation Lanes
+        mode_bitwidth = instruction.MODE_BITWIDTH
+        acc_bitwidth  = mode_bitwidth * self._acc_ratio
+        input_mask, input_sign = (1 << mode_bitwidth) - 1, 1 << (mode_bitwidth - 1)
+        acc_mask,   acc_sign   = (1 << acc_bitwidth) - 1,  1 << (acc_bitwidth - 1)
+
+        # Performing MAC for each Lane, Starting from the Least Significant
+        result = 0
+        for lane in range(self._config.INPUT_BITWIDTH // mode_bitwidth):
+            a   = (((self._input_a_value >> (lane * mode_bitwidth)) & input_mask) ^ input_sign) - input_sign
+            b   = (((self._input_b_value >> (lane * mode_bitwidth)) & input_mask) ^ input_sign) - input_sign
+            acc = (((self._acc_value     >> (lane * acc_bitwidth))  & acc_mask)   ^ acc_sign)   - acc_sign
+            result |= ((acc + (a * b)) & acc_mask) << (lane * acc_bitwidth)
+        self._acc_value = result
+
+    def _handle_nop(self, instruction : DecodedProcessingElementInstruction) -> None:
+        return
+
+    def _handle_out(self, instruction : DecodedProcessingElementInstruction) -> None:
+
+        # Keeping the Low Bits of Each Accumulation Lane
+        mode_bitwidth = instruction.MODE_BITWIDTH
+        acc_bitwidth  = mode_bitwidth * self._acc_ratio
+        output_mask   = (1 << mode_bitwidth) - 1
+        result = 0
+        for lane in range(self._config.INPUT_BITWIDTH // mode_bitwidth):
+            result |= ((self._acc_value >> (lane * acc_bitwidth)) & output_mask) << (lane * mode_bitwidth)
+        self._output_value = result
+
+    def _handle_pass(self, instruction : DecodedProcessingElementInstruction) -> None:
+
+        # Sign Extending Each Input Lane into its Accumulation Lane
+        mode_bitwidth = instruction.MODE_BITWIDTH
+        acc_bitwidth  = mode_bitwidth * self._acc_ratio
+        input_mask, input_sign = (1 << mode_bitwidth) - 1, 1 << (mode_bitwidth - 1)
+        acc_mask = (1 << acc_bitwidth) - 1
+        result = 0
+        for lane in range(self._config.INPUT_BITWIDTH // mode_bitwidth):
+            a = (((self._input_a_value >> (lane * mode_bitwidth)) & input_mask) ^ input_sign) - input_sign
+            result |= (a & acc_mask) << (lane * acc_bitwidth)
+        self._acc_value = result
+
+    def _handle_clr(self, instruction : DecodedProcessingElementInstruction) -> None:
+        self._acc_value    = 0
+        self._output_value = 0
+
+    def _handle_rnd(self, instruction : DecodedProcessingElementInstruction) -> None:
+
+        # Arithmetic Shift of Each Accumulation Lane
+        mode_bitwidth = instruction.MODE_BITWIDTH
+        acc_bitwidth  = mode_bitwidth * self._acc_ratio
+        acc_mask, acc_sign = (1 << acc_bitwidth) - 1, 1 << (acc_bitwidth - 1)
+        result = 0
+        for lane in range(self._config.INPUT_BITWIDTH // mode_bitwidth):
+            acc = (((self._acc_value >> (lane * acc_bitwidth)) & acc_mask) ^ acc_sign) - acc_sign
+            result |= ((acc >> instruction.VALUE) & acc_mask) << (lane * acc_bitwidth)
+        self._acc_value = result
+
+    # Dispatch Tables from Opcode (and Value for Value-less Opcodes) to Handler
+    _NO_VALUE_HANDLERS = {
+        PEI.MAC  : _handle_mac,
+        PEI.NOP  : _handle_nop,
+        PEI.OUT  : _handle_out,
+        PEI.PASS : _handle_pass,
+        PEI.CLR  : _handle_clr
+    }
+    _INSTRUCTION_HANDLERS = {
+        PEI.NO_VALUE : _handle_no_value,
+        PEI.RND      : _handle_rnd
+    }
+
+    def get_output(self) -> Bits:
+        return Bits(uint=self._output_value, length=self._config.OUTPUT_BITWIDTH)
+
+    def get_accumulation(self) -> Bits:
+        return Bits(uint=self._acc_value, length=self._config.ACCUMULATION_BITWIDTH)
+
+    def get_output_uint(self) -> int:
+        return self._output_value
+
+    def get_accumulation_uint(self) -> int:
+        return self._acc_value
+
+    def set_accumulation(self, value : Bits) -> None:
+        self._acc_value = value.uint
@@ -0,0 +1,88 @@
+from .instruction import Instruction, DecodedInstruction, PEI, MI
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+
+# Zero Words the Testbench Needs After Each Segment to Stop the Controller
+SEGMENT_TERMINATOR_WORDS = 1
+
+@dataclass
+class ProgramSegment:
+    START            : int
+    INSTRUCTIONS     : list[Instruction | DecodedInstruction]
+    CARRIES_PE_STATE : bool
+
+    def get_length(self) -> int:
+        return len(self.INSTRUCTIONS)
+
+def get_segment_capacity(imem_depth : int) -> int:
+    capacity = imem_depth - SEGMENT_TERMINATOR_WORDS
+    if capacity < 1:
+        raise ValueError(f"Instruction memory depth {imem_depth} cannot hold an instruction and its terminating zero word.")
+    return capacity
+
+def is_clear(instruction : Instruction | DecodedInstruction) -> bool:
+    pe_inst = instruction.decode().PE_INSTRUCTION
+    return (pe_inst.OPCODE == PEI.NO_VALUE) and (pe_inst.VALUE == PEI.CLR)
+
+def is_segment_boundary(previous : Instruction | DecodedInstruction | None, instruction : Instruction | DecodedInstruction) -> bool:
+
+    # Nothing in the PEs Outlives a Reload Just After a Clear, or Before One Unless the Same Slot Writes the Previous Outputs
+    if (previous is not None) and is_clear(previous):
+        return True
+    return is_clear(instruction) and (instruction.decode().MEM_INSTRUCTION.OPCODE != MI.WRITE)
+
+def partition_program(
+    instructions : list[Instruction | DecodedInstruction],
+    imem_depth : int
+) -> list[ProgramSegment]:
+    return list(iterate_program_segments(instructions, imem_depth))
+
+def iterate_program_segments(
+    instructions : Iterable[Instruction | DecodedInstruction],
+    imem_depth : int
+) -> Iterator[ProgramSegment]:
+
+    # Filling Each Segment Up to the Instruction Memory, then Backing Off to the Last Point Around an Accumulator Clear
+    # (Only One Segment and the Instruction After it are Buffered, so Programs Stream Through)
+    capacity   = get_segment_capacity(imem_depth)
+    pending    = []
+    boundaries = []
+    start      = 0
+    previous   = None
+    for instruction in instructions:
+        pending.append(instruction)
+        boundaries.append(is_segment_boundary(previous, instruction))
+        previous = instruction
+        if len(pending) <= capacity:
+            continue
+        stop = next((index for index in range(capacity, 0, -1) if boundaries[index]), capacity)
+
+        # MEM0, MEM1 and MEM2 Always Carry Over; PE Registers Only Do When No Clear Fell Inside the Window
+        yield ProgramSegment(start, pending[:stop], not boundaries[stop])
+        start     += stop
+        pending    = pending[stop:]
+        boundaries = boundaries[stop:]
+    if pending:
+        yield ProgramSegment(start, pending, False)
+
+def iterate_segments(values : Iterable[int], imem_depth : int) -> Iterator[list[int]]:
+
+    # Each Instruction Memory Image Runs Up to its First Zero Word; an Image Starting with Zero Ends the Program
+    segment   = []
+    in_image  = 0
+    running   = True
+    for value in values:
+        if running and (value != 0):
+            segment.append(value)
+        elif running:
+            if in_image == 0:
+                return
+            running = False
+        in_image += 1
+        if in_image == imem_depth:
+            yield segment
+            segment  = []
+            in_image = 0
+            running  = True
+    if segment:
+        yield segment
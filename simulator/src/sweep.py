@@ -0,0 +1,170 @@
+from .backends import AUTO_BACKEND, create_accelerator, get_default_backend
+from .assembler import Assembler
+from .instruction import Mode
+from .timing import estimate_program_timing
+from .compiler import generate_accelerator_and_instruction_configuration, compile_matrix_vector_multiplication, extract_results_from_memory
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, astuple
+from typing import Iterator
+import itertools
+import json
+import csv
+import os
+import time
+import numpy as np
+
+# Columns Written for Every Point (Point Fields First so a Row Identifies its Point)
+SWEEP_POINT_FIELDS  = ["rows", "cols", "precision", "pe_count", "counter_bitwidth", "seed"]
+SWEEP_RESULT_FIELDS = SWEEP_POINT_FIELDS + ["passed", "wall_time", "simulated_cycles", "error"]
+
+@dataclass(frozen=True)
+class SweepPoint:
+    ROWS             : int
+    COLS             : int
+    PRECISION        : int
+    PE_COUNT         : int
+    COUNTER_BITWIDTH : int
+    SEED             : int
+
+def generate_sweep_points(
+    rows : list[int],
+    cols : list[int],
+    precisions : list[int],
+    pe_counts : list[int],
+    counter_bitwidths : list[int],
+    seeds : list[int]
+) -> list[SweepPoint]:
+    return [
+        SweepPoint(*elem) for elem in itertools.product(rows, cols, precisions, pe_counts, counter_bitwidths, seeds)
+    ]
+
+def run_sweep_point(point : SweepPoint, fast_forward : bool = False, backend : str = None, min_value = -5, max_value = 5) -> dict:
+    start_time = time.perf_counter()
+    result = dict(zip(SWEEP_POINT_FIELDS, astuple(point)))
+    try:
+
+        # Configuring
+        accel_config, inst_config = generate_accelerator_and_instruction_configuration(
+            processing_element_count=point.PE_COUNT,
+            controller_counter_bitwidth=point.COUNTER_BITWIDTH
+        )
+        assembler = Assembler(inst_config)
+
+        # Generating the Computation and its Gold Result
+        np.random.seed(point.SEED)
+        matrix = np.random.randint(min_value, max_value, size=(point.ROWS, point.COLS))
+        vector = np.random.randint(min_value, max_value, size=(point.COLS, 1))
+        gold_result = (matrix @ vector).flatten()
+
+        # Compiling, Assembling and Simulating
+        mem0, mem1, instructions, num_elements = compile_matrix_vector_multiplication(
+            matrix, vector, accel_config, point.PRECISION
+        )
+        program = [elem.decode() for elem in assembler.assemble_instructions(instructions)]
+        # Sweeps Default to the Fastest Engine, the Reference Model Remains Available by Name
+        accel = create_accelerator(accel_config, get_default_backend(AUTO_BACKEND) if backend is None else backend, fast_forward)
+        accel.set_memory(mem0, mem1)
+        accel.execute_instructions(program)
+        output = extract_results_from_memory(accel.get_mem2(), num_elements, accel_config, point.PRECISION)
+
+        # Recording the Outcome with the Cycle Count the RTL Testbench Would Report
+        result["passed"]           = bool(np.all(output == gold_result))
+        result["simulated_cycles"] = estimate_program_timing(program).TOTAL_CYCLES
+        result["error"]            = ""
+    except Exception as error:
+        result["passed"]           = False
+        result["simulated_cycles"] = None
+        result["error"]            = f"{type(error).__name__}: {error}"
+    result["wall_time"] = time.perf_counter() - start_time
+    return result
+
+def get_point_key(result : dict) -> tuple:
+    return tuple(int(result[elem]) for elem in SWEEP_POINT_FIELDS)
+
+def is_csv_file(file_name : str) -> bool:
+    return file_name.endswith(".csv")
+
+def load_sweep_results(file_name : str) -> list[dict]:
+
+    # Nothing Has Been Run Yet
+    if not os.path.exists(file_name):
+        return []
+
+    # Reading Every Complete Record (a Partially Written Last Line is Ignored)
+    with open(file_name, "r", newline="") as file:
+        if is_csv_file(file_name):
+            return [elem for elem in csv.DictReader(file) if None not in elem.values()]
+        results = []
+        for line in file:
+            try:
+                results.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+        return results
+
+def truncate_partial_record(file_name : str, chunk_size : int = 1 << 16) -> None:
+
+    # Cutting a Line a Killed Run Left Half Written, so the Next Record Starts on its Own Line
+    if not os.path.exists(file_name):
+        return
+    with open(file_name, "rb+") as file:
+        end = file.seek(0, os.SEEK_END)
+        position = end
+        while position > 0:
+            start = max(0, position - chunk_size)
+            file.seek(start)
+            newline = file.read(position - start).rfind(b"\n")
+            if newline != -1:
+                position = start + newline + 1
+                break
+            position = start
+        if position != end:
+            file.truncate(position)
+
+def run_sweep(
+    points : list[SweepPoint],
+    output_file : str,
+    workers : int = None,
+    resume : bool = True,
+    fast_forward : bool = False,
+    backend : str = None
+) -> Iterator[dict]:
+
+    # Skipping Points Already Recorded by a Previous Run
+    completed = set()
+    if resume:
+        truncate_partial_record(output_file)
+        completed = {get_point_key(elem) for elem in load_sweep_results(output_file)}
+    else:
+        with open(output_file, "w"):
+            pass
+    pending = [elem for elem in points if astuple(elem) not in completed]
+    if len(pending) == 0:
+        return
+
+    # Sizing the Pool to the Cores this Process May Run On
+    if workers is None:
+        workers = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count()
+    workers = max(1, min(workers, len(pending)))
+
+    # Appending Each Result as Soon as its Point Finishes
+    write_header = is_csv_file(output_file) and ((not os.path.exists(output_file)) or (os.path.getsize(output_file) == 0))
+    with open(output_file, "a", newline="") as file, ProcessPoolExecutor(max_workers=workers) as executor:
+        writer = csv.DictWriter(file, fieldnames=SWEEP_RESULT_FIELDS) if is_csv_file(output_file) else None
+        if write_header:
+            writer.writeheader()
+        futures = [executor.submit(run_sweep_point, elem, fast_forward, backend) for elem in pending]
+        for future in as_completed(futures):
+            result = future.result()
+            if writer is not None:
+                writer.writerow(result)
+            else:
+                file.write(json.dumps({elem : result[elem] for elem in SWEEP_RESULT_FIELDS}) + "\n")
+            file.flush()
+            yield result
+
+def get_precision_bitwidth(precision : str) -> int:
+    result = Mode.STR_TO_BITWIDTH_DICT.get(precision.upper(), None)
+    if result is None:
+        raise ValueError(f"Precision \"{precision}\" Not Recognized.")
+    return result[0]
@@ -0,0 +1,185 @@
+from .compiler import compile_matrix_matrix_multiplication_words, extract_matrix_results_from_memory, check_value_range
+from .configuration import AcceleratorConfiguration, InstructionConfiguration, Mode
+from .memory_image import configuration_hash, save_bit_words
+from .pipeline import PIPELINE_FILE_NAMES, assemble_program, simulate_program
+from dataclasses import dataclass
+from bitstring import Bits
+import numpy as np
+import json
+import os
+
+# Host Schedule Written Next to the Per-Phase Collateral
+TILED_SCHEDULE_FILE_NAME = "schedule.json"
+
+@dataclass
+class TilingPhase:
+    ROWS          : tuple[int,int]
+    COLS          : tuple[int,int]
+    VECTORS       : tuple[int,int]
+    MEM0          : np.ndarray
+    MEM1          : np.ndarray
+    INSTRUCTIONS  : list[str]
+    RESULT_RANGES : list[tuple[int,int]]
+
+    def get_directory_name(self, index : int) -> str:
+        return f"phase_{index:04d}"
+
+@dataclass
+class TiledSchedule:
+    ROWS         : int
+    VECTOR_COUNT : int
+    PRECISION    : int
+    PHASES       : list[TilingPhase]
+
+    def get_phase_count(self) -> int:
+        return len(self.PHASES)
+
+    def get_column_tile_count(self) -> int:
+        return len(set([phase.COLS for phase in self.PHASES]))
+
+def plan_tile_shape(
+    matrix_rows : int,
+    matrix_cols : int,
+    vector_count : int,
+    config : AcceleratorConfiguration,
+    computation_bitwidth : int
+) -> tuple[int,int,int]:
+
+    # Sizes of One Row Block (MEM0 Entry) and One Sub-Vector (MEM1 Entry)
+    buffer_config  = config.BUFFER_CONFIG
+    number_of_rows = config.PE_COUNT * (config.PE_CONFIG.INPUT_BITWIDTH // computation_bitwidth)
+    number_of_cols = config.PE_CONFIG.INPUT_BITWIDTH // computation_bitwidth
+
+    # Keeping Every Column Together When One Row Block and One Vector Fit, Otherwise Splitting on Sub-Vector Boundaries
+    col_limit = min(buffer_config.MEM0_DEPTH, buffer_config.MEM1_DEPTH * number_of_cols)
+    tile_cols = matrix_cols if matrix_cols <= col_limit else (col_limit // number_of_cols) * number_of_cols
+    if tile_cols == 0 and matrix_cols != 0:
+        raise ValueError(f"A single {number_of_cols}-element sub-vector does not fit the buffers.")
+    tile_cols = max(tile_cols, 1)
+
+    # Filling MEM0 with Row Blocks, then MEM1 and MEM2 with Vectors Streamed Past Them
+    row_blocks      = max(int(np.ceil(matrix_rows / number_of_rows)), 1)
+    tile_row_blocks = min(row_blocks, buffer_config.MEM0_DEPTH // tile_cols, buffer_config.MEM2_DEPTH)
+    col_entries     = int(np.ceil(tile_cols / number_of_cols))
+    tile_vectors    = min(max(vector_count, 1), buffer_config.MEM1_DEPTH // col_entries, buffer_config.MEM2_DEPTH // tile_row_blocks)
+    return tile_row_blocks * number_of_rows, tile_cols, tile_vectors
+
+def compile_tiled_matrix_multiplication(
+    matrix : np.ndarray,
+    vectors : np.ndarray,
+    config : AcceleratorConfiguration,
+    computation_bitwidth : int
+) -> TiledSchedule:
+
+    # Checking the Whole Problem Once (Each Column of the Vectors is One Vector)
+    matrix  = np.asarray(matrix)
+    vectors = np.asarray(vectors)
+    if vectors.ndim == 1:
+        vectors = vectors.reshape(-1, 1)
+    check_value_range(matrix, computation_bitwidth, "Matrix")
+    check_value_range(vectors, computation_bitwidth, "Vector")
+    (matrix_rows, matrix_cols) = matrix.shape
+    if vectors.shape[0] != matrix_cols:
+        raise ValueError(f"Vectors have {vectors.shape[0]} rows but the matrix has {matrix_cols} columns.")
+    vector_count = vectors.shape[1]
+
+    # Compiling One Phase per Tile (Vectors Innermost so Consecutive Phases Share a MEM0 Image)
+    tile_rows, tile_cols, tile_vectors = plan_tile_shape(matrix_rows, matrix_cols, vector_count, config, computation_bitwidth)
+    phases = []
+    for col_start in range(0, matrix_cols, tile_cols):
+        col_stop = min(col_start + tile_cols, matrix_cols)
+        for row_start in range(0, matrix_rows, tile_rows):
+            row_stop = min(row_start + tile_rows, matrix_rows)
+            for vector_start in range(0, vector_count, tile_vectors):
+                vector_stop = min(vector_start + tile_vectors, vector_count)
+                mem0, mem1, instructions, result_ranges = compile_matrix_matrix_multiplication_words(
+                    matrix[row_start:row_stop, col_start:col_stop],
+                    vectors[col_start:col_stop, vector_start:vector_stop],
+                    config,
+                    computation_bitwidth
+                )
+                phases.append(TilingPhase(
+                    ROWS          = (row_start, row_stop),
+                    COLS          = (col_start, col_stop),
+                    VECTORS       = (vector_start, vector_stop),
+                    MEM0          = mem0,
+                    MEM1          = mem1,
+                    INSTRUCTIONS  = instructions,
+                    RESULT_RANGES = result_ranges
+                ))
+    return TiledSchedule(matrix_rows, vector_count, computation_bitwidth, phases)
+
+def accumulate_tiled_results(
+    schedule : TiledSchedule,
+    memories : list[list[Bits] | np.ndarray],
+    config : AcceleratorConfiguration
+) -> np.ndarray:
+
+    # Summing the Partial Results of Every Column Tile on the Host (Each Partial Has Already Been Wrapped by OUT)
+    if len(memories) != schedule.get_phase_count():
+        raise ValueError(f"Schedule has {schedule.get_phase_count()} phases but {len(memories)} MEM2 images were given.")
+    result = np.zeros((schedule.ROWS, schedule.VECTOR_COUNT), dtype=np.int64)
+    for phase, memory in zip(schedule.PHASES, memories):
+        partial = extract_matrix_results_from_memory(memory, phase.RESULT_RANGES, config, schedule.PRECISION)
+        result[phase.ROWS[0]:phase.ROWS[1], phase.VECTORS[0]:phase.VECTORS[1]] += partial
+
+    # Wrapping the Total Back to the Computation Precision, which is Exact Since Every Partial is Modular
+    half = 1 << (schedule.PRECISION - 1)
+    return ((result + half) & ((1 << schedule.PRECISION) - 1)) - half
+
+def simulate_tiled_schedule(
+    schedule : TiledSchedule,
+    accel_config : AcceleratorConfiguration,
+    inst_config : InstructionConfiguration,
+    backend : str = None,
+    fast_forward : bool = False
+) -> np.ndarray:
+
+    # Running Every Phase on a Freshly Loaded Accelerator, as the Host Would
+    memories = []
+    for phase in schedule.PHASES:
+        program = assemble_program(inst_config, phase.INSTRUCTIONS, len(phase.INSTRUCTIONS))
+        memories.append(simulate_program(accel_config, inst_config, phase.MEM0, phase.MEM1, program, backend, fast_forward))
+    return accumulate_tiled_results(schedule, memories, accel_config)
+
+def save_tiled_schedule(
+    schedule : TiledSchedule,
+    out_dir : str,
+    accel_config : AcceleratorConfiguration,
+    inst_config : InstructionConfiguration,
+    file_format : str = "ascii"
+) -> list[str]:
+
+    # Writing Each Phase's Collateral Under its Own Directory, Named as the Testbench Reads Them
+    config_hash   = configuration_hash(accel_config, inst_config)
+    buffer_config = accel_config.BUFFER_CONFIG
+    written       = []
+    description   = []
+    for index, phase in enumerate(schedule.PHASES):
+        phase_dir = os.path.join(out_dir, phase.get_directory_name(index))
+        os.makedirs(phase_dir, exist_ok=True)
+        file_names = {name : os.path.join(phase_dir, elem) for name, elem in PIPELINE_FILE_NAMES.items()}
+        save_bit_words(file_names["mem0"], phase.MEM0, buffer_config.MEM0_BITWIDTH, file_format, config_hash)
+        save_bit_words(file_names["mem1"], phase.MEM1, buffer_config.MEM1_BITWIDTH, file_format, config_hash)
+        with open(file_names["assembly"], "w") as file:
+            file.write("".join([f"{elem}\n" for elem in phase.INSTRUCTIONS]))
+        written.extend([file_names["mem0"], file_names["mem1"], file_names["assembly"]])
+        description.append({
+            "directory"     : phase.get_directory_name(index),
+            "rows"          : list(phase.ROWS),
+            "cols"          : list(phase.COLS),
+            "vectors"       : list(phase.VECTORS),
+            "result_ranges" : [list(elem) for elem in phase.RESULT_RANGES]
+        })
+
+    # The Host Schedule: Run Each Phase, Read its Result Ranges and Add Them into result[rows, vectors]
+    schedule_file = os.path.join(out_dir, TILED_SCHEDULE_FILE_NAME)
+    with open(schedule_file, "w") as file:
+        json.dump({
+            "rows"         : schedule.ROWS,
+            "vector_count" : schedule.VECTOR_COUNT,
+            "precision"    : Mode.BITWIDTH_TO_STR_DICT[schedule.PRECISION],
+            "phases"       : description
+        }, file, indent=2)
+    written.append(schedule_file)
+    return written
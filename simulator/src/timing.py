@@ -0,0 +1,69 @@
+from .instruction import Instruction, DecodedInstruction
+from dataclasses import dataclass, replace
+
+@dataclass
+class TimingConfiguration:
+
+    # Cycles tb_top.sv Holds Reset Before the First Instruction is Registered
+    RESET_CYCLES          : int = 5
+
+    # Cycles controller.sv Spends in IDLE Registering Each Instruction
+    # NOTE: instruction_memory.sv Presents the Next Word While the Current One Executes,
+    #       so the Synchronous Read Never Adds a Fetch Stall Beyond this Cycle
+    IDLE_CYCLES           : int = 1
+
+    # Zero Words tb_top.sv Executes After the Program (INST_COUNT is the Assembly Line Count + 1)
+    TRAILING_INSTRUCTIONS : int = 1
+
+    # Cycles to Write One Word into instruction_memory.sv When a Later Program Segment is Loaded
+    IMEM_LOAD_CYCLES      : int = 1
+
+@dataclass
+class ProgramTiming:
+    INSTRUCTION_CYCLES : list[int]
+    EXECUTION_CYCLES   : int
+    TOTAL_CYCLES       : int
+
+@dataclass
+class SegmentedProgramTiming:
+    SEGMENT_TIMINGS : list[ProgramTiming]
+    RELOAD_CYCLES   : int
+    TOTAL_CYCLES    : int
+
+def get_instruction_cycles(instruction : Instruction | DecodedInstruction, config : TimingConfiguration = TimingConfiguration()) -> int:
+    # One IDLE Cycle then One EXECUTING Cycle per Iteration (the Count Field Holds Iterations - 1)
+    return config.IDLE_CYCLES + instruction.decode().COUNT + 1
+
+def estimate_program_timing(
+    instructions : list[Instruction | DecodedInstruction],
+    config : TimingConfiguration = TimingConfiguration()
+) -> ProgramTiming:
+
+    # Timing Every Instruction of the Program
+    instruction_cycles = [get_instruction_cycles(elem, config) for elem in instructions]
+    execution_cycles   = sum(instruction_cycles)
+
+    # Matching the "Computation took N clock cycles" Count of tb_top.sv, which Includes
+    # Reset and the Trailing Zero Words (Each a Count of Zero, so IDLE + One EXECUTING Cycle)
+    trailing_cycles = config.TRAILING_INSTRUCTIONS * (config.IDLE_CYCLES + 1)
+    return ProgramTiming(
+        INSTRUCTION_CYCLES = instruction_cycles,
+        EXECUTION_CYCLES   = execution_cycles,
+        TOTAL_CYCLES       = config.RESET_CYCLES + execution_cycles + trailing_cycles
+    )
+
+def estimate_segmented_program_timing(
+    segments : list[list[Instruction | DecodedInstruction]],
+    config : TimingConfiguration = TimingConfiguration()
+) -> SegmentedProgramTiming:
+
+    # Segments Hand Off Without a Reset (Every Memory and PE Register Carries Over), so Each Only Adds its Instructions and Terminator
+    segment_timings = [estimate_program_timing(elem, replace(config, RESET_CYCLES=0)) for elem in segments]
+
+    # The First Segment is Preloaded, Every Later One is Written into the Instruction Memory with its Terminator
+    reload_cycles = sum([(len(elem) + config.TRAILING_INSTRUCTIONS) * config.IMEM_LOAD_CYCLES for elem in segments[1:]])
+    return SegmentedProgramTiming(
+        SEGMENT_TIMINGS = segment_timings,
+        RELOAD_CYCLES   = reload_cycles,
+        TOTAL_CYCLES    = config.RESET_CYCLES + sum([elem.TOTAL_CYCLES for elem in segment_timings]) + reload_cycles
+    )
@@ -1,7 +1,9 @@
 from src.accelerator import Accelerator
+from src.performance_counters import PerformanceCounters
 from src.assembler import Assembler
 from src.instruction import Mode
 from src.compiler import generate_accelerator_and_instruction_configuration, compile_matrix_vector_multiplication, extract_results_from_memory
+from bitstring import Bits
 import numpy as np
 import sys
 
@@ -11,6 +13,10 @@ def main():
     errors = errors + run_test(768,64,12345,Mode.INT16, 64)
     errors = errors + run_test(768,64,12345,Mode.INT32, 13)
     errors = errors + run_test(64,3,0,Mode.INT8, 9)
+    errors = errors + test_program_replay()
+    errors = errors + test_fast_forward()
+    errors = errors + test_fast_forward_overflow()
+    errors = errors + test_performance_counters()
 
     # Determining the Status of All Tests
     if errors == 0:
@@ -55,6 +61,176 @@ def run_test(
         print(f"(Rows:{rows},Cols:{cols},Prec:{precision},PE Count:{pe_count}) Test Failed!")
         return 1
 
+def test_program_replay() -> int:
+
+    # Configuring
+    accel_config, inst_config = generate_accelerator_and_instruction_configuration(
+        processing_element_count=4,
+        controller_counter_bitwidth=10
+    )
+    assembler = Assembler(inst_config)
+    matrix, vector, gold_result = generate_test_matrix_vector_computation(40, 12, 7)
+    mem0, mem1, instructions, num_elements = compile_matrix_vector_multiplication(
+        matrix, vector, accel_config, Mode.INT16
+    )
+
+    # Assembling Once and Executing the Same Program on Several Accelerators
+    program = assembler.assemble_instructions(instructions)
+    program_bits = [inst.get_instruction() for inst in program]
+    all_correct = True
+    for _ in range(3):
+        accel = Accelerator(accel_config)
+        accel.set_memory(mem0, mem1)
+        accel.execute_instructions(program)
+        result = extract_results_from_memory(
+            accel.get_mem2(), num_elements, accel_config, Mode.INT16
+        )
+        all_correct = all_correct and np.all(result == gold_result)
+
+    # The Program Must be Left Untouched
+    all_correct = all_correct and (program_bits == [inst.get_instruction() for inst in program])
+    if all_correct:
+        print("Program Replay Test Passed!")
+        return 0
+    else:
+        print("Program Replay Test Failed!")
+        return 1
+
+def test_fast_forward() -> int:
+
+    # Configuring
+    accel_config, inst_config = generate_accelerator_and_instruction_configuration(
+        processing_element_count=4,
+        processing_element_accumulation_bitwidth=64,
+        controller_counter_bitwidth=6
+    )
+    assembler = Assembler(inst_config)
+
+    # Filling the Memories with Small Random Bytes so No Accumulator Overflows
+    np.random.seed(11)
+    mem0 = [
+        Bits(bytes=np.random.randint(-8, 8, size=accel_config.BUFFER_CONFIG.MEM0_BITWIDTH // 8).astype(np.int8).tobytes())
+        for _ in range(accel_config.BUFFER_CONFIG.MEM0_DEPTH)
+    ]
+    mem1 = [
+        Bits(bytes=np.random.randint(-8, 8, size=accel_config.BUFFER_CONFIG.MEM1_BITWIDTH // 8).astype(np.int8).tobytes())
+        for _ in range(accel_config.BUFFER_CONFIG.MEM1_DEPTH)
+    ]
+
+    # Program with Wrapping Offsets, Stale Ports, Repeated Writes and Mismatched Buffer/PE Modes
+    program = [
+        "NOP | CLR INT16 | 1 0 0",
+        "READ INT16 60 5 | MAC INT16 | 20 1 1",
+        "NOP | MAC INT16 | 5 0 0",
+        "NOP | OUT INT16 | 3 0 0",
+        "WRITE 62 | NOP INT16 | 5 1 0",
+        "READ INT8 3 7 | MAC INT16 | 9 1 1",
+        "READ INT32 1 2 | PASS INT32 | 4 1 1",
+        "NOP | RND INT32 3 | 4 0 0",
+        "WRITE 10 | OUT INT32 | 3 0 0",
+        "READ INT8 20 4 | MAC INT8 | 64 1 1",
+        "WRITE 30 | OUT INT8 | 64 1 0",
+        "READ INT32 5 1 | CLR INT32 | 2 1 1",
+    ]
+
+    # Running Cycle by Cycle and Fast Forwarded, Comparing Every Piece of State
+    states = []
+    for fast_forward in [False, True]:
+        accel = Accelerator(accel_config, fast_forward=fast_forward)
+        accel.set_memory(mem0, mem1)
+        accel.execute_instructions(assembler.assemble_instructions(program))
+        states.append((
+            accel.get_mem2(),
+            [pe.get_accumulation() for pe in accel._pe_array],
+            [pe.get_output() for pe in accel._pe_array],
+            accel._main_buffer.read_mem0_output(),
+            accel._main_buffer.read_mem1_output(),
+            accel._controller.get_counter()
+        ))
+
+    if states[0] == states[1]:
+        print("Fast Forward Test Passed!")
+        return 0
+    else:
+        print("Fast Forward Test Failed!")
+        return 1
+
+def test_fast_forward_overflow() -> int:
+
+    # Configuring a 32-bit Accumulator that Large INT32 Products Overflow
+    accel_config, inst_config = generate_accelerator_and_instruction_configuration(
+        processing_element_count=4,
+        controller_counter_bitwidth=10
+    )
+    assembler = Assembler(inst_config)
+    mem0 = [Bits(int=2**30, length=32) * 4 for _ in range(accel_config.BUFFER_CONFIG.MEM0_DEPTH)]
+    mem1 = [Bits(int=2**30, length=32) for _ in range(accel_config.BUFFER_CONFIG.MEM1_DEPTH)]
+
+    # The Fast Forwarded Model Must Fall Back and Fail Exactly Like the Cycle by Cycle One
+    outcomes = []
+    for fast_forward in [False, True]:
+        accel = Accelerator(accel_config, fast_forward=fast_forward)
+        accel.set_memory(mem0, mem1)
+        try:
+            accel.execute_instructions(assembler.assemble_instructions(["READ INT32 0 0 | MAC INT32 | 4 1 1"]))
+            outcomes.append("completed")
+        except ValueError:
+            outcomes.append("overflowed")
+
+    if outcomes == ["overflowed", "overflowed"]:
+        print("Fast Forward Overflow Test Passed!")
+        return 0
+    else:
+        print(f"Fast Forward Overflow Test Failed, Outcomes Were {outcomes}!")
+        return 1
+
+def test_performance_counters() -> int:
+
+    # Configuring a 16 Row Tile so 37 Rows Leave 11 Padded Rows in the Last Tile
+    accel_config, inst_config = generate_accelerator_and_instruction_configuration(
+        processing_element_count=4,
+        controller_counter_bitwidth=10
+    )
+    assembler = Assembler(inst_config)
+    matrix, vector, gold_result = generate_test_matrix_vector_computation(37, 5, 3, min_value=1)
+    mem0, mem1, instructions, num_elements = compile_matrix_vector_multiplication(
+        matrix, vector, accel_config, Mode.INT8
+    )
+
+    # Collecting Counters Both Cycle by Cycle and Fast Forwarded
+    all_correct = True
+    for fast_forward in [False, True]:
+        accel = Accelerator(accel_config, fast_forward=fast_forward, collect_counters=True)
+        accel.set_memory(mem0, mem1)
+        accel.execute_instructions(assembler.assemble_instructions(instructions))
+        counters = accel.get_performance_counters()
+
+        # Three Tiles of Five Columns, with PEs 2 and 3 Entirely on Padding in the Last Tile
+        all_correct = all_correct and (counters["instructions"] == 12) and (counters["cycles"] == accel.get_cycle_count())
+        all_correct = all_correct and (counters["mem0_reads"] == 15) and (counters["mem1_reads"] == 15) and (counters["mem2_writes"] == 3)
+        all_correct = all_correct and (counters["buffer_nop_cycles"] == 6) and (counters["pe_nop_cycles"] == 3) and (counters["nop_cycles"] == 0)
+        all_correct = all_correct and (counters["mac_cycles"]["INT8"] == [15, 15, 15, 15]) and (counters["mac_cycles"]["INT16"] == [0, 0, 0, 0])
+        all_correct = all_correct and (counters["lane_macs"]["INT8"] == [60, 60, 60, 60])
+        all_correct = all_correct and (counters["zero_input_mac_cycles"]["INT8"] == [0, 0, 5, 5])
+        all_correct = all_correct and (counters["zero_input_lane_macs"]["INT8"] == [0, 15, 20, 20])
+        all_correct = all_correct and (counters["unclassified_mac_cycles"]["INT8"] == [0, 0, 0, 0])
+        all_correct = all_correct and (abs(counters["nonzero_operand_fraction"] - (185 / 240)) < 1e-9)
+
+    # MACs Whose Operands Cannot be Inspected are Issued but Kept Out of the Zero Operand Fraction
+    performance_counters = PerformanceCounters(4, 32)
+    performance_counters.record_macs(Mode.INT8, np.array([[[0, 1, 2, 3]] * 4]))
+    performance_counters.record_unclassified_macs(Mode.INT8, 3)
+    counters = performance_counters.to_dict(0)
+    all_correct = all_correct and (counters["mac_cycles"]["INT8"] == [4, 4, 4, 4]) and (counters["unclassified_mac_cycles"]["INT8"] == [3, 3, 3, 3])
+    all_correct = all_correct and (counters["nonzero_operand_fraction"] == 0.75)
+
+    if all_correct:
+        print("Performance Counters Test Passed!")
+        return 0
+    else:
+        print(f"Performance Counters Test Failed, Counters Were {counters}!")
+        return 1
+
 
 def generate_test_matrix_vector_computation(
     rows : int, cols : int, seed : int,
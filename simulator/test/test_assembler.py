@@ -0,0 +1,72 @@
+from src.assembler import Assembler, AssemblyError
+from src.compiler import generate_accelerator_and_instruction_configuration
+import sys
+
+def main():
+
+    # Testing the Assembler
+    errors = 0
+    errors += test_streaming_matches_list()
+    errors += test_error_line_numbers()
+
+    # Determining the Status of All Tests
+    if errors == 0:
+        print("All Tests Passed!")
+    else:
+        print(f"{errors} Tests Failed!")
+    sys.exit(errors)
+
+def test_streaming_matches_list() -> int:
+
+    # Streaming Skips Blank Lines but Otherwise Encodes Exactly as the List Assembler
+    _, inst_config = generate_accelerator_and_instruction_configuration()
+    assembler = Assembler(inst_config)
+    program = [
+        "NOP | CLR INT8 | 1 0 0",
+        "READ INT16 3 5 | MAC INT16 | 10 1 1",
+        "NOP | RND INT16 4 | 1 0 0",
+        "NOP | OUT INT16 | 1 0 0",
+        "WRITE 7 | NOP INT8 | 1 0 0"
+    ]
+    expected = [elem.get_instruction() for elem in assembler.assemble_instructions(program)]
+    lines    = iter([f"{elem}\n" for elem in program[:2]] + ["\n", "   \n"] + [f"{elem}\n" for elem in program[2:]])
+    streamed = assembler.iterate_instruction_bits(lines)
+    all_correct = (next(streamed) == expected[0]) and (list(streamed) == expected[1:])
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print("Streaming Matches List Test Passed.")
+        return 0
+    else:
+        print("Streaming Matches List Test Failed.")
+        return 1
+
+def test_error_line_numbers() -> int:
+
+    # Every Malformed Line Reports its Line Number (Counting Blank Lines)
+    _, inst_config = generate_accelerator_and_instruction_configuration()
+    assembler = Assembler(inst_config)
+    all_correct = True
+    for bad_line in [
+        "READ INT9 0 0 | MAC INT8 | 1 0 0",
+        "NOP | MAC INT8 | 1 0",
+        "NOP | MAC INT8 | 0 0 0",
+        "NOP | MAC INT8",
+        "JUMP | MAC INT8 | 1 0 0"
+    ]:
+        try:
+            list(assembler.iterate_instructions(["NOP | CLR INT8 | 1 0 0", "", bad_line, "NOP | CLR INT8 | 1 0 0"]))
+            all_correct = False
+        except AssemblyError as error:
+            all_correct = all_correct and (error.line_number == 3) and (error.line == bad_line) and str(error).startswith("Line 3:")
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print("Error Line Numbers Test Passed.")
+        return 0
+    else:
+        print("Error Line Numbers Test Failed.")
+        return 1
+
+if __name__ == "__main__":
+    main()
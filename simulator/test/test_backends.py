@@ -0,0 +1,116 @@
+from src.backends import BACKENDS, BACKEND_ENVIRONMENT_VARIABLE, create_accelerator, resolve_backend, select_fastest_backend
+from src.accelerator import Accelerator
+from src.numpy_accelerator import NumpyAccelerator
+from src.assembler import Assembler
+from src.instruction import Mode
+from src.compiler import generate_accelerator_and_instruction_configuration, compile_matrix_vector_multiplication, extract_results_from_memory
+import numpy as np
+import os
+import sys
+
+def main():
+
+    # Testing the Backend Registry
+    errors = 0
+    errors += test_backends_match_reference()
+    errors += test_backend_selection()
+
+    # Determining the Status of All Tests
+    if errors == 0:
+        print("All Tests Passed!")
+    else:
+        print(f"{errors} Tests Failed!")
+    sys.exit(errors)
+
+def test_backends_match_reference() -> int:
+
+    # Configuring
+    accel_config, inst_config = generate_accelerator_and_instruction_configuration(
+        processing_element_count=4,
+        controller_counter_bitwidth=10
+    )
+    assembler = Assembler(inst_config)
+
+    # Every Engine Must Produce the Reference MEM2 and Cycle Count for Every Precision
+    all_correct = True
+    np.random.seed(0)
+    for precision in [Mode.INT8, Mode.INT16, Mode.INT32]:
+        matrix = np.random.randint(-5, 5, size=(37, 9))
+        vector = np.random.randint(-5, 5, size=(9, 1))
+        mem0, mem1, instructions, num_elements = compile_matrix_vector_multiplication(matrix, vector, accel_config, precision)
+        program = assembler.assemble_instructions(instructions)
+
+        reference = create_accelerator(accel_config, "reference")
+        reference.set_memory(mem0, mem1)
+        reference.execute_instructions(program)
+        for backend in BACKENDS:
+            for fast_forward in [False, True]:
+                accel = create_accelerator(accel_config, backend, fast_forward)
+                accel.set_memory(mem0, mem1)
+                accel.execute_instructions(program)
+                all_correct = all_correct and (accel.get_mem2() == reference.get_mem2())
+                all_correct = all_correct and (accel.get_cycle_count() == reference.get_cycle_count())
+        output = extract_results_from_memory(reference.get_mem2(), num_elements, accel_config, precision)
+        all_correct = all_correct and np.all(output == (matrix @ vector).flatten())
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print("Backends Match Reference Test Passed.")
+        return 0
+    else:
+        print("Backends Match Reference Test Failed.")
+        return 1
+
+def test_backend_selection() -> int:
+
+    # The NumPy Engine is Fastest When it Supports the Configuration
+    accel_config, _ = generate_accelerator_and_instruction_configuration(processing_element_count=4)
+    odd_config, _   = generate_accelerator_and_instruction_configuration(processing_element_count=4, processing_element_output_bitwidth=24)
+    all_correct = (select_fastest_backend(accel_config) == "numpy")
+    all_correct = all_correct and (select_fastest_backend(odd_config) == "int")
+    all_correct = all_correct and (select_fastest_backend(accel_config, collect_counters=True) == "int")
+    all_correct = all_correct and isinstance(create_accelerator(accel_config, "auto"), NumpyAccelerator)
+    all_correct = all_correct and isinstance(create_accelerator(odd_config, "auto"), Accelerator)
+
+    # Memories that are Not Whole Bytes Only Run on the Reference Engine
+    narrow_config, _ = generate_accelerator_and_instruction_configuration(
+        processing_element_count=2,
+        processing_element_input_bitwidth=12,
+        processing_element_output_bitwidth=12,
+        processing_element_accumulation_bitwidth=24
+    )
+    all_correct = all_correct and (select_fastest_backend(narrow_config) == "reference")
+    try:
+        create_accelerator(narrow_config, "int")
+        all_correct = False
+    except ValueError:
+        pass
+
+    # The Environment Variable Picks the Engine Only When None is Given
+    previous = os.environ.get(BACKEND_ENVIRONMENT_VARIABLE)
+    os.environ[BACKEND_ENVIRONMENT_VARIABLE] = "int"
+    all_correct = all_correct and (resolve_backend(None, accel_config) == "int")
+    all_correct = all_correct and (resolve_backend("numpy", accel_config) == "numpy")
+    if previous is None:
+        del os.environ[BACKEND_ENVIRONMENT_VARIABLE]
+    else:
+        os.environ[BACKEND_ENVIRONMENT_VARIABLE] = previous
+    all_correct = all_correct and (resolve_backend(None, accel_config) == (previous or "reference"))
+
+    # Unknown Engines are Rejected
+    try:
+        resolve_backend("verilog", accel_config)
+        all_correct = False
+    except ValueError:
+        pass
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print("Backend Selection Test Passed.")
+        return 0
+    else:
+        print("Backend Selection Test Failed.")
+        return 1
+
+if __name__ == "__main__":
+    main()
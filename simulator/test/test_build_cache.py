@@ -0,0 +1,147 @@
+from src.build_cache import BuildCache, cache_key, open_build_cache, run_cached, CACHE_DIR_ENVIRONMENT_VARIABLE
+from src.compiler import generate_accelerator_and_instruction_configuration
+import contextlib
+import tempfile
+import io
+import time
+import sys
+import os
+
+def main():
+
+    # Testing the Build Cache
+    errors = 0
+    errors += test_cache_key()
+    errors += test_cached_build()
+    errors += test_cached_report()
+    errors += test_lru_eviction()
+
+    # Determining the Status of All Tests
+    if errors == 0:
+        print("All Tests Passed!")
+    else:
+        print(f"{errors} Tests Failed!")
+    sys.exit(errors)
+
+def write_file(file_name : str, text : str) -> None:
+    with open(file_name, "w") as file:
+        file.write(text)
+
+def read_file(file_name : str) -> str:
+    with open(file_name) as file:
+        return file.read()
+
+def test_cache_key() -> int:
+
+    # Keys Only Match When the Tool, Parameters, Configuration and Input Contents All Match
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "source.asm")
+        write_file(source, "NOP | CLR INT8 | 1 0 0\n")
+        configs = generate_accelerator_and_instruction_configuration()
+        other   = generate_accelerator_and_instruction_configuration(processing_element_count=8)
+        key = cache_key("ivd-as", {"format" : "ascii"}, configs, [source])
+        all_correct = (key == cache_key("ivd-as", {"format" : "ascii"}, configs, [source]))
+        all_correct = all_correct and (key != cache_key("ivd-cc", {"format" : "ascii"}, configs, [source]))
+        all_correct = all_correct and (key != cache_key("ivd-as", {"format" : "packed"}, configs, [source]))
+        all_correct = all_correct and (key != cache_key("ivd-as", {"format" : "ascii"}, other, [source]))
+        write_file(source, "NOP | CLR INT16 | 1 0 0\n")
+        all_correct = all_correct and (key != cache_key("ivd-as", {"format" : "ascii"}, configs, [source]))
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print("Cache Key Test Passed.")
+        return 0
+    else:
+        print("Cache Key Test Failed.")
+        return 1
+
+def test_cached_build() -> int:
+
+    # The Second Identical Build is Copied from the Cache Without Running
+    with tempfile.TemporaryDirectory() as directory:
+        cache   = BuildCache(os.path.join(directory, "cache"))
+        outputs = {"a.txt" : os.path.join(directory, "a.txt"), "b.txt" : os.path.join(directory, "b.txt")}
+        builds  = []
+        def build():
+            builds.append(1)
+            write_file(outputs["a.txt"], "first")
+            write_file(outputs["b.txt"], "second")
+        first = run_cached(cache, lambda: "key", outputs, build)
+        os.remove(outputs["a.txt"])
+        second = run_cached(cache, lambda: "key", outputs, build)
+        all_correct = (not first) and second and (len(builds) == 1) and (read_file(outputs["a.txt"]) == "first")
+
+        # Standard Output and a Missing Cache Always Build
+        all_correct = all_correct and not run_cached(cache, lambda: "key", {"a.txt" : "-"}, lambda: builds.append(1))
+        all_correct = all_correct and not run_cached(None, lambda: "key", outputs, build) and (len(builds) == 3)
+
+        # The Environment Enables the Cache Only When Set
+        os.environ.pop(CACHE_DIR_ENVIRONMENT_VARIABLE, None)
+        all_correct = all_correct and (open_build_cache() is None)
+        os.environ[CACHE_DIR_ENVIRONMENT_VARIABLE] = os.path.join(directory, "cache")
+        all_correct = all_correct and (open_build_cache().fetch("key", outputs))
+        os.environ.pop(CACHE_DIR_ENVIRONMENT_VARIABLE)
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print("Cached Build Test Passed.")
+        return 0
+    else:
+        print("Cached Build Test Failed.")
+        return 1
+
+def test_cached_report() -> int:
+
+    # A Build's Report is Printed When it Runs and Again Each Time its Entry is Reused
+    with tempfile.TemporaryDirectory() as directory:
+        cache   = BuildCache(os.path.join(directory, "cache"))
+        outputs = {"a.txt" : os.path.join(directory, "a.txt")}
+        def build():
+            write_file(outputs["a.txt"], "first")
+            return "Built a.txt.\n"
+        streams = []
+        for _ in range(2):
+            streams.append(io.StringIO())
+            with contextlib.redirect_stderr(streams[-1]):
+                run_cached(cache, lambda: "key", outputs, build)
+        all_correct = [elem.getvalue() for elem in streams] == ["Built a.txt.\n"] * 2
+
+        # The Report is Not an Output, so it Never Collides with the Artifacts
+        all_correct = all_correct and (cache.load_report("key") == "Built a.txt.\n") and (cache.load_report("missing") is None)
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print("Cached Report Test Passed.")
+        return 0
+    else:
+        print("Cached Report Test Failed.")
+        return 1
+
+def test_lru_eviction() -> int:
+
+    # Storing Three 100 Byte Entries in a 250 Byte Cache After Touching the Oldest
+    with tempfile.TemporaryDirectory() as directory:
+        cache  = BuildCache(os.path.join(directory, "cache"), max_bytes=250)
+        output = {"out.bin" : os.path.join(directory, "out.bin")}
+        write_file(output["out.bin"], "x" * 100)
+        for key in ["a", "b"]:
+            cache.store(key, output)
+            time.sleep(0.01)
+        cache.fetch("a", output)
+        time.sleep(0.01)
+        cache.store("c", output)
+
+        # The Least Recently Used Entry is the One Evicted
+        all_correct = cache.fetch("a", output) and cache.fetch("c", output) and not cache.fetch("b", output)
+        all_correct = all_correct and (cache.get_size() == 200)
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print("LRU Eviction Test Passed.")
+        return 0
+    else:
+        print("LRU Eviction Test Failed.")
+        return 1
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+from src.compiler import generate_accelerator_and_instruction_configuration, compile_matrix_vector_multiplication, compile_matrix_vector_multiplication_words, extract_results_from_memory, extract_result_ranges
+from src.compiler import compile_matrix_matrix_multiplication, compile_matrix_matrix_multiplication_words, extract_matrix_results_from_memory
+from src.pipeline import assemble_program, simulate_program
+from src.instruction import Mode
+from src.memory_image import bits_to_words
+from bitstring import Bits
+import numpy as np
+import sys
+
+def main():
+
+    # Testing the Compiler
+    errors = 0
+    errors += test_matrix_vector_layout(64, 16, 0, Mode.INT8, 4)
+    errors += test_matrix_vector_layout(37, 11, 1, Mode.INT16, 5)
+    errors += test_matrix_vector_layout(30, 7, 2, Mode.INT32, 3)
+    errors += test_value_range()
+    errors += test_extract_results(Mode.INT8, 4)
+    errors += test_extract_results(Mode.INT16, 5)
+    errors += test_extract_results(Mode.INT32, 3)
+    errors += test_matrix_matrix_multiplication(40, 13, 4, 3, Mode.INT8, 4)
+    errors += test_matrix_matrix_multiplication(17, 5, 3, 4, Mode.INT16, 2)
+    errors += test_matrix_matrix_multiplication(9, 6, 1, 5, Mode.INT32, 3)
+
+    # Determining the Status of All Tests
+    if errors == 0:
+        print("All Tests Passed!")
+    else:
+        print(f"{errors} Tests Failed!")
+    sys.exit(errors)
+
+def reference_matrix_vector_layout(matrix, vector, config, computation_bitwidth) -> tuple[list[Bits],list[Bits],list[str]]:
+
+    # Packing One Element at a Time as the Original Compiler Did
+    mem0_configs = []
+    mem1_configs = []
+    instruction_list = []
+    mode_str = Mode.BITWIDTH_TO_STR_DICT[computation_bitwidth]
+    number_of_rows = config.PE_COUNT * (config.PE_CONFIG.INPUT_BITWIDTH // computation_bitwidth)
+    for sub_matrix_row in range(int(np.ceil(len(matrix)/number_of_rows))):
+        for sub_matrix_col in range(len(matrix[0])):
+            sub_matrix = list(matrix[(sub_matrix_row * number_of_rows):((sub_matrix_row+1) * number_of_rows),sub_matrix_col])
+            sub_matrix = sub_matrix + [0] * (number_of_rows - len(sub_matrix))
+            mem0_configs.append(Bits().join([Bits(int=elem, length=computation_bitwidth) for elem in sub_matrix]))
+        instruction_list.append(f"NOP | CLR {mode_str} | 1 0 0")
+        instruction_list.append(f"READ {mode_str} {sub_matrix_row * len(matrix[0])} 0 | MAC {mode_str} | {len(matrix[0])} 1 1")
+        instruction_list.append(f"NOP | OUT {mode_str} | 1 0 0")
+        instruction_list.append(f"WRITE {sub_matrix_row} | NOP {mode_str} | 1 0 0")
+    number_of_cols = config.PE_CONFIG.INPUT_BITWIDTH // computation_bitwidth
+    for sub_vector_col in range(int(np.ceil(len(matrix[0])/number_of_cols))):
+        sub_vector = list(vector[(sub_vector_col * number_of_cols):((sub_vector_col+1) * number_of_cols)].flatten())
+        sub_vector = sub_vector + [0] * (number_of_cols - len(sub_vector))
+        mem1_configs.append(Bits().join([Bits(int=elem, length=computation_bitwidth) for elem in sub_vector[::-1]]))
+    mem0_configs = mem0_configs + [Bits(int=0,length=config.BUFFER_CONFIG.MEM0_BITWIDTH) for _ in range(config.BUFFER_CONFIG.MEM0_DEPTH - len(mem0_configs))]
+    mem1_configs = mem1_configs + [Bits(int=0,length=config.BUFFER_CONFIG.MEM1_BITWIDTH) for _ in range(config.BUFFER_CONFIG.MEM1_DEPTH - len(mem1_configs))]
+    return mem0_configs, mem1_configs, instruction_list
+
+def test_matrix_vector_layout(rows, cols, seed, precision, pe_count) -> int:
+
+    # Configuring
+    accel_config, _ = generate_accelerator_and_instruction_configuration(
+        processing_element_count=pe_count,
+        controller_counter_bitwidth=10
+    )
+
+    # Compiling a Random Computation Spanning the Full Precision Range
+    np.random.seed(seed)
+    matrix = np.random.randint(-2**(precision-1), 2**(precision-1), size=(rows,cols))
+    vector = np.random.randint(-2**(precision-1), 2**(precision-1), size=(cols,1))
+    mem0, mem1, instructions, row_count = compile_matrix_vector_multiplication(matrix, vector, accel_config, precision)
+    mem0_words, mem1_words, word_instructions, _ = compile_matrix_vector_multiplication_words(matrix, vector, accel_config, precision)
+    ref_mem0, ref_mem1, ref_instructions = reference_matrix_vector_layout(matrix, vector, accel_config, precision)
+
+    # Comparing Against the Element by Element Packing
+    all_correct = (mem0 == ref_mem0) and (mem1 == ref_mem1) and (instructions == ref_instructions) and (row_count == rows)
+    all_correct = all_correct and np.array_equal(mem0_words, bits_to_words(ref_mem0, accel_config.BUFFER_CONFIG.MEM0_BITWIDTH))
+    all_correct = all_correct and np.array_equal(mem1_words, bits_to_words(ref_mem1, accel_config.BUFFER_CONFIG.MEM1_BITWIDTH))
+    all_correct = all_correct and (word_instructions == ref_instructions)
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print(f"(Rows:{rows},Cols:{cols},Prec:{precision},PE Count:{pe_count}) Matrix Vector Layout Test Passed.")
+        return 0
+    else:
+        print(f"(Rows:{rows},Cols:{cols},Prec:{precision},PE Count:{pe_count}) Matrix Vector Layout Test Failed.")
+        return 1
+
+def test_value_range() -> int:
+
+    accel_config, _ = generate_accelerator_and_instruction_configuration(processing_element_count=4)
+
+    # Ensuring Values Outside the Precision are Rejected
+    all_correct = True
+    for matrix, vector in [
+        (np.full((8, 4), 128), np.ones((4, 1), dtype=np.int64)),
+        (np.ones((8, 4), dtype=np.int64), np.full((4, 1), -129))
+    ]:
+        try:
+            compile_matrix_vector_multiplication(matrix, vector, accel_config, Mode.INT8)
+            all_correct = False
+        except ValueError:
+            pass
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print("Value Range Test Passed.")
+        return 0
+    else:
+        print("Value Range Test Failed.")
+        return 1
+
+def test_extract_results(precision, pe_count) -> int:
+
+    # Configuring
+    accel_config, _ = generate_accelerator_and_instruction_configuration(
+        processing_element_count=pe_count,
+        controller_counter_bitwidth=10
+    )
+    buffer_config = accel_config.BUFFER_CONFIG
+
+    # Filling MEM2 with Random Words
+    np.random.seed(precision)
+    words  = np.random.randint(0, 256, size=(buffer_config.MEM2_DEPTH, buffer_config.MEM2_BITWIDTH // 8)).astype(np.uint8)
+    memory = [Bits(bytes=row.tobytes()) for row in words]
+
+    # Decoding One Entry at a Time with Bitstring
+    elems_per_entry = pe_count * (accel_config.PE_CONFIG.OUTPUT_BITWIDTH // precision)
+    def reference(start, num_elems):
+        output = []
+        for elem in memory[start:(start + int(np.ceil(num_elems / elems_per_entry)))]:
+            output.extend([lane.int for lane in elem.cut(precision)])
+        return output[:num_elems]
+
+    # Comparing Single and Multiple Range Decoding from Both Memory Representations
+    result_ranges = [(0, 37), (10, elems_per_entry * 3), (100, 1)]
+    all_correct = list(extract_results_from_memory(memory, 37, accel_config, precision)) == reference(0, 37)
+    all_correct = all_correct and (list(extract_results_from_memory(words, 37, accel_config, precision)) == reference(0, 37))
+    for results in [
+        extract_result_ranges(memory, result_ranges, accel_config, precision),
+        extract_result_ranges(words, result_ranges, accel_config, precision)
+    ]:
+        for result, (start, num_elems) in zip(results, result_ranges):
+            all_correct = all_correct and (list(result) == reference(start, num_elems))
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print(f"(Prec:{precision},PE Count:{pe_count}) Extract Results Test Passed.")
+        return 0
+    else:
+        print(f"(Prec:{precision},PE Count:{pe_count}) Extract Results Test Failed.")
+        return 1
+
+def test_matrix_matrix_multiplication(rows, cols, vector_count, seed, precision, pe_count) -> int:
+
+    # Configuring
+    accel_config, inst_config = generate_accelerator_and_instruction_configuration(
+        processing_element_count=pe_count,
+        controller_counter_bitwidth=10
+    )
+
+    # Compiling Several Vectors Against One Matrix
+    np.random.seed(seed)
+    matrix  = np.random.randint(-3, 4, size=(rows,cols))
+    vectors = np.random.randint(-3, 4, size=(cols,vector_count))
+    mem0, mem1, instructions, result_ranges = compile_matrix_matrix_multiplication_words(matrix, vectors, accel_config, precision)
+    mem0_bits, mem1_bits, bit_instructions, bit_ranges = compile_matrix_matrix_multiplication(matrix, vectors, accel_config, precision)
+
+    # The Matrix is Laid Out Exactly as for a Single Vector
+    mv_mem0, mv_mem1, _, _ = compile_matrix_vector_multiplication_words(matrix, vectors[:, :1], accel_config, precision)
+    all_correct = np.array_equal(mem0, mv_mem0) and (instructions == bit_instructions) and (result_ranges == bit_ranges)
+    all_correct = all_correct and np.array_equal(mem0, bits_to_words(mem0_bits, accel_config.BUFFER_CONFIG.MEM0_BITWIDTH))
+    all_correct = all_correct and np.array_equal(mem1, bits_to_words(mem1_bits, accel_config.BUFFER_CONFIG.MEM1_BITWIDTH))
+    if vector_count == 1:
+        all_correct = all_correct and np.array_equal(mem1, mv_mem1)
+
+    # Simulating the Single Instruction Stream and Comparing Every Column
+    program = assemble_program(inst_config, instructions, len(instructions) + 1)
+    mem2    = simulate_program(accel_config, inst_config, mem0, mem1, program)
+    result  = extract_matrix_results_from_memory(mem2, result_ranges, accel_config, precision)
+    all_correct = all_correct and np.array_equal(result, matrix @ vectors)
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print(f"(Rows:{rows},Cols:{cols},Vectors:{vector_count},Prec:{precision},PE Count:{pe_count}) Matrix Matrix Multiplication Test Passed.")
+        return 0
+    else:
+        print(f"(Rows:{rows},Cols:{cols},Vectors:{vector_count},Prec:{precision},PE Count:{pe_count}) Matrix Matrix Multiplication Test Failed.")
+        return 1
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+from src.assembler import Assembler
+from src.disassembler import Disassembler, DisassemblyError, verify_round_trip
+from src.fuzzer import generate_random_program
+from src.compiler import generate_accelerator_and_instruction_configuration
+from src.instruction import Instruction, MI
+import numpy as np
+import sys
+
+def main():
+
+    # Testing the Disassembler
+    errors = 0
+    errors += test_round_trip(10)
+    errors += test_round_trip(24)
+    errors += test_program_listing()
+    errors += test_unrepresentable_words()
+
+    # Determining the Status of All Tests
+    if errors == 0:
+        print("All Tests Passed!")
+    else:
+        print(f"{errors} Tests Failed!")
+    sys.exit(errors)
+
+def test_round_trip(counter_bitwidth : int) -> int:
+
+    # Assembling Random Programs over the Whole ISA
+    accel_config, inst_config = generate_accelerator_and_instruction_configuration(controller_counter_bitwidth=counter_bitwidth)
+    assembler    = Assembler(inst_config)
+    disassembler = Disassembler(inst_config)
+    program      = generate_random_program(np.random.default_rng(counter_bitwidth), accel_config, inst_config, 200)
+    values       = disassembler.get_encoding().encode_array(assembler.assemble_instructions(program))
+
+    # Assemble, Disassemble, Assemble is the Identity, and the Text is Canonical
+    lines = disassembler.disassemble_values(values)
+    all_correct = (verify_round_trip(inst_config, values) == [])
+    all_correct = all_correct and (lines == [" ".join(elem.split()) for elem in program])
+    all_correct = all_correct and (list(disassembler.iterate_disassembly([int(elem) for elem in values])) == lines)
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print(f"(Counter:{counter_bitwidth}) Round Trip Test Passed.")
+        return 0
+    else:
+        print(f"(Counter:{counter_bitwidth}) Round Trip Test Failed.")
+        return 1
+
+def test_program_listing() -> int:
+
+    # Zero Words End the Program, Later Non-Zero Words are Flagged as Unreachable
+    _, inst_config = generate_accelerator_and_instruction_configuration()
+    disassembler = Disassembler(inst_config)
+    program = ["NOP | CLR INT8 | 1 0 0", "READ INT16 3 5 | MAC INT16 | 10 1 1", "WRITE 7 | NOP INT8 | 1 0 0"]
+    values  = disassembler.get_encoding().encode_array(Assembler(inst_config).assemble_instructions(program))
+    padded  = np.concatenate([values, np.zeros(3, dtype=values.dtype), values[:1], np.zeros(2, dtype=values.dtype)])
+    listing = disassembler.list_program(padded)
+    all_correct = (listing.LINES == program) and (listing.PADDING == 5) and (listing.UNREACHABLE == [6]) and listing.TERMINATED
+
+    # A Program Without a Zero Word May Have Been Truncated
+    listing = disassembler.list_program(values[:2])
+    all_correct = all_correct and (listing.LINES == program[:2]) and (listing.PADDING == 0) and not listing.TERMINATED
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print("Program Listing Test Passed.")
+        return 0
+    else:
+        print("Program Listing Test Failed.")
+        return 1
+
+def test_unrepresentable_words() -> int:
+
+    # Words the Assembler Can Never Produce are Rejected with Their Index
+    _, inst_config = generate_accelerator_and_instruction_configuration()
+    disassembler = Disassembler(inst_config)
+    nop_with_offset = Instruction(inst_config)
+    nop_with_offset.get_mem_instruction().set_opcode(MI.NOP)
+    nop_with_offset.get_mem_instruction().set_mema_offset(3)
+    bad_opcode = Instruction(inst_config)
+    bad_opcode.get_pe_instruction().set_opcode(3)
+    all_correct = True
+    for inst in [nop_with_offset, bad_opcode]:
+        try:
+            disassembler.disassemble_values(np.array([1, inst.get_instruction_value()], dtype=np.uint64))
+            all_correct = False
+        except DisassemblyError as error:
+            all_correct = all_correct and (error.index == 1) and (error.value == inst.get_instruction_value())
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print("Unrepresentable Words Test Passed.")
+        return 0
+    else:
+        print("Unrepresentable Words Test Failed.")
+        return 1
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+from src.encoding import FieldLayout, words_to_values, values_to_words
+from src.instruction import Instruction, InstructionEncoding
+from src.assembler import Assembler
+from src.memory_image import bits_to_words
+from src.fuzzer import generate_random_program
+from src.compiler import generate_accelerator_and_instruction_configuration
+import numpy as np
+import sys
+
+def main():
+
+    # Testing the Instruction Encoding
+    errors = 0
+    errors += test_field_layout()
+    errors += test_encoding_matches_instruction(10)
+    errors += test_encoding_matches_instruction(24)
+    errors += test_field_range()
+
+    # Determining the Status of All Tests
+    if errors == 0:
+        print("All Tests Passed!")
+    else:
+        print(f"{errors} Tests Failed!")
+    sys.exit(errors)
+
+def test_field_layout() -> int:
+
+    # The First Field is the Most Significant
+    layout = FieldLayout([("A", 2), ("B", 5), ("C", 3)])
+    all_correct = (layout.WIDTH == 10) and (layout.FIELDS["A"].SHIFT == 8) and (layout.FIELDS["B"].MASK == 0b11111) and (layout.FIELDS["C"].SHIFT == 0)
+    all_correct = all_correct and (layout.pack((0b10, 0b00110, 0b101)) == 0b1000110101) and (layout.unpack(0b1000110101) == (0b10, 0b00110, 0b101))
+
+    # Packing Columns Matches Packing Rows
+    columns = {"A" : np.array([1, 3]), "B" : np.array([31, 0]), "C" : np.array([0, 7])}
+    packed  = layout.pack_array(columns)
+    all_correct = all_correct and (packed.tolist() == [layout.pack((1, 31, 0)), layout.pack((3, 0, 7))])
+    all_correct = all_correct and all(np.array_equal(layout.unpack_array(packed)[name], columns[name]) for name in columns)
+
+    # Rows of Bytes Convert to Integers and Back
+    words = np.array([[0x01, 0x02, 0x03], [0xFF, 0x00, 0x10]], dtype=np.uint8)
+    all_correct = all_correct and (words_to_values(words).tolist() == [0x010203, 0xFF0010])
+    all_correct = all_correct and np.array_equal(values_to_words(words_to_values(words), 24), words)
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print("Field Layout Test Passed.")
+        return 0
+    else:
+        print("Field Layout Test Failed.")
+        return 1
+
+def test_encoding_matches_instruction(counter_bitwidth : int) -> int:
+
+    # Assembling Random Programs over the Whole ISA
+    accel_config, inst_config = generate_accelerator_and_instruction_configuration(controller_counter_bitwidth=counter_bitwidth)
+    assembler = Assembler(inst_config)
+    encoding  = InstructionEncoding(inst_config)
+    program   = assembler.assemble_instructions(generate_random_program(np.random.default_rng(counter_bitwidth), accel_config, inst_config, 200))
+    bit_list  = [elem.get_instruction() for elem in program]
+    decoded   = [elem.decode() for elem in program]
+
+    # Single Instructions Encode to the Same Bits and Decode to the Same Records
+    all_correct = (encoding.WIDTH == program[0].get_width() == len(bit_list[0]))
+    all_correct = all_correct and all(encoding.encode_bits(elem) == bits for elem, bits in zip(program, bit_list))
+    all_correct = all_correct and all(encoding.decode_bits(bits) == elem for bits, elem in zip(bit_list, decoded))
+
+    # Setting the Bits Back on an Instruction Reproduces Every Field
+    round_trip = Instruction(inst_config)
+    round_trip.set_instruction(bit_list[-1])
+    all_correct = all_correct and (round_trip.get_instruction() == bit_list[-1]) and (round_trip.decode() == decoded[-1])
+
+    # Batches Agree with Single Instructions (Wider than 64 Bits Falls Back to Python Integers)
+    values = encoding.encode_array(program)
+    all_correct = all_correct and ([int(elem) for elem in values] == [elem.uint for elem in bit_list])
+    all_correct = all_correct and (encoding.decode_array(values) == decoded)
+    all_correct = all_correct and (encoding.decode_words(bits_to_words(bit_list, encoding.WIDTH)) == decoded)
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print(f"(Width:{encoding.WIDTH}) Encoding Matches Instruction Test Passed.")
+        return 0
+    else:
+        print(f"(Width:{encoding.WIDTH}) Encoding Matches Instruction Test Failed.")
+        return 1
+
+def test_field_range() -> int:
+
+    # Values Outside a Field are Rejected Whether Set, Packed Singly or Packed in Bulk
+    _, inst_config = generate_accelerator_and_instruction_configuration()
+    encoding = InstructionEncoding(inst_config)
+    all_correct = True
+    for action in [
+        lambda: Instruction(inst_config).set_count(1 << inst_config.COUNT_BITWIDTH),
+        lambda: Instruction(inst_config).set_mema_inc(-1),
+        lambda: encoding.get_layout().pack((4, 0, 0, 0, 0, 0, 0, 0, 0, 0)),
+        lambda: encoding.encode_fields({"PE_VALUE" : np.array([0, 32])})
+    ]:
+        try:
+            action()
+            all_correct = False
+        except ValueError:
+            pass
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print("Field Range Test Passed.")
+        return 0
+    else:
+        print("Field Range Test Failed.")
+        return 1
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+from src.fuzzer import FuzzCase, get_engines, generate_fuzz_case, find_divergence, minimize_program, minimize_counts, minimize_memory
+from src.compiler import generate_accelerator_and_instruction_configuration
+from src.memory_image import ints_to_words, words_to_bits
+from bitstring import Bits
+import numpy as np
+import sys
+
+def main():
+
+    # Testing the Differential Fuzzer
+    errors = 0
+    errors += test_backends_agree()
+    errors += test_reference_abstains_on_overflow()
+    errors += test_minimization()
+
+    # Determining the Status of All Tests
+    if errors == 0:
+        print("All Tests Passed!")
+    else:
+        print(f"{errors} Tests Failed!")
+    sys.exit(errors)
+
+def test_backends_agree() -> int:
+
+    # Random Programs Over the Whole ISA Must Run Identically on Every Engine
+    accel_config, inst_config = generate_accelerator_and_instruction_configuration(
+        processing_element_accumulation_bitwidth=64,
+        controller_counter_bitwidth=6
+    )
+    engines = get_engines(accel_config)
+    rng = np.random.default_rng(0)
+    divergences = []
+    for _ in range(20):
+        case = generate_fuzz_case(rng, accel_config, inst_config, 12)
+        divergence = find_divergence(case, engines, accel_config, inst_config)
+        if divergence is not None:
+            divergences.append((case.PROGRAM, divergence))
+
+    # Reporting Whether the Test Passed or Failed
+    if (len(engines) == 5) and (len(divergences) == 0):
+        print("Backends Agree Test Passed.")
+        return 0
+    else:
+        print(f"Backends Agree Test Failed, Divergences Were {divergences}.")
+        return 1
+
+def test_reference_abstains_on_overflow() -> int:
+
+    # Accumulating 127 * 127 Overflows an INT8 Lane, Which the Reference Rejects and the Other Engines Wrap
+    accel_config, inst_config = generate_accelerator_and_instruction_configuration(controller_counter_bitwidth=6)
+    buffer_config = accel_config.BUFFER_CONFIG
+    mem0 = words_to_bits(ints_to_words([0x7F7F7F7F] * buffer_config.MEM0_DEPTH, buffer_config.MEM0_BITWIDTH), buffer_config.MEM0_BITWIDTH)
+    mem1 = words_to_bits(ints_to_words([0x7F7F7F7F] * buffer_config.MEM1_DEPTH, buffer_config.MEM1_BITWIDTH), buffer_config.MEM1_BITWIDTH)
+    case = FuzzCase(["READ INT8 0 0 | MAC INT8 | 3 1 1", "NOP | OUT INT8 | 1 0 0", "WRITE 2 | NOP INT8 | 1 0 0"], mem0, mem1)
+    all_correct = find_divergence(case, get_engines(accel_config), accel_config, inst_config) is None
+
+    # Comparing Only the Reference Leaves Nothing to Compare Against
+    all_correct = all_correct and (find_divergence(case, get_engines(accel_config, ["reference"]), accel_config, inst_config) is None)
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print("Reference Abstains on Overflow Test Passed.")
+        return 0
+    else:
+        print("Reference Abstains on Overflow Test Failed.")
+        return 1
+
+def test_minimization() -> int:
+
+    # A Failure Needing Two Specific Instructions Shrinks to Exactly Those Two
+    program = [f"NOP | NOP INT8 | {i + 1} 0 0" for i in range(9)]
+    needed  = [program[2], program[7]]
+    minimal = minimize_program(program, lambda elem: all(line in elem for line in needed))
+    all_correct = (minimal == needed)
+
+    # A Failure Needing at Least Three Iterations Shrinks its Count to Three
+    is_failing = lambda elem: int(elem[0].rsplit("|", 1)[1].split()[0]) >= 3
+    all_correct = all_correct and (minimize_counts(["READ INT8 0 0 | MAC INT8 | 40 1 1"], is_failing) == ["READ INT8 0 0 | MAC INT8 | 3 1 1"])
+
+    # A Failure Needing One Non-Zero Word Keeps Only that Word
+    memory  = [Bits(uint=i + 1, length=32) for i in range(10)]
+    reduced = minimize_memory(memory, lambda elem: elem[6].uint != 0)
+    all_correct = all_correct and (reduced[6] == memory[6]) and all(elem.uint == 0 for i, elem in enumerate(reduced) if i != 6)
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print("Minimization Test Passed.")
+        return 0
+    else:
+        print(f"Minimization Test Failed, Minimal Program Was {minimal}.")
+        return 1
+
+if __name__ == "__main__":
+    main()
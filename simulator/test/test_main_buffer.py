@@ -1,7 +1,11 @@
 from src.assembler import Assembler
 from src.instruction import MemoryInstruction, InstConfig, MemoryInstructionConfiguration, ProcessingElementInstructionConfiguration
-from src.main_buffer import MainBuffer, MainBufferConfiguration
+from src.main_buffer import MainBuffer, ArrayMainBuffer, MainBufferConfiguration
+from src.memory_image import save_memory_image, ints_to_words
 from bitstring import Bits
+import numpy as np
+import tempfile
+import os
 import sys
 
 def main():
@@ -12,6 +16,8 @@ def main():
     errors += test_read_int16()
     errors += test_read_int8()
     errors += test_write()
+    errors += test_array_matches_reference()
+    errors += test_memory_image()
 
     # Determining the Status of All Tests
     if errors == 0:
@@ -199,6 +205,106 @@ def test_write() -> int:
         print(f"WRITE Test Failed.")
         return 1
 
+def test_array_matches_reference() -> int:
+
+    mem_config = MainBufferConfiguration(
+        MEM0_BITWIDTH=256,
+        MEM0_DEPTH=1024,
+        MEM1_BITWIDTH=32,
+        MEM1_DEPTH=1024,
+        MEM2_BITWIDTH=256,
+        MEM2_DEPTH=1024
+    )
+    reference_buffer = MainBuffer(mem_config)
+    array_buffer     = ArrayMainBuffer(mem_config)
+
+    # Populating Both Memories with Signed Values
+    np.random.seed(0)
+    mem0 = [int(elem) for elem in np.random.randint(-2**62, 2**62, size=1024)]
+    mem1 = [int(elem) for elem in np.random.randint(-2**31, 2**31, size=1024)]
+    for buffer in [reference_buffer, array_buffer]:
+        buffer.set_mem0(mem0)
+        buffer.set_mem1(mem1)
+
+    # Reading in Every Mode and Writing Each Port Back to Mem2
+    all_correct = True
+    for i in range(200):
+        mode = ["INT8", "INT16", "INT32"][i % 3]
+        insts = [
+            assemble_test_instruction(f"READ {mode} {np.random.randint(1024)} {np.random.randint(1024)}"),
+            assemble_test_instruction(f"WRITE {np.random.randint(1024)}")
+        ]
+        for buffer in [reference_buffer, array_buffer]:
+            buffer.execute_instruction(insts[0])
+            buffer.write_mem2_output(buffer.read_mem0_output())
+            buffer.execute_instruction(insts[1])
+        all_correct = all_correct and (reference_buffer.read_mem0_output() == array_buffer.read_mem0_output())
+        all_correct = all_correct and (reference_buffer.read_mem1_output() == array_buffer.read_mem1_output())
+    all_correct = all_correct and (reference_buffer.read_mem2() == array_buffer.read_mem2())
+    all_correct = all_correct and (reference_buffer.read_mem2_bits() == array_buffer.read_mem2_bits())
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print("Array Buffer Matches Reference Test Passed.")
+        return 0
+    else:
+        print("Array Buffer Matches Reference Test Failed.")
+        return 1
+
+def test_memory_image() -> int:
+
+    mem_config = MainBufferConfiguration(
+        MEM0_BITWIDTH=256,
+        MEM0_DEPTH=1024,
+        MEM1_BITWIDTH=32,
+        MEM1_DEPTH=1024,
+        MEM2_BITWIDTH=256,
+        MEM2_DEPTH=1024
+    )
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+
+        # Saving Images Shorter than the Memory Depth
+        mem0_file = os.path.join(tmp_dir, "mem0.npy")
+        mem1_file = os.path.join(tmp_dir, "mem1.npy")
+        mem2_file = os.path.join(tmp_dir, "mem2.npy")
+        save_memory_image(mem0_file, ints_to_words([(2 * i) for i in range(200)], mem_config.MEM0_BITWIDTH))
+        save_memory_image(mem1_file, ints_to_words([(i) for i in range(100)], mem_config.MEM1_BITWIDTH))
+
+        # Loading the Images into Both Buffers and Reading Inside and Past the Images
+        all_correct = True
+        for buffer in [MainBuffer(mem_config), ArrayMainBuffer(mem_config)]:
+            buffer.load_mem0_image(mem0_file)
+            buffer.load_mem1_image(mem1_file)
+            buffer.execute_instruction(assemble_test_instruction("READ INT32 130 26"))
+            all_correct = all_correct and (buffer.read_mem0_output().uint == 260) and (buffer.read_mem1_output().uint == 26)
+            buffer.execute_instruction(assemble_test_instruction("READ INT32 500 700"))
+            all_correct = all_correct and (buffer.read_mem0_output().uint == 0) and (buffer.read_mem1_output().uint == 0)
+
+            # Dumping Mem2 and Reloading it
+            buffer.write_mem2_output(Bits(uint=176, length=mem_config.MEM2_BITWIDTH))
+            buffer.execute_instruction(assemble_test_instruction("WRITE 15"))
+            buffer.dump_mem2_image(mem2_file)
+            mem2 = np.load(mem2_file)
+            all_correct = all_correct and (mem2.shape == (1024, 32)) and (int.from_bytes(mem2[15].tobytes(), 'big') == 176)
+            all_correct = all_correct and (int(mem2.sum()) == 176)
+
+        # Ensuring Images that Do Not Fit are Rejected
+        save_memory_image(mem1_file, ints_to_words([(i) for i in range(100)], 64))
+        try:
+            ArrayMainBuffer(mem_config).load_mem1_image(mem1_file)
+            all_correct = False
+        except ValueError:
+            pass
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print("Memory Image Test Passed.")
+        return 0
+    else:
+        print("Memory Image Test Failed.")
+        return 1
+
 def assemble_test_instruction(
         test_inst_str : str,
         opcode_bitwidth      =2,
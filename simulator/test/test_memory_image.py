@@ -0,0 +1,156 @@
+from src.memory_image import (
+    Endianness, NO_CONFIG_HASH, configuration_hash, is_packed_bits, read_packed_header,
+    save_packed_bits, load_packed_bits, load_bit_list, load_bit_words, save_bit_list, bits_to_words,
+    save_bit_stream, iter_bit_list
+)
+from src.compiler import generate_accelerator_and_instruction_configuration
+from bitstring import Bits
+import numpy as np
+import tempfile
+import os
+import sys
+
+def main():
+
+    # Testing the Memory Image Formats
+    errors = 0
+    errors += test_packed_round_trip(32, Endianness.BIG)
+    errors += test_packed_round_trip(32, Endianness.LITTLE)
+    errors += test_packed_round_trip(45, Endianness.BIG)
+    errors += test_ascii_matches_packed()
+    errors += test_config_hash()
+    errors += test_bit_stream()
+
+    # Determining the Status of All Tests
+    if errors == 0:
+        print("All Tests Passed!")
+    else:
+        print(f"{errors} Tests Failed!")
+    sys.exit(errors)
+
+def generate_bit_list(bitwidth : int, depth : int, seed : int) -> list[Bits]:
+    np.random.seed(seed)
+    return [Bits(uint=int(np.random.randint(0, 2**31)) << (bitwidth - 31), length=bitwidth) for _ in range(depth)]
+
+def test_packed_round_trip(bitwidth : int, endianness : int) -> int:
+
+    bit_list = generate_bit_list(bitwidth, 100, 0)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+
+        # Saving and Mapping the Words Back
+        file_name = os.path.join(tmp_dir, "mem.bits")
+        save_packed_bits(file_name, bits_to_words(bit_list, bitwidth), bitwidth, endianness=endianness)
+        header = read_packed_header(file_name)
+        words  = load_packed_bits(file_name, bitwidth)
+
+        # Checking the Header, Size and Contents
+        all_correct = is_packed_bits(file_name)
+        all_correct = all_correct and (header.WIDTH == bitwidth) and (header.DEPTH == 100) and (header.ENDIANNESS == endianness)
+        all_correct = all_correct and (isinstance(words.base, np.memmap) or isinstance(words, np.memmap))
+        all_correct = all_correct and (os.path.getsize(file_name) == 32 + (100 * ((bitwidth + 7) // 8)))
+        all_correct = all_correct and (load_bit_list(file_name) == bit_list)
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print(f"(Width:{bitwidth},Endianness:{endianness}) Packed Round Trip Test Passed.")
+        return 0
+    else:
+        print(f"(Width:{bitwidth},Endianness:{endianness}) Packed Round Trip Test Failed.")
+        return 1
+
+def test_ascii_matches_packed() -> int:
+
+    bit_list = generate_bit_list(128, 50, 1)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+
+        # Writing Both Formats
+        ascii_file  = os.path.join(tmp_dir, "ascii.bits")
+        packed_file = os.path.join(tmp_dir, "packed.bits")
+        save_bit_list(ascii_file, bit_list, 128, "ascii")
+        save_bit_list(packed_file, bit_list, 128, "packed")
+
+        # Loading Both Formats Through the Auto-Detecting Readers
+        all_correct = not is_packed_bits(ascii_file)
+        all_correct = all_correct and (load_bit_list(ascii_file, 128) == load_bit_list(packed_file, 128) == bit_list)
+        all_correct = all_correct and np.array_equal(load_bit_words(ascii_file, 128), load_bit_words(packed_file, 128))
+
+        # Ensuring a Width Mismatch is Rejected
+        try:
+            load_bit_words(packed_file, 64)
+            all_correct = False
+        except ValueError:
+            pass
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print("ASCII Matches Packed Test Passed.")
+        return 0
+    else:
+        print("ASCII Matches Packed Test Failed.")
+        return 1
+
+def test_config_hash() -> int:
+
+    # Hashing Two Different Designs
+    config_a = configuration_hash(*generate_accelerator_and_instruction_configuration(processing_element_count=4))
+    config_b = configuration_hash(*generate_accelerator_and_instruction_configuration(processing_element_count=8))
+    all_correct = (config_a != config_b) and (config_a != NO_CONFIG_HASH)
+
+    bit_list = generate_bit_list(32, 10, 2)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+
+        # Loading with the Matching Hash, or Without Any Expected Hash
+        file_name = os.path.join(tmp_dir, "mem.bits")
+        save_bit_list(file_name, bit_list, 32, "packed", config_a)
+        all_correct = all_correct and (load_bit_list(file_name, 32, config_a) == bit_list)
+        all_correct = all_correct and (load_bit_list(file_name, 32) == bit_list)
+
+        # Ensuring a File Built for Another Design is Rejected
+        try:
+            load_bit_list(file_name, 32, config_b)
+            all_correct = False
+        except ValueError:
+            pass
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print("Config Hash Test Passed.")
+        return 0
+    else:
+        print("Config Hash Test Failed.")
+        return 1
+
+def test_bit_stream() -> int:
+
+    bit_list = generate_bit_list(45, 10000, 2)
+    all_correct = True
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for file_format in ["ascii", "packed"]:
+
+            # Streaming a Generator Longer than One Chunk, then Padding with Zero Words
+            file_name = os.path.join(tmp_dir, f"stream_{file_format}.bits")
+            count = save_bit_stream(file_name, (elem for elem in bit_list), 45, file_format, min_depth=10005)
+            padded = bit_list + [Bits(uint=0, length=45)] * 5
+            all_correct = all_correct and (count == 10000) and (load_bit_list(file_name, 45) == padded)
+            all_correct = all_correct and (list(iter_bit_list(file_name, 45)) == padded)
+
+        # Ensuring a Word of the Wrong Width is Reported with its Line
+        file_name = os.path.join(tmp_dir, "bad.bits")
+        with open(file_name, "w") as file:
+            file.write("0101\n\n011\n")
+        try:
+            list(iter_bit_list(file_name, 4))
+            all_correct = False
+        except ValueError as error:
+            all_correct = all_correct and ("line 3" in str(error))
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print("Bit Stream Test Passed.")
+        return 0
+    else:
+        print("Bit Stream Test Failed.")
+        return 1
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+from src.mixed_precision import select_row_blocks, compile_mixed_precision_multiplication_words, extract_mixed_precision_results, save_mixed_precision_layout
+from src.compiler import generate_accelerator_and_instruction_configuration, compile_matrix_vector_multiplication_words
+from src.pipeline import assemble_program, simulate_program
+from src.instruction import Mode
+import numpy as np
+import tempfile
+import json
+import sys
+import os
+
+def main():
+
+    # Testing the Mixed Precision Compiler
+    errors = 0
+    errors += test_mode_selection()
+    errors += test_mixed_multiplication(100, 20, 1, 0)
+    errors += test_mixed_multiplication(70, 9, 3, 1)
+    errors += test_uniform_matches_compiler()
+    errors += test_saved_layout()
+
+    # Determining the Status of All Tests
+    if errors == 0:
+        print("All Tests Passed!")
+    else:
+        print(f"{errors} Tests Failed!")
+    sys.exit(errors)
+
+def get_configuration():
+    return generate_accelerator_and_instruction_configuration(
+        processing_element_count=4,
+        processing_element_accumulation_bitwidth=64,
+        controller_counter_bitwidth=10
+    )
+
+def test_mode_selection() -> int:
+
+    # Small Rows Use INT8, Rows Whose Sums Could Leave INT8 Use INT16, and Wide Values Need INT32
+    accel_config, _ = get_configuration()
+    matrix = np.ones((48, 10), dtype=np.int64)
+    matrix[16:24] = 20
+    matrix[24:28] = 70000
+    blocks = select_row_blocks(matrix, np.ones((10, 1), dtype=np.int64), accel_config)
+    all_correct = [(elem.ROW_START, elem.ROW_STOP, elem.BITWIDTH) for elem in blocks] == [
+        (0, 16, Mode.INT8), (16, 24, Mode.INT16), (24, 28, Mode.INT32), (28, 44, Mode.INT8), (44, 48, Mode.INT8)
+    ]
+    all_correct = all_correct and all([elem.EXACT for elem in blocks])
+
+    # The Vector Range Applies to Every Row Block, and Bounds Past INT32 Fall Back to INT32 Marked Inexact
+    blocks = select_row_blocks(np.ones((16, 10), dtype=np.int64), np.full((10, 1), 200), accel_config)
+    all_correct = all_correct and all([elem.BITWIDTH == Mode.INT16 for elem in blocks])
+    blocks = select_row_blocks(np.full((4, 10), 2**30), np.full((10, 1), 2**30), accel_config)
+    all_correct = all_correct and (len(blocks) == 1) and (blocks[0].BITWIDTH == Mode.INT32) and not blocks[0].EXACT
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print("Mode Selection Test Passed.")
+        return 0
+    else:
+        print("Mode Selection Test Failed.")
+        return 1
+
+def test_mixed_multiplication(rows, cols, vector_count, seed) -> int:
+
+    # Mixing Narrow Rows with a Band of Large Values
+    accel_config, inst_config = get_configuration()
+    np.random.seed(seed)
+    matrix  = np.random.randint(-3, 4, size=(rows, cols))
+    matrix[(rows // 2):((rows // 2) + 10)] *= 3000
+    vectors = np.random.randint(-3, 4, size=(cols, vector_count))
+    program = compile_mixed_precision_multiplication_words(matrix, vectors, accel_config)
+
+    # Several Modes are Used and the Row Blocks Cover Every Row in Order
+    all_correct = len(program.get_mode_block_counts()) > 1
+    all_correct = all_correct and ([elem.ROW_START for elem in program.ROW_BLOCKS[1:]] == [elem.ROW_STOP for elem in program.ROW_BLOCKS[:-1]])
+    all_correct = all_correct and (program.get_row_count() == rows)
+
+    # Simulating Gives the Exact Product
+    instructions = assemble_program(inst_config, program.INSTRUCTIONS, len(program.INSTRUCTIONS))
+    mem2 = simulate_program(accel_config, inst_config, program.MEM0, program.MEM1, instructions)
+    all_correct = all_correct and np.array_equal(extract_mixed_precision_results(program, mem2, accel_config), matrix @ vectors)
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print(f"(Rows:{rows},Cols:{cols},Vectors:{vector_count}) Mixed Multiplication Test Passed.")
+        return 0
+    else:
+        print(f"(Rows:{rows},Cols:{cols},Vectors:{vector_count}) Mixed Multiplication Test Failed.")
+        return 1
+
+def test_uniform_matches_compiler() -> int:
+
+    # When Every Row Block Picks the Same Mode the Program is the Single Precision One
+    accel_config, _ = get_configuration()
+    np.random.seed(2)
+    matrix  = np.random.randint(-1, 2, size=(40, 12))
+    vector  = np.random.randint(-1, 2, size=(12, 1))
+    program = compile_mixed_precision_multiplication_words(matrix, vector, accel_config)
+    mem0, mem1, instructions, _ = compile_matrix_vector_multiplication_words(matrix, vector, accel_config, Mode.INT8)
+    all_correct = (program.get_mode_block_counts() == {Mode.INT8 : 3}) and (program.INSTRUCTIONS == instructions)
+    all_correct = all_correct and np.array_equal(program.MEM0, mem0) and np.array_equal(program.MEM1, mem1)
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print("Uniform Matches Compiler Test Passed.")
+        return 0
+    else:
+        print("Uniform Matches Compiler Test Failed.")
+        return 1
+
+def test_saved_layout() -> int:
+
+    # The Layout Names the Mode and MEM2 Entries of Each Row Block
+    accel_config, _ = get_configuration()
+    matrix = np.ones((24, 4), dtype=np.int64)
+    matrix[16:] = 1000
+    program = compile_mixed_precision_multiplication_words(matrix, np.ones((4, 2), dtype=np.int64), accel_config)
+    with tempfile.TemporaryDirectory() as directory:
+        file_name = os.path.join(directory, "layout.json")
+        save_mixed_precision_layout(program, file_name)
+        with open(file_name) as file:
+            layout = json.load(file)
+    all_correct = (layout["rows"] == 24) and (layout["vector_count"] == 2)
+    all_correct = all_correct and ([elem["precision"] for elem in layout["row_blocks"]] == ["INT8", "INT16"])
+    all_correct = all_correct and ([elem["mem2_entries"] for elem in layout["row_blocks"]] == [[0, 2], [1, 3]])
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print("Saved Layout Test Passed.")
+        return 0
+    else:
+        print(f"Saved Layout Test Failed, Layout Was {layout}.")
+        return 1
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+from src.accelerator import Accelerator
+from src.numpy_accelerator import NumpyAccelerator
+from src.assembler import Assembler
+from src.instruction import Mode
+from src.compiler import generate_accelerator_and_instruction_configuration, compile_matrix_vector_multiplication
+from bitstring import Bits
+import numpy as np
+import sys
+
+def main():
+
+    # Testing the NumPy Accelerator Against the Reference Model
+    errors = 0
+    errors += test_matrix_vector(64, 16, 0, Mode.INT8, 4)
+    errors += test_matrix_vector(48, 10, 1, Mode.INT16, 5)
+    errors += test_matrix_vector(30, 7, 2, Mode.INT32, 3)
+    errors += test_mixed_program()
+
+    # Determining the Status of All Tests
+    if errors == 0:
+        print("All Tests Passed!")
+    else:
+        print(f"{errors} Tests Failed!")
+    sys.exit(errors)
+
+def test_matrix_vector(rows, cols, seed, precision, pe_count) -> int:
+
+    # Configuring
+    accel_config, inst_config = generate_accelerator_and_instruction_configuration(
+        processing_element_count=pe_count,
+        controller_counter_bitwidth=10
+    )
+    assembler = Assembler(inst_config)
+
+    # Compiling a Random Computation
+    np.random.seed(seed)
+    matrix = np.random.randint(-5, 5, size=(rows,cols))
+    vector = np.random.randint(-5, 5, size=(cols,1))
+    mem0, mem1, instructions, _ = compile_matrix_vector_multiplication(
+        matrix, vector, accel_config, precision
+    )
+
+    # Running Both Models
+    reference_mem2, numpy_mem2 = run_both_models(accel_config, assembler, mem0, mem1, instructions)
+
+    # Reporting Whether the Test Passed or Failed
+    if reference_mem2 == numpy_mem2:
+        print(f"(Rows:{rows},Cols:{cols},Prec:{precision},PE Count:{pe_count}) Matrix Vector Test Passed.")
+        return 0
+    else:
+        print(f"(Rows:{rows},Cols:{cols},Prec:{precision},PE Count:{pe_count}) Matrix Vector Test Failed.")
+        return 1
+
+def test_mixed_program() -> int:
+
+    # Configuring
+    accel_config, inst_config = generate_accelerator_and_instruction_configuration(
+        processing_element_count=4,
+        processing_element_accumulation_bitwidth=64,
+        controller_counter_bitwidth=10
+    )
+    assembler = Assembler(inst_config)
+
+    # Filling the Memories with Small Bytes so the Reference Never Overflows
+    np.random.seed(3)
+    mem0 = [
+        Bits(bytes=np.random.randint(-4, 5, size=accel_config.BUFFER_CONFIG.MEM0_BITWIDTH // 8).astype(np.int8).tobytes())
+        for _ in range(accel_config.BUFFER_CONFIG.MEM0_DEPTH)
+    ]
+    mem1 = [
+        Bits(bytes=np.random.randint(-4, 5, size=accel_config.BUFFER_CONFIG.MEM1_BITWIDTH // 8).astype(np.int8).tobytes())
+        for _ in range(accel_config.BUFFER_CONFIG.MEM1_DEPTH)
+    ]
+
+    # Program Exercising Every PE Operation, Repeated Writes and Stale Buffer Ports
+    program = [
+        "NOP | CLR INT16 | 1 0 0",
+        "READ INT16 3 5 | MAC INT16 | 20 1 1",
+        "NOP | OUT INT16 | 1 0 0",
+        "WRITE 2 | NOP INT16 | 3 1 0",
+        "READ INT8 40 7 | PASS INT8 | 4 1 1",
+        "NOP | RND INT8 2 | 2 0 0",
+        "WRITE 9 | OUT INT8 | 3 1 0",
+        "READ INT32 10 1 | MAC INT32 | 8 1 1",
+        "NOP | MAC INT32 | 3 0 0",
+        "NOP | OUT INT32 | 1 0 0",
+        "WRITE 20 | CLR INT32 | 2 0 0",
+        "READ INT8 100 13 | MAC INT8 | 17 1 1",
+        "WRITE 30 | OUT INT8 | 2 0 0",
+    ]
+
+    # Running Both Models
+    reference_mem2, numpy_mem2 = run_both_models(accel_config, assembler, mem0, mem1, program)
+
+    # Reporting Whether the Test Passed or Failed
+    if reference_mem2 == numpy_mem2:
+        print("Mixed Program Test Passed.")
+        return 0
+    else:
+        print("Mixed Program Test Failed.")
+        return 1
+
+def run_both_models(accel_config, assembler, mem0, mem1, program) -> tuple[list[str], list[str]]:
+
+    # Running the Reference Model
+    reference = Accelerator(accel_config)
+    reference.set_memory(mem0, mem1)
+    reference.execute_instructions(assembler.assemble_instructions(program))
+    reference_mem2 = [elem.bin for elem in reference.get_mem2()]
+
+    # Running the NumPy Model
+    accelerator = NumpyAccelerator(accel_config)
+    accelerator.set_memory(mem0, mem1)
+    accelerator.execute_instructions(assembler.assemble_instructions(program))
+    numpy_mem2 = [elem.bin for elem in accelerator.get_mem2()]
+
+    return reference_mem2, numpy_mem2
+
+if __name__ == "__main__":
+    main()
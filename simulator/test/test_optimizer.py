@@ -0,0 +1,198 @@
+from src.optimizer import optimize_instructions, optimize_assembly
+from src.segmentation import partition_program
+from src.timing import estimate_program_timing
+from src.compiler import generate_accelerator_and_instruction_configuration, compile_matrix_vector_multiplication, extract_results_from_memory
+from src.accelerator import Accelerator
+from src.assembler import Assembler
+from src.instruction import Mode
+import numpy as np
+import sys
+
+def main():
+
+    # Testing the Peephole Optimizer
+    errors = 0
+    errors += test_compiled_program(100, 12, Mode.INT8)
+    errors += test_compiled_program(37, 5, Mode.INT16)
+    errors += test_compiled_program(9, 7, Mode.INT32)
+    errors += test_rewrites()
+    errors += test_illegal_fusion()
+    errors += test_read_fusion()
+    errors += test_optimized_segments()
+
+    # Determining the Status of All Tests
+    if errors == 0:
+        print("All Tests Passed!")
+    else:
+        print(f"{errors} Tests Failed!")
+    sys.exit(errors)
+
+def get_configuration():
+    return generate_accelerator_and_instruction_configuration(
+        processing_element_count=4,
+        processing_element_accumulation_bitwidth=64,
+        controller_counter_bitwidth=10
+    )
+
+def simulate(accel_config, mem0, mem1, program) -> list:
+    accelerator = Accelerator(accel_config)
+    accelerator.set_memory(mem0, mem1)
+    accelerator.execute_instructions(program)
+    return accelerator.get_mem2()
+
+def test_compiled_program(rows, cols, precision) -> int:
+
+    # Compiling a Matrix Vector Multiplication with Several Row Blocks
+    accel_config, inst_config = get_configuration()
+    np.random.seed(rows)
+    matrix = np.random.randint(-2, 3, size=(rows, cols))
+    vector = np.random.randint(-2, 3, size=(cols, 1))
+    mem0, mem1, assembly, row_count = compile_matrix_vector_multiplication(matrix, vector, accel_config, precision)
+    optimized, result = optimize_assembly(inst_config, assembly)
+
+    # Every Write Takes Over the Following Clear, Saving One Two Cycle Instruction per Row Block After the First
+    row_blocks  = len(assembly) // 4
+    all_correct = (len(optimized) == (3 * row_blocks) + 1) and (result.FUSED == row_blocks - 1)
+    all_correct = all_correct and (result.get_cycle_savings() == 2 * (row_blocks - 1))
+    all_correct = all_correct and (result.CYCLES_AFTER == estimate_program_timing(Assembler(inst_config).assemble_instructions(optimized)).TOTAL_CYCLES)
+
+    # The Optimized Program Computes the Same MEM2
+    program = Assembler(inst_config).assemble_instructions(assembly)
+    all_correct = all_correct and (simulate(accel_config, mem0, mem1, program) == simulate(accel_config, mem0, mem1, result.INSTRUCTIONS))
+    output = extract_results_from_memory(simulate(accel_config, mem0, mem1, result.INSTRUCTIONS), row_count, accel_config, precision)
+    all_correct = all_correct and np.array_equal(output, (matrix @ vector).flatten())
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print(f"(Rows:{rows},Cols:{cols},Prec:{precision}) Compiled Program Test Passed.")
+        return 0
+    else:
+        print(f"(Rows:{rows},Cols:{cols},Prec:{precision}) Compiled Program Test Failed.")
+        return 1
+
+def test_rewrites() -> int:
+
+    # Repeated Clears and No-Ops Disappear, and a Clear Sharing a Slot Keeps its Memory Operation
+    _, inst_config = get_configuration()
+    optimized, result = optimize_assembly(inst_config, [
+        "NOP | CLR INT8 | 1 0 0",
+        "NOP | NOP INT8 | 3 0 0",
+        "NOP | CLR INT8 | 1 0 0",
+        "READ INT8 0 0 | CLR INT8 | 1 0 0",
+        "READ INT8 0 0 | MAC INT8 | 4 1 1",
+        "NOP | OUT INT8 | 1 0 0",
+        "WRITE 0 | NOP INT8 | 1 0 0",
+        "NOP | RND INT8 2 | 1 0 0"
+    ])
+    all_correct = optimized == [
+        "NOP | CLR INT8 | 1 0 0",
+        "READ INT8 0 0 | NOP INT8 | 1 0 0",
+        "READ INT8 0 0 | MAC INT8 | 4 1 1",
+        "NOP | OUT INT8 | 1 0 0",
+        "WRITE 0 | RND INT8 2 | 1 0 0"
+    ]
+    all_correct = all_correct and (result.REMOVED_CLEARS == 2) and (result.REMOVED_NOPS == 2) and (result.FUSED == 1)
+    all_correct = all_correct and (result.get_cycle_savings() == 4 + 2 + 2)
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print("Rewrites Test Passed.")
+        return 0
+    else:
+        print(f"Rewrites Test Failed, Optimized to {optimized}.")
+        return 1
+
+def test_illegal_fusion() -> int:
+
+    # Counted Instructions are Never Fused, Nor are Two Instructions Both Using the Same Slot
+    _, inst_config = get_configuration()
+    assembly = [
+        "READ INT8 1 0 | NOP INT8 | 1 0 0",
+        "NOP | MAC INT8 | 2 0 0",
+        "READ INT8 2 0 | PASS INT8 | 1 0 0",
+        "WRITE 0 | NOP INT8 | 2 0 0",
+        "NOP | OUT INT8 | 1 0 0"
+    ]
+    optimized, result = optimize_assembly(inst_config, assembly)
+    all_correct = (optimized == assembly) and (result.get_cycle_savings() == 0)
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print("Illegal Fusion Test Passed.")
+        return 0
+    else:
+        print(f"Illegal Fusion Test Failed, Optimized to {optimized}.")
+        return 1
+
+def test_read_fusion() -> int:
+
+    # The Memory Slot Runs First, so a READ Fused with the MAC or PASS After it Still Feeds it
+    accel_config, inst_config = get_configuration()
+    np.random.seed(3)
+    mem0, mem1, _, _ = compile_matrix_vector_multiplication(np.random.randint(-3, 4, size=(16, 4)), np.random.randint(-3, 4, size=(4, 1)), accel_config, Mode.INT8)
+    assembly = [
+        "NOP | CLR INT8 | 1 0 0",
+        "READ INT8 1 0 | NOP INT8 | 1 0 0",
+        "NOP | MAC INT8 | 1 0 0",
+        "READ INT8 2 4 | NOP INT8 | 1 0 0",
+        "NOP | MAC INT8 | 1 0 0",
+        "NOP | OUT INT8 | 1 0 0",
+        "WRITE 0 | NOP INT8 | 1 0 0",
+        "READ INT8 3 0 | NOP INT8 | 1 0 0",
+        "NOP | PASS INT8 | 1 0 0",
+        "NOP | OUT INT8 | 1 0 0",
+        "WRITE 1 | NOP INT8 | 1 0 0"
+    ]
+    optimized, result = optimize_assembly(inst_config, assembly)
+    all_correct = optimized == [
+        "NOP | CLR INT8 | 1 0 0",
+        "READ INT8 1 0 | MAC INT8 | 1 0 0",
+        "READ INT8 2 4 | MAC INT8 | 1 0 0",
+        "NOP | OUT INT8 | 1 0 0",
+        "WRITE 0 | NOP INT8 | 1 0 0",
+        "READ INT8 3 0 | PASS INT8 | 1 0 0",
+        "NOP | OUT INT8 | 1 0 0",
+        "WRITE 1 | NOP INT8 | 1 0 0"
+    ]
+    all_correct = all_correct and (result.FUSED == 3)
+
+    # The Fused Program Computes the Same MEM2
+    program = Assembler(inst_config).assemble_instructions(assembly)
+    all_correct = all_correct and (simulate(accel_config, mem0, mem1, program) == simulate(accel_config, mem0, mem1, result.INSTRUCTIONS))
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print("Read Fusion Test Passed.")
+        return 0
+    else:
+        print(f"Read Fusion Test Failed, Optimized to {optimized}.")
+        return 1
+
+def test_optimized_segments() -> int:
+
+    # Optimized Programs Still Split Without Handing Off PE State, and Run to the Same Result
+    accel_config, inst_config = get_configuration()
+    np.random.seed(0)
+    matrix = np.random.randint(-2, 3, size=(120, 10))
+    vector = np.random.randint(-2, 3, size=(10, 1))
+    mem0, mem1, assembly, row_count = compile_matrix_vector_multiplication(matrix, vector, accel_config, Mode.INT8)
+    result   = optimize_instructions(Assembler(inst_config).assemble_instructions(assembly))
+    segments = partition_program(result.INSTRUCTIONS, 8)
+    accelerator = Accelerator(accel_config)
+    accelerator.set_memory(mem0, mem1)
+    for segment in segments:
+        accelerator.execute_instructions(segment.INSTRUCTIONS)
+    output = extract_results_from_memory(accelerator.get_mem2(), row_count, accel_config, Mode.INT8)
+    all_correct = (len(segments) > 1) and not any([elem.CARRIES_PE_STATE for elem in segments])
+    all_correct = all_correct and np.array_equal(output, (matrix @ vector).flatten())
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print("Optimized Segments Test Passed.")
+        return 0
+    else:
+        print("Optimized Segments Test Failed.")
+        return 1
+
+if __name__ == "__main__":
+    main()
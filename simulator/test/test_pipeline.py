@@ -0,0 +1,115 @@
+from src.pipeline import PipelineConfiguration, PIPELINE_FILE_NAMES, run_pipeline, run_and_save_pipeline, save_pipeline_outputs
+from src.build_cache import BuildCache
+from src.assembler import Assembler
+from src.memory_image import load_bit_list
+from src.compiler import compile_matrix_vector_multiplication
+from src.instruction import Mode
+import numpy as np
+import contextlib
+import io
+import tempfile
+import sys
+import os
+
+def main():
+
+    # Testing the Single Process Pipeline
+    errors = 0
+    errors += test_pipeline_matches_tools(Mode.INT8)
+    errors += test_pipeline_matches_tools(Mode.INT32)
+    errors += test_saved_collateral()
+    errors += test_cached_run()
+
+    # Determining the Status of All Tests
+    if errors == 0:
+        print("All Tests Passed!")
+    else:
+        print(f"{errors} Tests Failed!")
+    sys.exit(errors)
+
+def test_pipeline_matches_tools(precision : int) -> int:
+
+    # Running the Whole Flow in Process on a Small Design
+    config = PipelineConfiguration(ROWS=20, COLS=13, PRECISION=precision, PE_COUNT=4, COUNTER_BITWIDTH=10, IMEM_DEPTH=32)
+    result = run_pipeline(config)
+
+    # Every Stage Agrees with the Standalone Compiler and Assembler
+    accel_config, inst_config = config.get_configurations()
+    mem0, mem1, assembly, _ = compile_matrix_vector_multiplication(result.MATRIX, result.VECTOR, accel_config, precision)
+    program = [elem.get_instruction().uint for elem in Assembler(inst_config).assemble_instructions(assembly)]
+    all_correct = (result.ASSEMBLY == assembly) and (len(result.INSTRUCTIONS) == 32)
+    all_correct = all_correct and ([int(elem) for elem in result.INSTRUCTIONS] == program + [0] * (32 - len(program)))
+    all_correct = all_correct and (result.MATRIX.shape == (20, 13)) and (result.VECTOR.shape == (13, 1))
+    all_correct = all_correct and result.is_correct() and np.array_equal(result.GOLD, (result.MATRIX @ result.VECTOR).flatten())
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print(f"(Prec:{precision}) Pipeline Matches Tools Test Passed.")
+        return 0
+    else:
+        print(f"(Prec:{precision}) Pipeline Matches Tools Test Failed.")
+        return 1
+
+def test_saved_collateral() -> int:
+
+    # Only the Testbench Collateral is Written Unless More is Requested
+    config = PipelineConfiguration(ROWS=8, COLS=8, PE_COUNT=4, COUNTER_BITWIDTH=10, IMEM_DEPTH=16)
+    result = run_pipeline(config)
+    with tempfile.TemporaryDirectory() as directory:
+        written = save_pipeline_outputs(result, directory)
+        all_correct = sorted(os.listdir(directory)) == sorted([PIPELINE_FILE_NAMES[elem] for elem in ["instructions", "mem0", "mem1"]])
+
+        # The Written Files Hold the Words Computed in Memory
+        instructions = load_bit_list(written[0])
+        all_correct = all_correct and ([elem.uint for elem in instructions] == [int(elem) for elem in result.INSTRUCTIONS])
+        defines_file = os.path.join(directory, "defines.sv")
+        out_file     = os.path.join(directory, "out.bits")
+        written = save_pipeline_outputs(result, directory, defines_file, out_file, save_assembly=True)
+        all_correct = all_correct and (len(written) == 6) and (load_bit_list(out_file) == result.MEM2)
+        with open(defines_file) as file:
+            all_correct = all_correct and (file.read() == result.DEFINES)
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print("Saved Collateral Test Passed.")
+        return 0
+    else:
+        print("Saved Collateral Test Failed.")
+        return 1
+
+def test_cached_run() -> int:
+
+    # Running Twice with Identical Parameters, Removing the Collateral in Between
+    config = PipelineConfiguration(ROWS=30, COLS=9, PE_COUNT=4, COUNTER_BITWIDTH=10, IMEM_DEPTH=6)
+    with tempfile.TemporaryDirectory() as directory:
+        cache   = BuildCache(os.path.join(directory, "cache"))
+        out_dir = os.path.join(directory, "software")
+        files   = [os.path.join(out_dir, elem) for elem in PIPELINE_FILE_NAMES.values()] + [os.path.join(directory, "defines.sv"), os.path.join(directory, "out.bits")]
+        hits, contents, reports = [], [], []
+        for _ in range(2):
+            reports.append(io.StringIO())
+            with contextlib.redirect_stderr(reports[-1]):
+                hits.append(run_and_save_pipeline(config, out_dir, files[-2], files[-1], save_assembly=True, cache=cache))
+            contents.append([open(elem, "rb").read() for elem in files])
+            for elem in files:
+                os.remove(elem)
+
+        # The Second Run is a Hit with Byte Identical Collateral and the Same Report (Including the Size Warning)
+        all_correct = (hits == [False, True]) and (contents[0] == contents[1])
+        all_correct = all_correct and (reports[0].getvalue() == reports[1].getvalue()) and ("WARNING" in reports[0].getvalue())
+
+        # A Different Seed is a Different Entry
+        with contextlib.redirect_stderr(io.StringIO()):
+            hit = run_and_save_pipeline(PipelineConfiguration(ROWS=30, COLS=9, VECTOR_SEED=1, PE_COUNT=4, COUNTER_BITWIDTH=10, IMEM_DEPTH=6), out_dir, cache=cache)
+        all_correct = all_correct and not hit
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print("Cached Run Test Passed.")
+        return 0
+    else:
+        print("Cached Run Test Failed.")
+        return 1
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,8 @@
-from src.processing_element import ProcessingElement, ProcessingElementConfiguration
+from src.processing_element import ProcessingElement, IntegerProcessingElement, ProcessingElementConfiguration
 from src.instruction import ProcessingElementInstruction, ProcessingElementInstructionConfiguration, MemoryInstructionConfiguration, InstConfig
 from src.assembler import Assembler
 import sys
+import numpy as np
 from bitstring import Bits
 
 
@@ -13,6 +14,8 @@ def main():
     errors += test_pass()
     errors += test_rnd()
     errors += test_clr()
+    errors += test_integer_matches_reference()
+    errors += test_integer_mac_wrap()
 
     # Determining the Status of All Tests
     if errors == 0:
@@ -205,6 +208,74 @@ def test_clr() -> int:
         return 1
 
 
+def test_integer_matches_reference() -> int:
+
+    # Creating a Test PE Configuration
+    pe_test_config = ProcessingElementConfiguration(
+        INPUT_BITWIDTH=32,
+        ACCUMULATION_BITWIDTH=(32*2),
+        OUTPUT_BITWIDTH=32
+    )
+    reference_pe = ProcessingElement(pe_test_config)
+    integer_pe   = IntegerProcessingElement(pe_test_config)
+
+    # Running Random Instruction Sequences, Clearing Whenever the Mode Changes
+    np.random.seed(0)
+    operations = ["MAC", "MAC", "MAC", "OUT", "PASS", "NOP"]
+    for _ in range(20):
+        mode = np.random.choice(["INT8", "INT16", "INT32"])
+        inst_list = [f"CLR {mode}"] + [f"{np.random.choice(operations)} {mode}" for _ in range(20)] + [f"RND {mode} {np.random.randint(0, 4)}", f"OUT {mode}"]
+        for elem in inst_list:
+
+            # Loading Small Random Inputs into Both PEs
+            a_value = Bits(bytes=np.random.randint(-4, 5, size=4).astype(np.int8).tobytes())
+            b_value = Bits(bytes=np.random.randint(-4, 5, size=4).astype(np.int8).tobytes())
+            reference_pe.input_a(a_value)
+            reference_pe.input_b(b_value)
+            integer_pe.input_a(a_value)
+            integer_pe.input_b(b_value)
+
+            # Executing and Comparing State
+            inst = assemble_test_instruction(elem)
+            reference_pe.execute_instruction(inst)
+            integer_pe.execute_instruction(inst)
+            if (reference_pe.get_accumulation() != integer_pe.get_accumulation()) or (reference_pe.get_output() != integer_pe.get_output()):
+                print(f"Integer PE Reference Test Failed on \"{elem}\".")
+                return 1
+
+    print("Integer PE Reference Test Passed.")
+    return 0
+
+def test_integer_mac_wrap() -> int:
+
+    # Creating a Test PE Configuration
+    pe_test_config = ProcessingElementConfiguration(
+        INPUT_BITWIDTH=32,
+        ACCUMULATION_BITWIDTH=32,
+        OUTPUT_BITWIDTH=32
+    )
+    test_pe = IntegerProcessingElement(pe_test_config)
+
+    # Loading the Inputs
+    a_value = Bits().join([Bits(int=-128,length=8), Bits(int=127,length=8), Bits(int=100,length=8), Bits(int=2,length=8)])
+    b_value = Bits().join([Bits(int=-128,length=8), Bits(int=127,length=8), Bits(int=100,length=8), Bits(int=3,length=8)])
+    test_pe.input_a(a_value)
+    test_pe.input_b(b_value)
+
+    # Executing the Instructions
+    for elem in ["MAC INT8", "OUT INT8"]:
+        test_pe.execute_instruction(assemble_test_instruction(elem))
+
+    # Each Product Wraps Within its 8-bit Lane
+    correct_output = Bits().join([Bits(uint=(value & 0xff), length=8) for value in [-128 * -128, 127 * 127, 100 * 100, 6]])
+    if test_pe.get_output() == correct_output:
+        print("Integer PE Wrap Test Passed.")
+        return 0
+    else:
+        print(f"Integer PE Wrap Test Failed, Value Was {test_pe.get_output()}.")
+        return 1
+
+
 def assemble_test_instruction(
         test_inst_str : str,
         opcode_bitwidth=2,
@@ -0,0 +1,173 @@
+from src.segmentation import partition_program, iterate_program_segments, iterate_segments, get_segment_capacity, is_segment_boundary
+from src.timing import TimingConfiguration, estimate_program_timing, estimate_segmented_program_timing
+from src.compiler import generate_accelerator_and_instruction_configuration, compile_matrix_vector_multiplication, extract_results_from_memory
+from src.accelerator import Accelerator
+from src.assembler import Assembler
+from src.instruction import Mode
+import numpy as np
+import sys
+
+def main():
+
+    # Testing the Program Segmentation
+    errors = 0
+    errors += test_partition_boundaries(16)
+    errors += test_partition_boundaries(7)
+    errors += test_partition_without_clears()
+    errors += test_streamed_partition()
+    errors += test_iterate_segments()
+    errors += test_segmented_execution()
+    errors += test_segmented_timing()
+
+    # Determining the Status of All Tests
+    if errors == 0:
+        print("All Tests Passed!")
+    else:
+        print(f"{errors} Tests Failed!")
+    sys.exit(errors)
+
+def compile_program(rows, cols, precision=Mode.INT8):
+
+    # Compiling a Matrix Vector Multiplication on a Small Design
+    accel_config, inst_config = generate_accelerator_and_instruction_configuration(
+        processing_element_count=4,
+        processing_element_accumulation_bitwidth=64,
+        controller_counter_bitwidth=10
+    )
+    np.random.seed(rows)
+    matrix = np.random.randint(-2, 3, size=(rows, cols))
+    vector = np.random.randint(-2, 3, size=(cols, 1))
+    mem0, mem1, assembly, row_count = compile_matrix_vector_multiplication(matrix, vector, accel_config, precision)
+    return accel_config, inst_config, matrix, vector, mem0, mem1, Assembler(inst_config).assemble_instructions(assembly), row_count
+
+def test_partition_boundaries(imem_depth) -> int:
+
+    # Splitting a Program Several Times Longer than the Instruction Memory
+    _, _, _, _, _, _, program, _ = compile_program(200, 12)
+    segments = partition_program(program, imem_depth)
+
+    # Segments Fit with their Terminator, Cover the Program in Order and Start Next to an Accumulator Clear
+    all_correct = len(segments) > 1
+    all_correct = all_correct and all([elem.get_length() <= get_segment_capacity(imem_depth) for elem in segments])
+    all_correct = all_correct and ([inst for elem in segments for inst in elem.INSTRUCTIONS] == program)
+    all_correct = all_correct and ([elem.START for elem in segments] == list(np.cumsum([0] + [elem.get_length() for elem in segments[:-1]])))
+    all_correct = all_correct and all([is_segment_boundary(program[elem.START - 1] if elem.START else None, program[elem.START]) for elem in segments])
+    all_correct = all_correct and not any([elem.CARRIES_PE_STATE for elem in segments])
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print(f"(IMEM Depth:{imem_depth}) Partition Boundaries Test Passed.")
+        return 0
+    else:
+        print(f"(IMEM Depth:{imem_depth}) Partition Boundaries Test Failed.")
+        return 1
+
+def test_partition_without_clears() -> int:
+
+    # Programs Without Clears are Split at the Capacity and Marked as Handing Off PE State
+    _, inst_config = generate_accelerator_and_instruction_configuration()
+    program  = Assembler(inst_config).assemble_instructions(["READ INT8 0 0 | MAC INT8 | 1 1 1"] * 10)
+    segments = partition_program(program, 4)
+    all_correct = ([elem.get_length() for elem in segments] == [3, 3, 3, 1])
+    all_correct = all_correct and ([elem.CARRIES_PE_STATE for elem in segments] == [True, True, True, False])
+
+    # Instruction Memories Without Room for the Terminator are Rejected
+    try:
+        partition_program(program, 1)
+        all_correct = False
+    except ValueError:
+        pass
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print("Partition Without Clears Test Passed.")
+        return 0
+    else:
+        print("Partition Without Clears Test Failed.")
+        return 1
+
+def test_streamed_partition() -> int:
+
+    # Segments are Cut as the Program Streams Past, Reading at Most One Instruction Beyond Each Segment
+    _, _, _, _, _, _, program, _ = compile_program(200, 12)
+    consumed = []
+    def stream():
+        for elem in program:
+            consumed.append(elem)
+            yield elem
+    segments = iterate_program_segments(stream(), 16)
+    first    = next(segments)
+    all_correct = (len(consumed) == get_segment_capacity(16) + 1) and (first.INSTRUCTIONS == program[:first.get_length()])
+
+    # The Streamed Segments Match Partitioning the Whole Program
+    all_correct = all_correct and ([first] + list(segments) == partition_program(program, 16))
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print("Streamed Partition Test Passed.")
+        return 0
+    else:
+        print("Streamed Partition Test Failed.")
+        return 1
+
+def test_iterate_segments() -> int:
+
+    # Each Image Runs to its First Zero Word, and an Image Starting with Zero Ends the Program
+    values = [1, 2, 0, 0, 3, 0, 9, 0, 4, 5, 6, 7, 0, 0, 0, 0, 8, 8, 8, 8]
+    all_correct = list(iterate_segments(values, 4)) == [[1, 2], [3], [4, 5, 6, 7]]
+    all_correct = all_correct and (list(iterate_segments([1, 2, 0, 0, 5, 6], 4)) == [[1, 2], [5, 6]])
+    all_correct = all_correct and (list(iterate_segments([1, 2, 0, 0], 128)) == [[1, 2]])
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print("Iterate Segments Test Passed.")
+        return 0
+    else:
+        print("Iterate Segments Test Failed.")
+        return 1
+
+def test_segmented_execution() -> int:
+
+    # Running the Segments Back to Back on One Accelerator Gives the Unsplit Result
+    accel_config, _, matrix, vector, mem0, mem1, program, row_count = compile_program(150, 20)
+    accelerator = Accelerator(accel_config)
+    accelerator.set_memory(mem0, mem1)
+    for segment in partition_program(program, 10):
+        accelerator.execute_instructions(segment.INSTRUCTIONS)
+    result = extract_results_from_memory(accelerator.get_mem2(), row_count, accel_config, Mode.INT8)
+    all_correct = np.array_equal(result, (matrix @ vector).flatten())
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print("Segmented Execution Test Passed.")
+        return 0
+    else:
+        print("Segmented Execution Test Failed.")
+        return 1
+
+def test_segmented_timing() -> int:
+
+    # One Segment Costs Exactly the Unsplit Program
+    _, _, _, _, _, _, program, _ = compile_program(64, 10)
+    timing = estimate_segmented_program_timing([program])
+    all_correct = (timing.RELOAD_CYCLES == 0) and (timing.TOTAL_CYCLES == estimate_program_timing(program).TOTAL_CYCLES)
+
+    # Every Later Segment Adds its Trailing Word Plus Writing its Words into the Instruction Memory, but No Reset
+    segments = [elem.INSTRUCTIONS for elem in partition_program(program, 5)]
+    config   = TimingConfiguration(IMEM_LOAD_CYCLES=2)
+    timing   = estimate_segmented_program_timing(segments, config)
+    expected_reload = sum([(len(elem) + 1) * 2 for elem in segments[1:]])
+    expected_total  = estimate_program_timing(program, config).TOTAL_CYCLES + (len(segments) - 1) * 2 + expected_reload
+    all_correct = all_correct and (len(segments) == 4) and (timing.RELOAD_CYCLES == expected_reload) and (timing.TOTAL_CYCLES == expected_total)
+    all_correct = all_correct and all([elem.TOTAL_CYCLES == elem.EXECUTION_CYCLES + 2 for elem in timing.SEGMENT_TIMINGS])
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print("Segmented Timing Test Passed.")
+        return 0
+    else:
+        print(f"Segmented Timing Test Failed, Timing Was {timing}.")
+        return 1
+
+if __name__ == "__main__":
+    main()
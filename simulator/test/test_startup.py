@@ -0,0 +1,59 @@
+import subprocess
+import sys
+import os
+
+# Import Time Budget of Each Tool (Milliseconds, About Twice the Measured Time) and the Modules it Must Not Load
+BIN_DIRECTORY = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "bin")
+STARTUP_BUDGETS = {
+    "ivd-gv"  : (100, ["numpy", "bitstring", "src.accelerator"]),
+    "ivd-mg"  : (250, ["bitstring", "src.accelerator"]),
+    "ivd-as"  : (400, ["src.accelerator"]),
+    "ivd-cc"  : (400, ["src.accelerator"]),
+    "ivd-dis" : (400, ["src.accelerator"]),
+    "ivd-sim" : (500, []),
+    "ivd"     : (500, [])
+}
+
+def main():
+
+    # Testing Tool Startup
+    errors = 0
+    for tool, (budget, forbidden) in STARTUP_BUDGETS.items():
+        errors += test_startup(tool, budget, forbidden)
+
+    # Determining the Status of All Tests
+    if errors == 0:
+        print("All Tests Passed!")
+    else:
+        print(f"{errors} Tests Failed!")
+    sys.exit(errors)
+
+def get_imports(tool : str) -> dict[str, int]:
+
+    # Cumulative Import Time (Microseconds) of Every Module Loaded Before the Tool Parses its Arguments
+    process = subprocess.run([sys.executable, "-X", "importtime", os.path.join(BIN_DIRECTORY, tool), "--help"], capture_output=True, text=True, cwd=BIN_DIRECTORY)
+    imports = {}
+    for line in process.stderr.splitlines():
+        if line.startswith("import time:") and not line.endswith("package"):
+            _, cumulative, name = line[len("import time:"):].split("|")
+            imports[name.rstrip()] = int(cumulative)
+    return imports
+
+def test_startup(tool : str, budget : int, forbidden : list[str]) -> int:
+
+    # Summing Top Level Imports (Nested Ones are Indented) and Taking the Best of Three Runs
+    runs = [get_imports(tool) for _ in range(3)]
+    milliseconds = min([sum([value for name, value in elem.items() if not name.startswith("  ")]) for elem in runs]) / 1000
+    loaded = [name.strip() for name in runs[0]]
+    all_correct = (len(loaded) > 0) and (milliseconds <= budget) and not any([elem in loaded for elem in forbidden])
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print(f"({tool}:{milliseconds:.0f}ms) Startup Test Passed.")
+        return 0
+    else:
+        print(f"({tool}:{milliseconds:.0f}ms of {budget}ms, loaded {[elem for elem in forbidden if elem in loaded]}) Startup Test Failed.")
+        return 1
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+from src.sweep import SweepPoint, generate_sweep_points, run_sweep, run_sweep_point, load_sweep_results
+from src.instruction import Mode
+import tempfile
+import os
+import sys
+
+def main():
+
+    # Testing the Sweep Runner
+    errors = 0
+    errors += test_sweep_and_resume("sweep.jsonl")
+    errors += test_sweep_and_resume("sweep.csv")
+    errors += test_failing_point()
+
+    # Determining the Status of All Tests
+    if errors == 0:
+        print("All Tests Passed!")
+    else:
+        print(f"{errors} Tests Failed!")
+    sys.exit(errors)
+
+def test_sweep_and_resume(file_name : str) -> int:
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output_file = os.path.join(tmp_dir, file_name)
+
+        # Running a Small Grid on Two Workers
+        points = generate_sweep_points([40, 64], [9], [Mode.INT8, Mode.INT16], [4], [10], [0])
+        first_results = list(run_sweep(points, output_file, workers=2))
+
+        # A Run Killed Partway Through a Line Leaves a Partial Record, which Resuming Discards
+        with open(output_file, "a") as file:
+            file.write("{\"rows\": 64, \"cols" if file_name.endswith(".jsonl") else "64,9,")
+
+        # Resuming with a Larger Grid Only Runs the New Points
+        points = generate_sweep_points([40, 64], [9], [Mode.INT8, Mode.INT16, Mode.INT32], [4], [10], [0])
+        second_results = list(run_sweep(points, output_file, workers=2))
+        third_results  = list(run_sweep(points, output_file, workers=2))
+        recorded = load_sweep_results(output_file)
+
+        all_correct = (len(first_results) == 4) and (len(second_results) == 2) and (len(third_results) == 0)
+        all_correct = all_correct and all([elem["passed"] for elem in first_results + second_results])
+        all_correct = all_correct and (len(recorded) == 6)
+        all_correct = all_correct and all([int(elem["simulated_cycles"]) > 0 for elem in recorded])
+        with open(output_file) as file:
+            lines = file.read().splitlines()
+        all_correct = all_correct and (len(lines) == len(recorded) + int(file_name.endswith(".csv")))
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print(f"({file_name}) Sweep and Resume Test Passed.")
+        return 0
+    else:
+        print(f"({file_name}) Sweep and Resume Test Failed.")
+        return 1
+
+def test_failing_point() -> int:
+
+    # A Matrix Too Large for the MEM0 Depth Fails Without Stopping the Sweep
+    result = run_sweep_point(SweepPoint(ROWS=256, COLS=64, PRECISION=Mode.INT32, PE_COUNT=4, COUNTER_BITWIDTH=8, SEED=0))
+    if (not result["passed"]) and (result["error"] != "") and (result["simulated_cycles"] is None):
+        print("Failing Point Test Passed.")
+        return 0
+    else:
+        print(f"Failing Point Test Failed, Result Was {result}.")
+        return 1
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+from src.tiling import TILED_SCHEDULE_FILE_NAME, compile_tiled_matrix_multiplication, simulate_tiled_schedule, save_tiled_schedule
+from src.compiler import generate_accelerator_and_instruction_configuration, compile_matrix_vector_multiplication
+from src.pipeline import PIPELINE_FILE_NAMES
+from src.memory_image import load_bit_list
+from src.instruction import Mode
+import numpy as np
+import tempfile
+import json
+import sys
+import os
+
+def main():
+
+    # Testing the Tiling Compiler
+    errors = 0
+    errors += test_overrun_rejected()
+    errors += test_tiled_multiplication(50, 150, 1, Mode.INT8)
+    errors += test_tiled_multiplication(21, 40, 3, Mode.INT16)
+    errors += test_tiled_multiplication(9, 35, 20, Mode.INT32)
+    errors += test_partial_sum_overflow()
+    errors += test_single_phase()
+    errors += test_saved_schedule()
+
+    # Determining the Status of All Tests
+    if errors == 0:
+        print("All Tests Passed!")
+    else:
+        print(f"{errors} Tests Failed!")
+    sys.exit(errors)
+
+def get_small_configuration():
+    # A 64 Entry MEM0 and 16 Entry MEM1 so Small Problems Overrun Them
+    return generate_accelerator_and_instruction_configuration(
+        processing_element_count=2,
+        processing_element_accumulation_bitwidth=64,
+        controller_counter_bitwidth=6
+    )
+
+def test_overrun_rejected() -> int:
+
+    # Layouts Larger than MEM0 or MEM1 are Errors Rather than Silently Truncated Images
+    accel_config, _ = get_small_configuration()
+    all_correct = True
+    for rows, cols in [(50, 150), (8, 80)]:
+        try:
+            compile_matrix_vector_multiplication(np.ones((rows, cols), dtype=np.int64), np.ones((cols, 1), dtype=np.int64), accel_config, Mode.INT8)
+            all_correct = False
+        except ValueError:
+            pass
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print("Overrun Rejected Test Passed.")
+        return 0
+    else:
+        print("Overrun Rejected Test Failed.")
+        return 1
+
+def test_tiled_multiplication(rows, cols, vector_count, precision) -> int:
+
+    # Compiling a Problem Several Times Larger than the Buffers
+    accel_config, inst_config = get_small_configuration()
+    buffer_config = accel_config.BUFFER_CONFIG
+    np.random.seed(rows)
+    matrix   = np.random.randint(-1, 2, size=(rows, cols))
+    vectors  = np.random.randint(-1, 2, size=(cols, vector_count))
+    schedule = compile_tiled_matrix_multiplication(matrix, vectors, accel_config, precision)
+
+    # Every Phase Fits the Buffers and the Phases Cover Every Output Exactly Once per Column Tile
+    all_correct = (schedule.get_phase_count() > 1) and (schedule.get_column_tile_count() > 1)
+    coverage = np.zeros((rows, cols, vector_count), dtype=np.int64)
+    for phase in schedule.PHASES:
+        all_correct = all_correct and (len(phase.MEM0) == buffer_config.MEM0_DEPTH) and (len(phase.MEM1) == buffer_config.MEM1_DEPTH)
+        coverage[phase.ROWS[0]:phase.ROWS[1], phase.COLS[0]:phase.COLS[1], phase.VECTORS[0]:phase.VECTORS[1]] += 1
+    all_correct = all_correct and bool(np.all(coverage == 1))
+
+    # Accumulating the Simulated Partial Sums on the Host
+    result = simulate_tiled_schedule(schedule, accel_config, inst_config)
+    all_correct = all_correct and np.array_equal(result, matrix @ vectors)
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print(f"(Rows:{rows},Cols:{cols},Vectors:{vector_count},Prec:{precision}) Tiled Multiplication Test Passed.")
+        return 0
+    else:
+        print(f"(Rows:{rows},Cols:{cols},Vectors:{vector_count},Prec:{precision}) Tiled Multiplication Test Failed.")
+        return 1
+
+def test_partial_sum_overflow() -> int:
+
+    # The First Column Tile Sums to 128, which OUT Wraps in INT8, while the Full Product is 100
+    accel_config, inst_config = get_small_configuration()
+    matrix = np.ones((2, 150), dtype=np.int64)
+    vector = np.zeros((150, 1), dtype=np.int64)
+    vector[:64]    = 2
+    vector[64:92]  = -1
+    schedule = compile_tiled_matrix_multiplication(matrix, vector, accel_config, Mode.INT8)
+    result   = simulate_tiled_schedule(schedule, accel_config, inst_config)
+    all_correct = (schedule.PHASES[0].COLS == (0, 64)) and np.array_equal(result, matrix @ vector)
+
+    # Products Outside INT8 Wrap Exactly as the Untiled Program Would
+    vector[92:] = 1
+    result = simulate_tiled_schedule(compile_tiled_matrix_multiplication(matrix, vector, accel_config, Mode.INT8), accel_config, inst_config)
+    all_correct = all_correct and np.array_equal(result, ((matrix @ vector + 128) % 256) - 128)
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print("Partial Sum Overflow Test Passed.")
+        return 0
+    else:
+        print(f"Partial Sum Overflow Test Failed, Result Was {result.flatten()}.")
+        return 1
+
+def test_single_phase() -> int:
+
+    # Problems that Already Fit Compile to One Phase Identical to the Untiled Compile
+    accel_config, inst_config = get_small_configuration()
+    np.random.seed(1)
+    matrix   = np.random.randint(-5, 5, size=(12, 10))
+    vector   = np.random.randint(-5, 5, size=(10, 1))
+    schedule = compile_tiled_matrix_multiplication(matrix, vector, accel_config, Mode.INT8)
+    _, _, instructions, _ = compile_matrix_vector_multiplication(matrix, vector, accel_config, Mode.INT8)
+    all_correct = (schedule.get_phase_count() == 1) and (schedule.PHASES[0].INSTRUCTIONS == instructions)
+    all_correct = all_correct and np.array_equal(simulate_tiled_schedule(schedule, accel_config, inst_config), matrix @ vector)
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print("Single Phase Test Passed.")
+        return 0
+    else:
+        print("Single Phase Test Failed.")
+        return 1
+
+def test_saved_schedule() -> int:
+
+    # Writing Every Phase and the Host Schedule
+    accel_config, inst_config = get_small_configuration()
+    matrix   = np.ones((20, 100), dtype=np.int64)
+    schedule = compile_tiled_matrix_multiplication(matrix, np.ones(100, dtype=np.int64), accel_config, Mode.INT8)
+    with tempfile.TemporaryDirectory() as directory:
+        save_tiled_schedule(schedule, directory, accel_config, inst_config)
+        with open(os.path.join(directory, TILED_SCHEDULE_FILE_NAME)) as file:
+            description = json.load(file)
+
+        # The Schedule Describes Every Phase and Each Phase Directory Holds its Images and Assembly
+        all_correct = (description["rows"] == 20) and (description["vector_count"] == 1) and (description["precision"] == "INT8")
+        all_correct = all_correct and (len(description["phases"]) == schedule.get_phase_count())
+        for phase, elem in zip(schedule.PHASES, description["phases"]):
+            phase_dir = os.path.join(directory, elem["directory"])
+            mem0 = load_bit_list(os.path.join(phase_dir, PIPELINE_FILE_NAMES["mem0"]))
+            with open(os.path.join(phase_dir, PIPELINE_FILE_NAMES["assembly"])) as file:
+                assembly = file.read().splitlines()
+            all_correct = all_correct and (len(mem0) == len(phase.MEM0)) and (assembly == phase.INSTRUCTIONS)
+            all_correct = all_correct and (elem["cols"] == list(phase.COLS)) and (elem["result_ranges"] == [list(range_) for range_ in phase.RESULT_RANGES])
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print("Saved Schedule Test Passed.")
+        return 0
+    else:
+        print("Saved Schedule Test Failed.")
+        return 1
+
+if __name__ == "__main__":
+    main()
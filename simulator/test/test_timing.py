@@ -0,0 +1,82 @@
+from src.accelerator import Accelerator
+from src.numpy_accelerator import NumpyAccelerator
+from src.assembler import Assembler
+from src.instruction import Mode
+from src.timing import TimingConfiguration, get_instruction_cycles, estimate_program_timing
+from src.compiler import generate_accelerator_and_instruction_configuration, compile_matrix_vector_multiplication
+import numpy as np
+import sys
+
+def main():
+
+    # Testing the Timing Model
+    errors = 0
+    errors += test_program_timing()
+    errors += test_simulated_cycles()
+
+    # Determining the Status of All Tests
+    if errors == 0:
+        print("All Tests Passed!")
+    else:
+        print(f"{errors} Tests Failed!")
+    sys.exit(errors)
+
+def test_program_timing() -> int:
+
+    # Assembling a Program with Known Counts
+    _, inst_config = generate_accelerator_and_instruction_configuration()
+    assembler = Assembler(inst_config)
+    program = assembler.assemble_instructions([
+        "NOP | CLR INT8 | 1 0 0",
+        "READ INT8 0 0 | MAC INT8 | 10 1 1",
+        "NOP | OUT INT8 | 1 0 0",
+        "WRITE 0 | NOP INT8 | 1 0 0",
+    ])
+
+    # Each Instruction is One IDLE Cycle Plus One Cycle per Iteration, and the Testbench Adds
+    # Five Reset Cycles and Two Cycles for the Trailing Zero Word
+    timing = estimate_program_timing(program)
+    all_correct = (timing.INSTRUCTION_CYCLES == [2, 11, 2, 2]) and (timing.EXECUTION_CYCLES == 17) and (timing.TOTAL_CYCLES == 24)
+    all_correct = all_correct and (get_instruction_cycles(program[1]) == 11)
+    no_overhead = estimate_program_timing(program, TimingConfiguration(RESET_CYCLES=0, TRAILING_INSTRUCTIONS=0))
+    all_correct = all_correct and (no_overhead.TOTAL_CYCLES == 17)
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print("Program Timing Test Passed.")
+        return 0
+    else:
+        print(f"Program Timing Test Failed, Timing Was {timing}.")
+        return 1
+
+def test_simulated_cycles() -> int:
+
+    # Compiling a Matrix Vector Multiplication
+    accel_config, inst_config = generate_accelerator_and_instruction_configuration(
+        processing_element_count=4,
+        controller_counter_bitwidth=10
+    )
+    assembler = Assembler(inst_config)
+    np.random.seed(0)
+    matrix = np.random.randint(-5, 5, size=(40, 12))
+    vector = np.random.randint(-5, 5, size=(12, 1))
+    mem0, mem1, instructions, _ = compile_matrix_vector_multiplication(matrix, vector, accel_config, Mode.INT16)
+    timing = estimate_program_timing(assembler.assemble_instructions(instructions))
+
+    # Every Model Must Count the Same Cycles as the Static Estimate
+    all_correct = True
+    for accel in [Accelerator(accel_config), Accelerator(accel_config, fast_forward=True), NumpyAccelerator(accel_config)]:
+        accel.set_memory(mem0, mem1)
+        accel.execute_instructions(assembler.assemble_instructions(instructions))
+        all_correct = all_correct and (accel.get_cycle_count() == timing.EXECUTION_CYCLES)
+
+    # Reporting Whether the Test Passed or Failed
+    if all_correct:
+        print("Simulated Cycles Test Passed.")
+        return 0
+    else:
+        print("Simulated Cycles Test Failed.")
+        return 1
+
+if __name__ == "__main__":
+    main()